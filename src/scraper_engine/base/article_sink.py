@@ -0,0 +1,189 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from threading import Lock
+
+import json
+import logging
+import os
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def iter_jsonl(path: str | Path) -> Iterator[dict]:
+    """
+    Lazily yields one article per line. A line that does not decode (e.g. the
+    tail of a write cut short by a crash) is logged and skipped.
+    """
+    path = Path(path)
+
+    if not path.exists():
+        return
+
+    with path.open("r", encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+
+            if not line:
+                continue
+
+            try:
+                yield json.loads(line)
+
+            except json.JSONDecodeError:
+                LOGGER.warning(f"Skipping malformed line {line_number} in {path}")
+
+
+def write_jsonl(path: str | Path, articles: Iterable[dict]) -> int:
+    """
+    Writes articles to a JSONL file atomically and returns how many were written.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    count = 0
+
+    with temp_path.open("w", encoding="utf-8") as file:
+        for article in articles:
+            file.write(json.dumps(article, ensure_ascii=False) + "\n")
+            count += 1
+
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temp_path, path)
+    return count
+
+
+class JsonlArticleSink:
+    """
+    Append-only JSONL output for a scrape run.
+
+    Each finished source is written and fsynced as one unit, then recorded in
+    a checkpoint file next to the output, together with the output size after
+    it. A crash therefore loses at most the source that was running; a resumed
+    run cuts the output back to the last checkpointed size (dropping a line
+    cut short or a source whose checkpoint never made it) and skips every
+    source already in the checkpoint. The checkpoint is removed when the run
+    closes cleanly.
+    """
+    def __init__(self, path: str | Path, resume: bool = False):
+        self.path = Path(path)
+        self.checkpoint_path = self.path.with_name(f"{self.path.name}.done")
+        self.completed: set[str] = set()
+        # (checkpoint name, output size after it) of a resumed run, in order
+        self.checkpoints: list[tuple[str, int | None]] = []
+        self.count = 0
+        self._lock = Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if resume and self.checkpoint_path.exists():
+            size = 0
+
+            for line in self.checkpoint_path.read_text(encoding="utf-8").splitlines():
+                name, _, written_size = line.strip().partition("\t")
+
+                if name:
+                    self.completed.add(name)
+                    size = int(written_size) if written_size.isdigit() else None
+                    self.checkpoints.append((name, size))
+
+            self._truncate(size)
+            LOGGER.info(f"Resuming {self.path}: {len(self.completed)} sources already scraped")
+
+        else:
+            self.path.write_text("", encoding="utf-8")
+            self.checkpoint_path.write_text("", encoding="utf-8")
+
+        self._file = self.path.open("a", encoding="utf-8")
+        self._checkpoint = self.checkpoint_path.open("a", encoding="utf-8")
+
+    def _truncate(self, size: int | None) -> None:
+        """
+        Cuts the output back to `size` bytes, or to just after its last
+        newline when the checkpoint does not say (older checkpoint files).
+        """
+        if not self.path.exists():
+            return
+
+        with self.path.open("rb+") as file:
+            end = file.seek(0, os.SEEK_END)
+
+            if size is None:
+                size = end
+
+                while size > 0:
+                    step = min(4096, size)
+                    file.seek(size - step)
+                    newline = file.read(step).rfind(b"\n")
+
+                    if newline != -1:
+                        size = size - step + newline + 1
+                        break
+
+                    size -= step
+
+            if size < end:
+                file.truncate(size)
+                LOGGER.warning(f"Dropped {end - size} bytes written after the last checkpoint of {self.path}")
+
+    def completed_sources(self) -> Iterator[tuple[str | None, list[dict]]]:
+        """
+        (checkpoint name, articles) of every source a resumed run kept. Lines
+        of an older checkpoint file without sizes are yielded under None.
+        """
+        if not self.checkpoints or not self.path.exists():
+            return
+
+        with self.path.open("rb") as file:
+            for name, size in self.checkpoints:
+                if size is None:
+                    break
+
+                lines = file.read(size - file.tell()).splitlines()
+                yield name, [json.loads(line) for line in lines if line.strip()]
+
+            lines = file.read().splitlines()
+
+        if lines:
+            yield None, [json.loads(line) for line in lines if line.strip()]
+
+    def __enter__(self) -> "JsonlArticleSink":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close(completed=exc_type is None)
+
+    def is_completed(self, name: str) -> bool:
+        return name in self.completed
+
+    def write_source(self, name: str, articles: Iterable[dict]) -> int:
+        with self._lock:
+            written = 0
+
+            for article in articles:
+                self._file.write(json.dumps(article, ensure_ascii=False) + "\n")
+                written += 1
+
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+            # the checkpoint only ever lists sources whose articles are on disk
+            self._checkpoint.write(f"{name}\t{os.fstat(self._file.fileno()).st_size}\n")
+            self._checkpoint.flush()
+            os.fsync(self._checkpoint.fileno())
+
+            self.completed.add(name)
+            self.count += written
+
+        return written
+
+    def close(self, completed: bool = True) -> None:
+        self._file.close()
+        self._checkpoint.close()
+
+        if completed:
+            self.checkpoint_path.unlink(missing_ok=True)
+
+        LOGGER.info(f"Wrote {self.count} articles to {self.path}")
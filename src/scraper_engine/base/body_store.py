@@ -0,0 +1,128 @@
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+
+from scraper_engine.config.conf import BODY_STORE_ENABLED, BODY_STORE_PATH, BODY_STORE_TTL, BODY_STORE_MAX_ENTRIES
+from .html_cache import normalize_url
+
+import logging
+import sqlite3
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ArticleBodyStore:
+    """
+    SQLite store of extracted article bodies keyed by canonical URL, with
+    the tier that produced each one, its size and when it was extracted.
+
+    get_article_body consults it before any network fetch, so a retry in
+    post_source or the next --process-only batch of the same run reuses the
+    body instead of walking the extraction tiers again. Rows older than
+    `ttl` are ignored and dropped; beyond `max_entries` the oldest go first.
+    """
+    def __init__(self, path: str | Path, ttl: int, max_entries: int, enabled: bool = True):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.counts = Counter()
+        self.writes = 0
+        self._connection: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS bodies (
+                    url TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    tier TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    extracted_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS bodies_extracted_at ON bodies (extracted_at)"
+            )
+
+        return self._connection
+
+    def get(self, url: str) -> tuple[str, str] | None:
+        """
+        (text, tier) of a fresh stored body for `url`, or None.
+        """
+        if not self.enabled or not url:
+            return None
+
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT text, tier, extracted_at FROM bodies WHERE url = ?",
+                    (normalize_url(url),),
+                ).fetchone()
+
+            except sqlite3.Error as error:
+                LOGGER.warning(f"Body store read failed: {error}")
+                row = None
+
+            if row is None or time.time() - row[2] > self.ttl:
+                self.counts["misses"] += 1
+                return None
+
+            self.counts["hits"] += 1
+
+        LOGGER.info(f"[BODY STORE] Reusing body extracted by {row[1]} for {url}")
+        return row[0], row[1]
+
+    def set(self, url: str, text: str, tier: str) -> None:
+        if not self.enabled or not url or not text:
+            return
+
+        with self._lock:
+            try:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO bodies VALUES (?, ?, ?, ?, ?)",
+                    (normalize_url(url), text, tier, len(text.encode("utf-8")), time.time()),
+                )
+                self.writes += 1
+
+                # trimming scans the table, so do it every few hundred writes
+                if self.writes % 200 == 1:
+                    self._evict(connection)
+
+                connection.commit()
+
+            except sqlite3.Error as error:
+                LOGGER.warning(f"Body store write failed: {error}")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM bodies WHERE extracted_at < ?", (time.time() - self.ttl,))
+        connection.execute(
+            """
+            DELETE FROM bodies WHERE url IN (
+                SELECT url FROM bodies ORDER BY extracted_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+
+    def log_stats(self) -> None:
+        total = self.counts["hits"] + self.counts["misses"]
+
+        if total:
+            LOGGER.info(
+                f"Body store: {self.counts['hits']}/{total} hits "
+                f"({self.counts['hits'] / total:.0%}), {self.writes} bodies stored"
+            )
+
+
+BODY_STORE = ArticleBodyStore(BODY_STORE_PATH, BODY_STORE_TTL, BODY_STORE_MAX_ENTRIES, BODY_STORE_ENABLED)
@@ -0,0 +1,188 @@
+from bs4 import BeautifulSoup
+from goose3 import Goose
+from collections import Counter
+from threading import Lock, local
+
+from scraper_engine.config.conf import FAST_EXTRACTION_ENABLED, FAST_EXTRACTION_GENERIC, FAST_EXTRACTION_MIN_LENGTH
+from .html_parser import make_soup
+
+import cloudscraper
+import copy
+import logging
+import re
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Article containers of known sites, matched against the URL like the
+# custom parsers in article_fetcher
+CONTENT_SELECTORS = {
+    'bcasekuritas.co.id': 'div.prose',
+    'bloombergtechnoz': 'div.detail-in',
+    # only the subdomain get_article_kontan_news parses; Goose keeps the others
+    'investasi.kontan': 'div.tmpt-desk-kon',
+    'edgeprop': '#detail-content',
+    'antaranews': 'div.wrap__article-detail',
+    'sgx.com/research-education/market-updates/': 'article#page-container .template-article-section',
+}
+
+# Trailing sections cut from the container text, as the custom parsers do
+CONTENT_TAILS = {
+    'investasi.kontan': re.compile(r'berita\s+terkait.*', re.IGNORECASE | re.DOTALL),
+}
+
+# Tried on every other page, in order, when FAST_EXTRACTION_GENERIC is on
+GENERIC_SELECTORS = ('[itemprop="articleBody"]', 'article')
+
+NOISE_TAGS = ('script', 'style', 'noscript', 'figure', 'figcaption', 'aside', 'form')
+
+SKIPPED_PARAGRAPH_PREFIXES = ('baca juga', 'read also', 'sign up now')
+
+
+def content_selectors(url: str | None, generic: bool = FAST_EXTRACTION_GENERIC) -> list[str]:
+    selectors = [
+        selector
+        for key, selector in CONTENT_SELECTORS.items()
+        if url and key in url
+    ]
+
+    if generic:
+        selectors += GENERIC_SELECTORS
+
+    return selectors
+
+
+def extract_main_content(
+    raw_html: str | bytes | None,
+    url: str | None = None,
+    soup: BeautifulSoup | None = None,
+    generic: bool = FAST_EXTRACTION_GENERIC,
+) -> str | None:
+    """
+    Paragraphs of the first article container found on the page, or None
+    when there is no container or its text is too short to trust (Goose
+    handles those pages). Pass `soup` when the caller already parsed the page;
+    it is left as it was.
+    """
+    selectors = content_selectors(url, generic)
+
+    if not selectors:
+        return None
+
+    if soup is None:
+        if not raw_html:
+            return None
+
+        soup = make_soup(raw_html)
+
+    for selector in selectors:
+        container = soup.select_one(selector)
+
+        if not container:
+            continue
+
+        # noise is stripped from a copy: the caller may still hand the soup to Goose
+        container = copy.copy(container)
+
+        for noise in container.find_all(NOISE_TAGS):
+            noise.decompose()
+
+        paragraphs = [
+            paragraph.get_text(" ", strip=True)
+            for paragraph in container.find_all('p')
+        ]
+
+        if not any(paragraphs):
+            paragraphs = container.get_text("\n", strip=True).split("\n")
+
+        text = "\n\n".join(
+            paragraph
+            for paragraph in paragraphs
+            if paragraph and not paragraph.lower().startswith(SKIPPED_PARAGRAPH_PREFIXES)
+        )
+
+        for key, tail in CONTENT_TAILS.items():
+            if url and key in url:
+                text = tail.sub('', text).strip()
+
+        if len(text) >= FAST_EXTRACTION_MIN_LENGTH:
+            return text
+
+    return None
+
+
+class ExtractorPool:
+    """
+    Reusable Goose extractors and cloudscraper sessions, one of each per
+    thread (neither is safe to share between the race and worker threads),
+    created on first use and kept for the life of the thread.
+
+    `extract` reads the article container directly when the page has a
+    known one and only hands the page to Goose otherwise.
+    """
+    def __init__(self, fast_path: bool = True, generic: bool = FAST_EXTRACTION_GENERIC):
+        self.fast_path = fast_path
+        self.generic = generic
+        self.counts = Counter()
+        self._local = local()
+        self._lock = Lock()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def goose(self) -> Goose:
+        extractor = getattr(self._local, "goose", None)
+
+        if extractor is None:
+            extractor = Goose()
+            self._local.goose = extractor
+            self._count("goose_created")
+
+        return extractor
+
+    def http_session(self) -> cloudscraper.CloudScraper:
+        session = getattr(self._local, "session", None)
+
+        if session is None:
+            session = cloudscraper.create_scraper()
+            self._local.session = session
+            self._count("sessions_created")
+
+        return session
+
+    def extract(
+        self,
+        raw_html: str | bytes | None,
+        url: str | None = None,
+        soup: BeautifulSoup | None = None,
+    ) -> str | None:
+        if not raw_html and soup is None:
+            return None
+
+        if self.fast_path:
+            try:
+                if extracted_text := extract_main_content(raw_html, url, soup, self.generic):
+                    self._count("fast_path")
+                    return extracted_text
+
+            except Exception as error:
+                LOGGER.warning(f"Main-content extraction failed for {url}: {error}")
+
+        if not raw_html:
+            raw_html = str(soup)
+
+        self._count("goose")
+        return self.goose().extract(raw_html=raw_html).cleaned_text or None
+
+    def log_stats(self) -> None:
+        if self.counts:
+            LOGGER.info(
+                f"Extractors: {self.counts['fast_path']} bodies from the fast path, "
+                f"{self.counts['goose']} from Goose "
+                f"({self.counts['goose_created']} Goose instances, "
+                f"{self.counts['sessions_created']} cloudscraper sessions)"
+            )
+
+
+EXTRACTOR_POOL = ExtractorPool(FAST_EXTRACTION_ENABLED)
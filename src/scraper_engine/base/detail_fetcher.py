@@ -0,0 +1,60 @@
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from typing import TypeVar
+
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def fetch_in_order(
+    items: Iterable[T],
+    fetch: Callable[[T], R],
+    max_workers: int,
+) -> Iterator[tuple[T, R]]:
+    """
+    Runs fetch() over the items on a small thread pool and yields
+    (item, result) pairs in input order.
+
+    Only max_workers fetches are ever in flight, so a consumer that stops
+    early (e.g. on the first article older than the target date) wastes at
+    most max_workers - 1 fetches; closing the generator cancels the rest.
+    The request rate itself is still capped by the host's token bucket.
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield item, fetch(item)
+        return
+
+    pending = deque()
+    remaining = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="detail")
+
+    def submit_next() -> None:
+        for item in remaining:
+            pending.append((item, executor.submit(fetch, item)))
+            return
+
+    try:
+        for _ in range(max_workers):
+            submit_next()
+
+        while pending:
+            item, future = pending.popleft()
+            result = future.result()
+
+            # keep the window full while the caller works on this result
+            submit_next()
+
+            yield item, result
+
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=True)
@@ -0,0 +1,219 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+
+from scraper_engine.config.conf import HTML_CACHE_DIR, HTML_CACHE_MAX_BYTES
+
+import hashlib
+import logging
+import os
+import time
+import zlib
+
+
+LOGGER = logging.getLogger(__name__)
+
+TRACKING_PREFIXES = ("utm_",)
+TRACKING_PARAMS = {"fbclid", "gclid", "ref"}
+
+# markers of Cloudflare block and challenge pages. Plain "cloudflare" is not
+# one: ordinary pages load scripts from cdnjs.cloudflare.com
+BLOCK_PAGE_MARKERS = (
+    b"has banned the autonomous system",
+    b"error 1005",
+    b"please wait while your request is being verified",
+    b"<title>just a moment...</title>",
+    b"<title>attention required! | cloudflare</title>",
+)
+
+
+def is_block_page(content: bytes | str) -> bool:
+    if isinstance(content, str):
+        content = content.encode("utf-8", errors="replace")
+
+    lowered = content.lower()
+    return any(marker in lowered for marker in BLOCK_PAGE_MARKERS)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form used as the cache key: lower-case scheme and host, no
+    fragment, no tracking parameters, sorted query and no trailing slash.
+    """
+    parts = urlsplit(url.strip())
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PREFIXES)
+        and key.lower() not in TRACKING_PARAMS
+    )
+
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        path,
+        urlencode(query),
+        "",
+    ))
+
+
+class HtmlCache:
+    """
+    On-disk, zlib-compressed page cache keyed by the hash of the normalized URL.
+
+    Freshness is decided by the reader: every get() passes the TTL that suits
+    its caller, so a listing page can be treated as stale after minutes while
+    the same store serves article pages for the processing stage hours later.
+    The store is bounded by size and evicts least-recently-used entries.
+    """
+    def __init__(self, directory: str | Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = Counter()
+        self.misses = Counter()
+        self._entries: dict[str, tuple[int, float]] | None = None
+        self._total_bytes = 0
+        self._lock = Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.html.z"
+
+    def _load_index(self) -> None:
+        if self._entries is not None:
+            return
+
+        self._entries = {}
+        self._total_bytes = 0
+
+        if not self.directory.exists():
+            return
+
+        for path in self.directory.glob("*/*.html.z"):
+            stat = path.stat()
+            key = path.name.split(".", 1)[0]
+            self._entries[key] = (stat.st_size, stat.st_atime)
+            self._total_bytes += stat.st_size
+
+    def get(self, url: str, ttl: int | None, namespace: str = "default") -> bytes | None:
+        if not ttl or not url:
+            return None
+
+        key = hashlib.sha256(normalize_url(url).encode()).hexdigest()
+        path = self._path(key)
+
+        # read outside the lock so concurrent readers do not queue behind
+        # each other; writers replace files atomically
+        try:
+            stat = path.stat()
+
+            if time.time() - stat.st_mtime > ttl:
+                content = None
+
+            else:
+                content = zlib.decompress(path.read_bytes())
+
+        except (OSError, zlib.error):
+            content = None
+
+        now = time.time()
+
+        if content is not None:
+            # keep mtime as the fetch time, bump atime for LRU ordering
+            try:
+                os.utime(path, (now, stat.st_mtime))
+
+            except OSError:
+                pass
+
+        with self._lock:
+            if content is None:
+                self.misses[namespace] += 1
+                return None
+
+            self._load_index()
+
+            if key in self._entries:
+                self._entries[key] = (stat.st_size, now)
+
+            self.hits[namespace] += 1
+
+        LOGGER.debug(f"HTML cache hit for {url}")
+
+        return content
+
+    def get_text(self, url: str, ttl: int | None, namespace: str = "default") -> str | None:
+        content = self.get(url, ttl, namespace)
+        return content.decode("utf-8", errors="replace") if content is not None else None
+
+    def set(self, url: str, content: bytes | str) -> None:
+        if not url or not content:
+            return
+
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        if is_block_page(content):
+            LOGGER.info(f"Not caching block page for {url}")
+            return
+
+        key = hashlib.sha256(normalize_url(url).encode()).hexdigest()
+        path = self._path(key)
+        payload = zlib.compress(content, 6)
+
+        with self._lock:
+            self._load_index()
+
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(f".tmp{os.getpid()}")
+                temp_path.write_bytes(payload)
+                os.replace(temp_path, path)
+
+            except OSError as error:
+                LOGGER.warning(f"Failed to write HTML cache entry for {url}: {error}")
+                return
+
+            previous_size, _ = self._entries.get(key, (0, 0))
+            self._entries[key] = (len(payload), time.time())
+            self._total_bytes += len(payload) - previous_size
+
+            self._evict()
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        for key, (size, _) in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+
+            try:
+                self._path(key).unlink()
+
+            except OSError:
+                pass
+
+            del self._entries[key]
+            self._total_bytes -= size
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            namespace: {
+                "hits": self.hits[namespace],
+                "misses": self.misses[namespace],
+            }
+            for namespace in sorted({*self.hits, *self.misses})
+        }
+
+    def log_stats(self) -> None:
+        for namespace, counts in self.stats().items():
+            LOGGER.info(
+                f"HTML cache [{namespace}]: {counts['hits']} hits, {counts['misses']} misses"
+            )
+
+
+HTML_CACHE = HtmlCache(HTML_CACHE_DIR, HTML_CACHE_MAX_BYTES)
@@ -0,0 +1,32 @@
+from bs4 import BeautifulSoup, FeatureNotFound
+from functools import cache
+
+from scraper_engine.config.conf import HTML_PARSER
+
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+FALLBACK_PARSER = "html.parser"
+
+
+@cache
+def resolve_backend(backend: str | None) -> str:
+    """
+    Returns the BeautifulSoup tree builder to use for `backend`, falling back
+    to the pure-Python parser when the requested one is not installed.
+    """
+    backend = backend or HTML_PARSER
+
+    try:
+        BeautifulSoup("", backend)
+        return backend
+
+    except FeatureNotFound:
+        LOGGER.warning(f"HTML parser '{backend}' is not available, using {FALLBACK_PARSER}")
+        return FALLBACK_PARSER
+
+
+def make_soup(markup: str | bytes, backend: str | None = None) -> BeautifulSoup:
+    return BeautifulSoup(markup, resolve_backend(backend))
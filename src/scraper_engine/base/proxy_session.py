@@ -0,0 +1,165 @@
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import InsecureRequestWarning
+from http.cookiejar import DefaultCookiePolicy
+from collections import Counter, defaultdict
+from threading import Lock
+
+from scraper_engine.config.conf import (
+    PROXY_POOL_SIZE, PROXY_MAX_RETRIES, PROXY_BACKOFF_FACTOR,
+    PROXY_RETRY_STATUSES, PROXY_TIMEOUT,
+)
+
+import requests
+import logging
+import time
+import urllib3
+
+
+LOGGER = logging.getLogger(__name__)
+
+# the unlocker terminates TLS itself, so its certificate never matches the target
+urllib3.disable_warnings(InsecureRequestWarning)
+
+
+class ProxySessionPool:
+    """
+    One keep-alive requests.Session per proxy endpoint, shared by every source.
+
+    Connections to the proxy are reused across calls instead of paying a new
+    TCP and TLS handshake per page. urllib3's connection pool is thread-safe
+    and cookies are never stored, so concurrent detail fetches can share a
+    session. Transient failures (connection errors, 429 and 5xx) are retried
+    with exponential backoff inside the adapter.
+    """
+    def __init__(self, pool_size: int, max_retries: int, backoff_factor: float):
+        self.pool_size = max(1, pool_size)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.sessions: dict[str, requests.Session] = {}
+        self.metrics: dict[str, Counter] = defaultdict(Counter)
+        self._lock = Lock()
+
+    def _build_session(self, proxy_url: str) -> requests.Session:
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=PROXY_RETRY_STATUSES,
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+            pool_block=True,
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.proxies = {"http": proxy_url, "https": proxy_url}
+        session.verify = False
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        return session
+
+    def get_session(self, proxy_url: str) -> requests.Session:
+        with self._lock:
+            session = self.sessions.get(proxy_url)
+
+            if session is None:
+                session = self._build_session(proxy_url)
+                self.sessions[proxy_url] = session
+
+            return session
+
+    def get(
+        self,
+        url: str,
+        proxy_url: str,
+        headers: dict | None = None,
+        source: str = "default",
+        timeout: tuple[float, float] = PROXY_TIMEOUT,
+    ) -> requests.Response:
+        """
+        GET through the proxy and record the outcome under `source`. Network
+        errors are re-raised after the adapter has exhausted its retries.
+        """
+        session = self.get_session(proxy_url)
+        started_at = time.perf_counter()
+
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+
+        except requests.exceptions.RequestException:
+            self._record(source, started_at, failed=True)
+            raise
+
+        retries = response.raw.retries
+        self._record(
+            source,
+            started_at,
+            failed=response.status_code != 200,
+            retries=len(retries.history) if retries else 0,
+            size=len(response.content),
+        )
+
+        return response
+
+    def _record(
+        self,
+        source: str,
+        started_at: float,
+        failed: bool,
+        retries: int = 0,
+        size: int = 0,
+    ) -> None:
+        elapsed_ms = int((time.perf_counter() - started_at) * 1000)
+
+        with self._lock:
+            counts = self.metrics[source]
+            counts["requests"] += 1
+            counts["failures"] += failed
+            counts["retries"] += retries
+            counts["bytes"] += size
+            counts["elapsed_ms"] += elapsed_ms
+
+    def connections_opened(self) -> int:
+        """
+        Connections opened to the proxy so far, across every endpoint.
+        """
+        opened = 0
+
+        with self._lock:
+            for session in self.sessions.values():
+                adapter = session.get_adapter("https://")
+
+                for manager in adapter.proxy_manager.values():
+                    for key in manager.pools.keys():
+                        opened += manager.pools[key].num_connections
+
+        return opened
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                source: dict(counts)
+                for source, counts in sorted(self.metrics.items())
+            }
+
+    def log_stats(self) -> None:
+        for source, counts in self.stats().items():
+            average_ms = counts["elapsed_ms"] // max(1, counts["requests"])
+            LOGGER.info(
+                f"Proxy [{source}]: {counts['requests']} requests, "
+                f"{counts.get('failures', 0)} failed, {counts.get('retries', 0)} retries, "
+                f"{counts.get('bytes', 0) // 1024} KiB, avg {average_ms} ms"
+            )
+
+        if self.sessions:
+            LOGGER.info(f"Proxy connections opened: {self.connections_opened()}")
+
+
+PROXY_SESSIONS = ProxySessionPool(PROXY_POOL_SIZE, PROXY_MAX_RETRIES, PROXY_BACKOFF_FACTOR)
@@ -0,0 +1,86 @@
+from urllib.parse import urlparse
+from threading import Lock
+
+import time
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_host(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+
+    if host.startswith("www."):
+        host = host[4:]
+
+    return host
+
+
+class TokenBucket:
+    """
+    Classic token bucket. Callers reserve a token under the lock and sleep
+    outside it, so concurrent workers on the same host queue up fairly
+    instead of spinning.
+    """
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+            self.tokens -= 1
+            wait_time = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        return wait_time
+
+
+class HostRateLimiter:
+    """
+    One token bucket per host. The first source to hit a host creates its
+    bucket; if another source declares a stricter budget for the same host,
+    the stricter one wins. A rate of None means the host is not throttled.
+    """
+    def __init__(self):
+        self.buckets: dict[str, TokenBucket] = {}
+        self._lock = Lock()
+
+    def get_bucket(self, host: str, rate: float, burst: int) -> TokenBucket:
+        with self._lock:
+            bucket = self.buckets.get(host)
+
+            if bucket is None or rate < bucket.rate:
+                bucket = TokenBucket(rate, burst)
+                self.buckets[host] = bucket
+
+            return bucket
+
+    def wait(self, url: str, rate: float | None, burst: int = 1) -> float:
+        if not rate or rate <= 0:
+            return 0.0
+
+        host = get_host(url)
+
+        if not host:
+            return 0.0
+
+        waited = self.get_bucket(host, rate, burst).acquire()
+
+        if waited:
+            LOGGER.debug(f"Throttled {host} for {waited:.2f}s")
+
+        return waited
+
+
+RATE_LIMITER = HostRateLimiter()
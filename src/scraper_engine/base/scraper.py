@@ -6,9 +6,22 @@ from bs4 import BeautifulSoup
 from selenium.common.exceptions import TimeoutException
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from threading import Condition, Lock
+from collections.abc import Iterator
 from scrapling import Fetcher
 
-from scraper_engine.config.conf import PROXY, USER_AGENT, HEADERS_SCRAPER, CRAWLER_USER_AGENT
+from scraper_engine.config.conf import (
+    PROXY, USER_AGENT, HEADERS_SCRAPER, CRAWLER_USER_AGENT,
+    SELENIUM_POOL_SIZE, SELENIUM_MAX_PAGE_LOADS, SELENIUM_LEASE_TIMEOUT,
+    HTML_CACHE_SCRAPER_TTL, SELENIUM_BLOCK_RESOURCES, SELENIUM_BLOCKED_URLS,
+    SELENIUM_SELECTOR_TIMEOUT, SELENIUM_IDLE_TIMEOUT, SELENIUM_IDLE_WINDOW,
+)
+from .rate_limiter import RATE_LIMITER
+from .html_cache import HTML_CACHE, normalize_url
+from .proxy_session import PROXY_SESSIONS
+from .url_index import KnownUrlIndex
+from .html_parser import make_soup
+from .detail_fetcher import fetch_in_order
 
 import json
 import csv
@@ -27,6 +40,11 @@ LOGGER = logging.getLogger(__name__)
 
 UC_CACHE_PATH = os.path.expanduser("~/.local/share/undetected_chromedriver/undetected_chromedriver")
 
+# undetected_chromedriver patches the single binary at UC_CACHE_PATH in place
+# and clear_stale_chromedriver_cache may delete it, so the pool's browsers are
+# built one at a time
+DRIVER_CREATION_LOCK = Lock()
+
 
 def get_chrome_info() -> tuple:
     operating_system = platform.system()
@@ -129,29 +147,147 @@ def clear_stale_chromedriver_cache(chrome_major_version: int) -> None:
 
 
 class Scraper:
+    # last page fetched; detail workers share the instance, so use the return value
     soup: BeautifulSoup
     articles: list
     proxy: str | None
 
+    # Sources that drive a pooled Chrome session; ScraperCollection limits how
+    # many of them run at once to the size of the driver pool.
+    uses_shared_driver: bool = False
+
+    # Politeness budget per host, in requests per second. Sources whose hosts
+    # tolerate it can raise this or set it to None to run at full speed.
+    request_rate: float | None = 2.0
+    request_burst: int = 1
+
+    # How long (seconds) a cached page is fresh enough for this source; None
+    # bypasses the HTML cache for reads.
+    cache_ttl: int | None = HTML_CACHE_SCRAPER_TTL
+
+    # Known-URL index set by ScraperCollection on scheduled runs; None turns
+    # off the incremental early stop (e.g. when backfilling a given date).
+    known_urls: KnownUrlIndex | None = None
+    _page_seen: int = 0
+    _page_known: int = 0
+
+    # Tree builder for this source's pages; None uses the HTML_PARSER default
+    # (html.parser). Set "lxml" only for a source that scripts/parse_benchmark.py
+    # reports as identical under it.
+    parser_backend: str | None = None
+
+    # Detail pages a list-then-detail source fetches at once through
+    # fetch_details(); the host's token bucket still caps the request rate.
+    detail_workers: int = 4
+
     def __init__(self):
         self.articles = []
+        # normalized URLs of the pages this run loaded, see attach_page_refs()
+        self.fetched_pages: set[str] = set()
         self.session = requests.Session()
         retry = Retry(total=3, backoff_factor=2)
         adapter = HTTPAdapter(max_retries=retry)
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
 
+    def throttle(self, url: str) -> None:
+        RATE_LIMITER.wait(url, self.request_rate, self.request_burst)
+
+    def read_cache(self, url: str) -> bytes | None:
+        content = HTML_CACHE.get(url, self.cache_ttl, self.__class__.__name__)
+
+        if content is not None:
+            self.fetched_pages.add(normalize_url(url))
+
+        return content
+
+    def remember_page(self, url: str, content: bytes | str) -> None:
+        """
+        Stores a fetched page in the HTML cache and notes that this run has
+        it. Sources that fetch a page without the fetch_news* helpers should
+        call this too, so the page is handed over to processing.
+        """
+        HTML_CACHE.set(url, content)
+        self.fetched_pages.add(normalize_url(url))
+
+    def attach_page_refs(self, articles: list[dict]) -> None:
+        """
+        Hand-over contract with the processing stage: an article either
+        carries its extracted body in "article", or "html_ref" names the
+        cached detail page this run already loaded (e.g. to read its date),
+        so processing extracts the body from the cache instead of fetching
+        the page again.
+        """
+        for article in articles:
+            url = article.get("source")
+
+            if url and not article.get("article") and normalize_url(url) in self.fetched_pages:
+                article["html_ref"] = url
+
+    def fetch_details(self, items: list, fetch) -> Iterator[tuple]:
+        """
+        Fetches the detail page of each listing item concurrently and yields
+        (item, result) in listing order, so `break` on an older article keeps
+        its early-stop meaning.
+        """
+        return fetch_in_order(items, fetch, self.detail_workers)
+
+    def make_soup(self, markup: str | bytes) -> BeautifulSoup:
+        return make_soup(markup, self.parser_backend)
+
+    def is_known(self, url: str) -> bool:
+        """
+        True if a previous run already handed this article over. Also counts
+        the URL towards the current listing page for reached_known_urls().
+        """
+        if self.known_urls is None or not url:
+            return False
+
+        known = self.known_urls.is_known(self.__class__.__name__, url)
+
+        self._page_seen += 1
+        self._page_known += known
+
+        return known
+
+    def reached_known_urls(self) -> bool:
+        """
+        True if every article on the page just parsed was already known.
+        Resets the page counters, so call it once per listing page.
+        """
+        seen, known = self._page_seen, self._page_known
+        self._page_seen = self._page_known = 0
+
+        return seen > 0 and seen == known
+
     def fetch_news(self, url):
+        if cached_html := self.read_cache(url):
+            soup = self.make_soup(cached_html)
+            self.soup = soup
+            return soup
+
+        self.throttle(url)
+
         try:
             response = self.session.get(url, headers=HEADERS_SCRAPER, timeout=10)
-            self.soup = BeautifulSoup(response.content, 'html.parser')
-            return self.soup
+
+            if response.status_code == 200:
+                self.remember_page(url, response.content)
+
+            soup = self.make_soup(response.content)
+            self.soup = soup
+            return soup
 
         except Exception as error:
             LOGGER.error(f"Error fetching the URL: {error}")
             return BeautifulSoup()
 
     def fetch_news_with_scrapling(self, url: str):
+        if cached_html := self.read_cache(url):
+            return self.make_soup(cached_html)
+
+        self.throttle(url)
+
         response = Fetcher.get(
             url,
             stealthy_headers=True,
@@ -162,16 +298,15 @@ class Scraper:
             LOGGER.warning("Non-200 status %d for %s", response.status, url)
             return None
 
-        return BeautifulSoup(bytes(response.body), "html.parser")
+        body = bytes(response.body)
+        self.remember_page(url, body)
+
+        return self.make_soup(body)
     
     def fetch_news_with_proxy(self, target_url: str):
-        proxy_url = PROXY 
+        if cached_html := self.read_cache(target_url):
+            return cached_html.decode("utf-8", errors="replace")
 
-        proxy_configuration = {
-            "http": proxy_url,
-            "https": proxy_url
-        }
-        
         if 'edgeprop' in target_url:
             headers = {
                 "User-Agent": CRAWLER_USER_AGENT
@@ -182,17 +317,19 @@ class Scraper:
                 "User-Agent": USER_AGENT
             }
 
+        self.throttle(target_url)
+
         try:
             LOGGER.info(f"Routing {target_url} through proxy")
-            response = requests.get(
+            response = PROXY_SESSIONS.get(
                 target_url, 
-                proxies=proxy_configuration, 
+                PROXY, 
                 headers=headers, 
-                verify=False, 
-                timeout=60 
+                source=self.__class__.__name__,
             )
             
             if response.status_code == 200:
+                self.remember_page(target_url, response.text)
                 return response.text
                 
             LOGGER.info(f"[FAIL] Web Unlocker returned status code: {response.status_code}")
@@ -203,13 +340,16 @@ class Scraper:
             return ""
 
     def fetch_news_with_post(self, url: str, payload: dict):
+        self.throttle(url)
+
         try:
             response = requests.post(url, data=payload)
             data = response.json()
 
             html_content = data.get('html_items')
-            self.soup = BeautifulSoup(html_content, 'html.parser')
-            return self.soup
+            soup = self.make_soup(html_content)
+            self.soup = soup
+            return soup
         
         except Exception as error:
             LOGGER.error(f'Error fetching article IMA: {error}')
@@ -243,26 +383,259 @@ class Scraper:
                 csv_writer.writerow(item.values())
 
 
+def create_driver(load_strategy: str = "normal", page_timeout: int = 120):
+    with DRIVER_CREATION_LOCK:
+        return _create_driver(load_strategy, page_timeout)
+
+
+def _create_driver(load_strategy: str, page_timeout: int):
+    LOGGER.info("Initializing Undetected Chrome Driver")
+
+    chrome_version, chrome_path = get_chrome_info()
+
+    if chrome_version is None:
+        LOGGER.error("Chrome version detection failed entirely. Cannot initialize driver safely.")
+        return None
+
+    clear_stale_chromedriver_cache(chrome_version)
+
+    options = uc.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-setuid-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(
+        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.page_load_strategy = load_strategy
+
+    try:
+        new_driver = uc.Chrome(
+            options=options,
+            version_main=chrome_version,
+            browser_executable_path=chrome_path,
+        )
+
+        new_driver.set_page_load_timeout(page_timeout)
+        LOGGER.info(f"Driver initialized successfully with Chrome v{chrome_version}")
+
+        return new_driver
+    
+    except Exception as error:
+        LOGGER.error(f"Failed to initialize driver: {error}")
+        return None
+
+
+def set_resource_blocking(driver, enabled: bool) -> bool:
+    """
+    Block images, media, fonts and ad/analytics hosts for every request the
+    session makes. Returns False if the DevTools command is not available.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {"urls": SELENIUM_BLOCKED_URLS if enabled else []},
+        )
+        return True
+
+    except Exception as error:
+        LOGGER.warning(f"Failed to set resource blocking: {error}")
+        return False
+
+
+def wait_for_page_idle(
+    driver,
+    max_wait: float = SELENIUM_IDLE_TIMEOUT,
+    idle_window: float = SELENIUM_IDLE_WINDOW,
+) -> float:
+    """
+    Wait until the document is complete and no new network resource has
+    started for `idle_window` seconds, bounded by `max_wait`. Returns the
+    time spent waiting.
+    """
+    started_at = time.monotonic()
+    deadline = started_at + max_wait
+    resource_count = -1
+    stable_since = None
+
+    while time.monotonic() < deadline:
+        try:
+            ready_state, count = driver.execute_script(
+                "return [document.readyState, "
+                "performance.getEntriesByType('resource').length];"
+            )
+
+        except Exception:
+            break
+
+        now = time.monotonic()
+
+        if ready_state != "complete":
+            stable_since = None
+
+        elif count != resource_count or stable_since is None:
+            resource_count = count
+            stable_since = now
+
+        elif now - stable_since >= idle_window:
+            break
+
+        time.sleep(0.1)
+
+    return time.monotonic() - started_at
+
+
+def quit_driver(driver) -> None:
+    try: 
+        driver.quit()
+
+    except: 
+        pass
+
+
+class PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.page_loads = 0
+        self.blocking: bool | None = None
+
+
+class DriverPool:
+    """
+    Bounded pool of headless Chrome sessions with lease/return semantics.
+
+    Sessions are created lazily up to `size`, health-checked when leased and
+    recycled once they have served `max_page_loads` navigations, so a long run
+    does not accumulate Chrome memory in a single session.
+    """
+    def __init__(self, size: int, max_page_loads: int):
+        self.size = max(1, size)
+        self.max_page_loads = max_page_loads
+        self.idle: list[PooledDriver] = []
+        self.leased: set[PooledDriver] = set()
+        self.created = 0
+        self._condition = Condition()
+
+    def lease(self, timeout: float | None = SELENIUM_LEASE_TIMEOUT) -> PooledDriver | None:
+        with self._condition:
+            while not self.idle and self.created >= self.size:
+                if not self._condition.wait(timeout):
+                    LOGGER.error("Timed out waiting for a pooled WebDriver")
+                    return None
+
+            if self.idle:
+                pooled = self.idle.pop()
+                self.leased.add(pooled)
+
+            else:
+                # reserve the slot now, build the browser outside the lock
+                pooled = None
+                self.created += 1
+
+        if pooled is not None and not SeleniumScraper._is_driver_alive(pooled.driver):
+            LOGGER.warning("Pooled WebDriver session is dead. Rebuilding before use.")
+
+            if not self.recycle(pooled):
+                self.discard(pooled)
+                return None
+
+        if pooled is None:
+            driver = create_driver()
+
+            if driver is None:
+                with self._condition:
+                    self.created -= 1
+                    self._condition.notify()
+
+                return None
+
+            pooled = PooledDriver(driver)
+
+            with self._condition:
+                self.leased.add(pooled)
+
+        return pooled
+
+    def recycle(self, pooled: PooledDriver) -> bool:
+        """
+        Replace the browser behind a lease in place, keeping the slot.
+        """
+        quit_driver(pooled.driver)
+
+        pooled.driver = create_driver()
+        pooled.page_loads = 0
+        pooled.blocking = None
+
+        return pooled.driver is not None
+
+    def discard(self, pooled: PooledDriver) -> None:
+        if pooled.driver is not None:
+            quit_driver(pooled.driver)
+
+        with self._condition:
+            # leases orphaned by close_all() no longer hold a slot
+            if pooled in self.leased:
+                self.leased.remove(pooled)
+                self.created -= 1
+                self._condition.notify()
+
+    def release(self, pooled: PooledDriver, discard: bool = False) -> None:
+        if discard or pooled.driver is None or pooled.page_loads >= self.max_page_loads:
+            self.discard(pooled)
+            return
+
+        with self._condition:
+            if pooled not in self.leased:
+                quit_driver(pooled.driver)
+                return
+
+            self.leased.remove(pooled)
+            self.idle.append(pooled)
+            self._condition.notify()
+
+    def close_all(self) -> None:
+        with self._condition:
+            to_close = [*self.idle, *self.leased]
+            self.idle = []
+            self.leased = set()
+            self.created = 0
+            self._condition.notify_all()
+
+        if to_close:
+            LOGGER.info(f"Closing {len(to_close)} pooled WebDriver session(s)...")
+
+        for pooled in to_close:
+            if pooled.driver is not None:
+                quit_driver(pooled.driver)
+
+            # a scraper still holding this lease will rebuild on next use
+            pooled.driver = None
+
+
 class SeleniumScraper(Scraper):
-    _driver_instance = None 
+    _pool = DriverPool(SELENIUM_POOL_SIZE, SELENIUM_MAX_PAGE_LOADS)
+    uses_shared_driver = True
+    # sources that need images or third-party scripts to render can opt out
+    block_resources: bool = SELENIUM_BLOCK_RESOURCES
 
     def __init__(self):
         super().__init__()
+        self._lease: PooledDriver | None = None
     
     @property
     def driver(self):
-        if SeleniumScraper._driver_instance is None:
-            self.setup_driver()
+        return self.ensure_driver()
 
-        return SeleniumScraper._driver_instance
-
-    @classmethod
-    def _is_driver_alive(cls) -> bool:
+    @staticmethod
+    def _is_driver_alive(driver) -> bool:
         """
-        Cheaply probe the shared session; a dead session raises here.
+        Cheaply probe a session; a dead session raises here.
         """
-        driver = cls._driver_instance
-
         if driver is None:
             return False
 
@@ -276,128 +649,118 @@ class SeleniumScraper(Scraper):
 
     def ensure_driver(self):
         """
-        Return a healthy shared driver, rebuilding it if the previous one died.
+        Return this scraper's leased driver, leasing one from the pool on first
+        use and rebuilding it if the session died since the last call.
 
-        This prevents one source's crash (which tears down the shared browser)
-        from poisoning every Selenium source that runs after it.
+        The lease is sticky until release_driver(), so a source that scrolls
+        or clicks through one page keeps the same browser between calls.
         """
-        if not SeleniumScraper._is_driver_alive():
-            if SeleniumScraper._driver_instance is not None:
-                LOGGER.warning("Shared WebDriver session is dead. Rebuilding before use.")
-                self.close_shared_driver()
-
-            self.setup_driver()
+        if self._lease is None:
+            self._lease = SeleniumScraper._pool.lease()
 
-        return SeleniumScraper._driver_instance
-
-    def setup_driver(self, load_strategy: str = "normal", page_timeout: int = 120):
-        LOGGER.info("Initializing Undetected Chrome Driver")
-
-        chrome_version, chrome_path = get_chrome_info()
-
-        if chrome_version is None:
-            LOGGER.error("Chrome version detection failed entirely. Cannot initialize driver safely.")
-            SeleniumScraper._driver_instance = None
-            return
+            if self._lease is None:
+                return None
 
-        clear_stale_chromedriver_cache(chrome_version)
-
-        options = uc.ChromeOptions()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-setuid-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.page_load_strategy = load_strategy
+        elif not SeleniumScraper._is_driver_alive(self._lease.driver):
+            LOGGER.warning("Leased WebDriver session is dead. Rebuilding before use.")
 
-        try:
-            new_driver = uc.Chrome(
-                options=options,
-                version_main=chrome_version,
-                browser_executable_path=chrome_path,
-            )
+            if not SeleniumScraper._pool.recycle(self._lease):
+                self.release_driver(discard=True)
+                return None
 
-            new_driver.set_page_load_timeout(page_timeout)
-            SeleniumScraper._driver_instance = new_driver
+        return self._lease.driver
 
-            LOGGER.info(f"Driver initialized successfully with Chrome v{chrome_version}")
-        
-        except Exception as error:
-            LOGGER.error(f"Failed to initialize driver: {error}")
-            SeleniumScraper._driver_instance = None
+    def release_driver(self, discard: bool = False) -> None:
+        if self._lease is not None:
+            SeleniumScraper._pool.release(self._lease, discard)
+            self._lease = None
 
     def fetch_news_with_selenium(
         self, 
         url: str, 
         wait_selector: str = None, 
-        time_sleep: int = 5, 
-        retry: bool = True
+        max_wait: float | None = None, 
+        retry: bool = True,
+        use_cache: bool = True,
     ):
+        # callers that keep working on the live page (scrolling, clicking)
+        # need the browser to actually be there, so they skip the cache
+        if use_cache and (cached_html := self.read_cache(url)):
+            soup = self.make_soup(cached_html)
+            self.soup = soup
+            return soup
+
         driver = self.ensure_driver()
 
         if not driver:
             return BeautifulSoup()
 
+        if self._lease.page_loads >= SeleniumScraper._pool.max_page_loads:
+            LOGGER.info("Recycling WebDriver after %d page loads", self._lease.page_loads)
+
+            if not SeleniumScraper._pool.recycle(self._lease):
+                self.release_driver(discard=True)
+                return BeautifulSoup()
+
+            driver = self._lease.driver
+
+        if self._lease.blocking != self.block_resources:
+            if set_resource_blocking(driver, self.block_resources):
+                self._lease.blocking = self.block_resources
+
+        self.throttle(url)
+
         try:
             LOGGER.info(f"Navigating to {url}")
+            self._lease.page_loads += 1
             driver.get(url)
 
             if wait_selector:
-                WebDriverWait(driver, 30).until(
+                WebDriverWait(driver, max_wait or SELENIUM_SELECTOR_TIMEOUT).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
                 )
 
             else:
-                time.sleep(time_sleep)
+                waited = wait_for_page_idle(driver, max_wait or SELENIUM_IDLE_TIMEOUT)
+                LOGGER.debug(f"Page settled after {waited:.1f}s")
 
             html_content = driver.page_source
-            self.soup = BeautifulSoup(html_content, 'html.parser')
+            self.remember_page(url, html_content)
+            soup = self.make_soup(html_content)
+            self.soup = soup
 
-            return self.soup
+            return soup
 
         except TimeoutException:
             LOGGER.warning(f"Page load timed out for {url}. Attempting to salvage available DOM.")
             try:
                 html_content = driver.page_source
-                self.soup = BeautifulSoup(html_content, 'html.parser')
-                return self.soup
+                soup = self.make_soup(html_content)
+                self.soup = soup
+                return soup
 
             except Exception as dom_error:
                 LOGGER.error(f"Failed to extract DOM after timeout: {dom_error}")
-                self.close_shared_driver()
+                self.release_driver(discard=True)
                 return None
 
         except Exception as error:
             LOGGER.error(f'Failed fetch news with selenium: {error}')
-            # The session is likely dead, tear it down so the next access rebuilds it.
-            self.close_shared_driver()
+            # The session is likely dead, drop it so the next access leases a fresh one.
+            self.release_driver(discard=True)
 
             if retry:
                 LOGGER.info(f"Rebuilding driver and retrying once for {url}")
                 return self.fetch_news_with_selenium(
                     url, 
                     wait_selector, 
-                    time_sleep, 
-                    retry=False
+                    max_wait, 
+                    retry=False,
+                    use_cache=False,
                 )
 
             return None
 
     @classmethod
     def close_shared_driver(cls):
-        if cls._driver_instance:
-            LOGGER.info("Closing Shared WebDriver...")
-
-            try: 
-                cls._driver_instance.quit()
-
-            except: 
-                pass
-
-            cls._driver_instance = None
+        SeleniumScraper._pool.close_all()
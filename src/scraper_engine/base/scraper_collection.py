@@ -1,6 +1,12 @@
-from .scraper import Scraper
+from .scraper import Scraper, SeleniumScraper
+from .html_cache import HTML_CACHE
+from .proxy_session import PROXY_SESSIONS
+from .url_index import KnownUrlIndex
+from .article_sink import JsonlArticleSink
 
 from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
 
 import json
 import csv
@@ -16,15 +22,203 @@ LOGGER = logging.getLogger(__name__)
 class ScraperCollection:
     scrapers: list[Scraper]
     articles: list
+    known_urls: KnownUrlIndex | None
   
-    def __init__(self):
+    def __init__(self, known_urls: KnownUrlIndex | None = None):
         self.scrapers = []
         self.articles = []
+        self.known_urls = known_urls
     
     def add_scraper(self, scraper) -> None:
         self.scrapers.append(scraper)
     
-    def run_all(self, num_page: int | None, date: str | None, filter_from: datetime | None) -> list[dict]:
+    def run_scraper(self, scraper: Scraper, num_page: int | None, date: str) -> list[dict]:
+        scraper.articles = [] 
+        scraper.fetched_pages = set()
+        scraper.known_urls = self.known_urls
+        scraper._page_seen = scraper._page_known = 0
+        
+        try:
+            extract_params = inspect.signature(
+                scraper.extract_news_pages
+            ).parameters
+            
+            if "date" in extract_params or "target_date" in extract_params:
+                articles = scraper.extract_news_pages(
+                    num_page, 
+                    date
+                )
+            
+            else:
+                articles = scraper.extract_news_pages(num_page)
+
+            scraper.attach_page_refs(articles or [])
+
+            return articles
+
+        except Exception as error:
+            LOGGER.error(f"Error in scraper {scraper.__class__.__name__}: {error}")
+            return []
+
+        finally:
+            # hand the browser back so the next source can lease it
+            if isinstance(scraper, SeleniumScraper):
+                scraper.release_driver()
+
+    def checkpoint_name(self, scraper: Scraper, date: str) -> str:
+        return f"{scraper.__class__.__name__}:{date}"
+
+    def run_source(
+        self, 
+        scraper: Scraper, 
+        num_page: int | None, 
+        date: str, 
+        sink: JsonlArticleSink | None,
+    ) -> list[dict] | None:
+        """
+        Runs one scraper for one date. Returns None for a source the sink has
+        already checkpointed (on a resumed run), which is skipped.
+        """
+        checkpoint_name = self.checkpoint_name(scraper, date)
+
+        if sink is not None and sink.is_completed(checkpoint_name):
+            LOGGER.info(f"Skipping {checkpoint_name}, already scraped")
+            return None
+
+        return self.run_scraper(scraper, num_page, date)
+
+    def collect(
+        self, 
+        scraper: Scraper, 
+        date: str, 
+        articles: list[dict] | None, 
+        sink: JsonlArticleSink | None,
+    ) -> None:
+        """
+        With a sink the articles are streamed to disk straight away and not
+        kept in memory; without one they are added to self.articles. Only
+        then are their URLs recorded as handed over.
+        """
+        if articles is None:
+            return
+
+        if sink is None:
+            self.articles.extend(articles)
+
+        else:
+            sink.write_source(self.checkpoint_name(scraper, date), articles)
+
+        if self.known_urls is not None:
+            self.known_urls.record(scraper.__class__.__name__, articles)
+
+    def record_resumed(self, sink: JsonlArticleSink | None) -> None:
+        """
+        Records the URLs of the sources a resumed sink already holds, which
+        this run skips and so would otherwise never record.
+        """
+        if sink is None or self.known_urls is None:
+            return
+
+        for checkpoint_name, articles in sink.completed_sources():
+            source = checkpoint_name.partition(":")[0] if checkpoint_name else None
+            self.known_urls.record(source, articles)
+
+    def run_concurrent(
+        self, 
+        num_page: int | None, 
+        dates_to_scrape: list[str], 
+        max_workers: int,
+        sink: JsonlArticleSink | None = None,
+    ) -> None:
+        """
+        Runs independent scrapers on a bounded thread pool. Sources that need a
+        browser are split into as many chains as the driver pool has sessions,
+        so they never queue on a lease mid-run. Results are collected in the
+        same date-then-registration order the serial loop produces: a finished
+        source is held back until every source before it is in, then flushed.
+        """
+        order = [
+            (date_index, scraper_index)
+            for date_index in range(len(dates_to_scrape))
+            for scraper_index in range(len(self.scrapers))
+        ]
+        results = {}
+        flushed = 0
+        results_lock = Lock()
+
+        def finish(key: tuple[int, int], articles: list[dict] | None) -> None:
+            nonlocal flushed
+
+            with results_lock:
+                results[key] = articles
+
+                while flushed < len(order) and order[flushed] in results:
+                    date_index, scraper_index = order[flushed]
+                    self.collect(
+                        self.scrapers[scraper_index],
+                        dates_to_scrape[date_index],
+                        results.pop(order[flushed]),
+                        sink,
+                    )
+                    flushed += 1
+
+        def run_group(indexed_scrapers: list[tuple[int, Scraper]]) -> None:
+            for scraper_index, scraper in indexed_scrapers:
+                # one scraper instance keeps its own state, so its dates run in sequence
+                for date_index, date_to_scrape in enumerate(dates_to_scrape):
+                    try:
+                        articles = self.run_source(
+                            scraper, 
+                            num_page, 
+                            date_to_scrape,
+                            sink,
+                        )
+
+                    except Exception as error:
+                        # a failed source must still release the ones queued behind it
+                        LOGGER.error(f"Error in scraper {scraper.__class__.__name__}: {error}")
+                        articles = []
+
+                    finish((date_index, scraper_index), articles)
+
+        driver_bound = [
+            (index, scraper)
+            for index, scraper in enumerate(self.scrapers)
+            if scraper.uses_shared_driver
+        ]
+
+        driver_chains = min(SeleniumScraper._pool.size, max_workers)
+        
+        # the driver chains are the long pole, so they get workers first
+        groups = [
+            driver_bound[chain::driver_chains] 
+            for chain in range(driver_chains)
+            if driver_bound[chain::driver_chains]
+        ]
+        groups.extend(
+            [(index, scraper)]
+            for index, scraper in enumerate(self.scrapers)
+            if not scraper.uses_shared_driver
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scraper") as executor:
+            futures = [executor.submit(run_group, group) for group in groups]
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+
+                except Exception as error:
+                    LOGGER.error(f"Scraper worker failed: {error}")
+
+    def run_all(
+        self, 
+        num_page: int | None, 
+        date: str | None, 
+        filter_from: datetime | None,
+        max_workers: int = 1,
+        sink: JsonlArticleSink | None = None,
+    ) -> list[dict]:
         today = datetime.now(WIB)
         
         if date is None:
@@ -36,30 +230,20 @@ class ScraperCollection:
             yesterday = (today - timedelta(days=1)).strftime("%Y%m%d")
             dates_to_scrape.append(yesterday)
 
-        for date_to_scrape in dates_to_scrape:
-            for scraper in self.scrapers:
-                scraper.articles = [] 
-                
-                try:
-                    extract_params = inspect.signature(
-                        scraper.extract_news_pages
-                    ).parameters
-                    
-                    if "date" in extract_params or "target_date" in extract_params:
-                        articles = scraper.extract_news_pages(
-                            num_page, 
-                            date_to_scrape
-                        )
-                    
-                    else:
-                        articles = scraper.extract_news_pages(num_page)
+        self.record_resumed(sink)
 
-                    self.articles = [*self.articles, *articles]
+        if max_workers > 1:
+            LOGGER.info(f"Running {len(self.scrapers)} scrapers with {max_workers} workers")
+            self.run_concurrent(num_page, dates_to_scrape, max_workers, sink)
 
-                except Exception as error:
-                    LOGGER.error(f"Error in scraper {scraper.__class__.__name__}: {error}")
-                    continue
+        else:
+            for date_to_scrape in dates_to_scrape:
+                for scraper in self.scrapers:
+                    articles = self.run_source(scraper, num_page, date_to_scrape, sink)
+                    self.collect(scraper, date_to_scrape, articles, sink)
 
+        HTML_CACHE.log_stats()
+        PROXY_SESSIONS.log_stats()
         return self.articles
     
     # Writer methods
@@ -0,0 +1,255 @@
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from urllib.parse import urlparse
+
+from scraper_engine.config.conf import (
+    TIER_ROUTES_PATH, TIER_ROUTING_WINDOW, TIER_MIN_ATTEMPTS,
+    TIER_DEMOTE_RATE, TIER_PROBE_EVERY,
+)
+
+import csv
+import json
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def domain_of(url: str) -> str:
+    netloc = urlparse(url).netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+class TierStats:
+    def __init__(self, window: int):
+        # (succeeded, seconds) of the most recent attempts
+        self.outcomes: deque[tuple[bool, float]] = deque(maxlen=window)
+        self.last_success: str | None = None
+
+    @property
+    def attempts(self) -> int:
+        return len(self.outcomes)
+
+    @property
+    def success_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+
+        return sum(succeeded for succeeded, _ in self.outcomes) / len(self.outcomes)
+
+    @property
+    def mean_latency(self) -> float:
+        if not self.outcomes:
+            return 0.0
+
+        return sum(seconds for _, seconds in self.outcomes) / len(self.outcomes)
+
+
+class TierRouter:
+    """
+    Learned extraction-tier order per article domain, persisted between runs.
+
+    Each domain keeps a rolling window of outcomes per tier. The tier that
+    succeeded most recently is tried first; a tier whose success rate over
+    at least `min_attempts` tries fell below `demote_rate` is moved to the
+    end of the ladder instead of being paid for on every article. Every
+    `probe_every`-th article of a domain walks the default order, so a tier
+    that starts working again is promoted back.
+    """
+    def __init__(
+        self,
+        path: str | Path,
+        window: int,
+        min_attempts: int,
+        demote_rate: float,
+        probe_every: int,
+    ):
+        self.path = Path(path)
+        self.window = window
+        self.min_attempts = min_attempts
+        self.demote_rate = demote_rate
+        self.probe_every = probe_every
+        self.domains: dict[str, dict] = {}
+        self.loaded = False
+        self.dirty = False
+        self._lock = Lock()
+
+    def _load(self) -> None:
+        if self.loaded:
+            return
+
+        self.loaded = True
+
+        try:
+            with self.path.open("r") as file:
+                data = json.load(file)
+
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        for domain, entry in data.items():
+            tiers = {}
+
+            for tier, stats in (entry.get("tiers") or {}).items():
+                tier_stats = TierStats(self.window)
+                tier_stats.outcomes.extend(
+                    (bool(succeeded), float(seconds))
+                    for succeeded, seconds in stats.get("outcomes") or []
+                )
+                tier_stats.last_success = stats.get("last_success")
+                tiers[tier] = tier_stats
+
+            self.domains[domain] = {
+                "preferred": entry.get("preferred"),
+                "articles": int(entry.get("articles") or 0),
+                "tiers": tiers,
+            }
+
+        LOGGER.info(f"Loaded tier routes for {len(self.domains)} domains from {self.path}")
+
+    def _entry(self, domain: str) -> dict:
+        entry = self.domains.get(domain)
+
+        if entry is None:
+            entry = {"preferred": None, "articles": 0, "tiers": {}}
+            self.domains[domain] = entry
+
+        return entry
+
+    def order(self, url: str, tiers: list[str]) -> list[str]:
+        """
+        The tiers to try for `url`, best first. Every tier stays in the list,
+        so a bad guess only costs the order, never the article.
+        """
+        domain = domain_of(url)
+
+        with self._lock:
+            self._load()
+            entry = self._entry(domain)
+            entry["articles"] += 1
+
+            if self.probe_every and entry["articles"] % self.probe_every == 0:
+                LOGGER.info(f"[ROUTING] Probing default tier order for {domain}")
+                return list(tiers)
+
+            demoted = [
+                tier
+                for tier in tiers
+                if (stats := entry["tiers"].get(tier))
+                and stats.attempts >= self.min_attempts
+                and stats.success_rate < self.demote_rate
+            ]
+            ordered = [tier for tier in tiers if tier not in demoted] + demoted
+
+            preferred = entry["preferred"]
+
+            if preferred in ordered:
+                ordered.remove(preferred)
+                ordered.insert(0, preferred)
+
+        if ordered != list(tiers):
+            LOGGER.info(f"[ROUTING] {domain}: {' -> '.join(ordered)}")
+
+        return ordered
+
+    def record(self, url: str, tier: str, succeeded: bool, seconds: float) -> None:
+        domain = domain_of(url)
+
+        with self._lock:
+            self._load()
+            entry = self._entry(domain)
+            stats = entry["tiers"].setdefault(tier, TierStats(self.window))
+            stats.outcomes.append((succeeded, round(seconds, 2)))
+
+            if succeeded:
+                stats.last_success = datetime.now(timezone.utc).isoformat()
+                entry["preferred"] = tier
+
+            elif entry["preferred"] == tier:
+                entry["preferred"] = None
+
+            self.dirty = True
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                domain: {
+                    "preferred": entry["preferred"],
+                    "articles": entry["articles"],
+                    "tiers": {
+                        tier: {
+                            "outcomes": [list(outcome) for outcome in stats.outcomes],
+                            "last_success": stats.last_success,
+                        }
+                        for tier, stats in entry["tiers"].items()
+                    },
+                }
+                for domain, entry in sorted(self.domains.items())
+            }
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+
+        with temp_path.open("w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+        temp_path.replace(self.path)
+        self.dirty = False
+
+        LOGGER.info(f"Saved tier routes for {len(self.domains)} domains to {self.path}")
+
+    def summary(self) -> list[dict]:
+        """
+        One row per (domain, tier) for inspection.
+        """
+        with self._lock:
+            self._load()
+
+            return [
+                {
+                    "domain": domain,
+                    "tier": tier,
+                    "preferred": entry["preferred"] == tier,
+                    "attempts": stats.attempts,
+                    "success_rate": round(stats.success_rate, 2),
+                    "mean_latency": round(stats.mean_latency, 2),
+                    "last_success": stats.last_success,
+                }
+                for domain, entry in sorted(self.domains.items())
+                for tier, stats in entry["tiers"].items()
+            ]
+
+    def export(self, path: str | Path) -> int:
+        rows = self.summary()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if path.suffix == ".csv":
+            with path.open("w", newline="") as file:
+                writer = csv.DictWriter(
+                    file,
+                    fieldnames=["domain", "tier", "preferred", "attempts", "success_rate", "mean_latency", "last_success"],
+                )
+                writer.writeheader()
+                writer.writerows(rows)
+
+        else:
+            with path.open("w") as file:
+                json.dump(rows, file, indent=2)
+
+        return len(rows)
+
+
+TIER_ROUTER = TierRouter(
+    TIER_ROUTES_PATH,
+    TIER_ROUTING_WINDOW,
+    TIER_MIN_ATTEMPTS,
+    TIER_DEMOTE_RATE,
+    TIER_PROBE_EVERY,
+)
@@ -0,0 +1,128 @@
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from threading import Lock
+
+from .html_cache import normalize_url
+
+import json
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class KnownUrlIndex:
+    """
+    Persistent set of article URLs handed over by previous runs, plus a
+    per-source high-water mark (newest URL and timestamp seen).
+
+    Scrapers consult it while paginating so a scheduled run stops as soon as
+    a listing page holds nothing new. Entries older than the retention window
+    are pruned on save, which keeps the file small and lets a source recover
+    if an article was dropped downstream.
+
+    URLs recorded during a run are held apart and only merged on save, so
+    is_known always answers from the index as it was at run start. Otherwise
+    the yesterday pass of a run would stop on the today articles the same
+    run just recorded.
+    """
+    def __init__(self, path: str | Path, retention_days: int = 3):
+        self.path = Path(path)
+        self.retention = timedelta(days=retention_days)
+        self.urls: dict[str, str] = {}
+        self.high_water: dict[str, dict] = {}
+        self.recorded_urls: dict[str, str] = {}
+        self.recorded_high_water: dict[str, dict] = {}
+        self.added = 0
+        self._lock = Lock()
+
+    @classmethod
+    def load(cls, path: str | Path, retention_days: int = 3) -> "KnownUrlIndex":
+        index = cls(path, retention_days)
+
+        try:
+            with index.path.open("r") as file:
+                data = json.load(file)
+
+            index.urls = dict(data.get("urls") or {})
+            index.high_water = dict(data.get("high_water") or {})
+
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            pass
+
+        LOGGER.info(f"Loaded {len(index.urls)} known URLs from {index.path}")
+        return index
+
+    def is_known(self, source: str, url: str) -> bool:
+        if not url:
+            return False
+
+        key = normalize_url(url)
+
+        if key in self.urls:
+            return True
+
+        mark = self.high_water.get(source)
+        return bool(mark) and mark.get("url") == key
+
+    def record(self, source: str | None, articles: list[dict]) -> None:
+        """
+        Notes the articles a source handed over in this run; they count as
+        known from the next run on (see save).
+        """
+        now = datetime.now(timezone.utc).isoformat()
+
+        with self._lock:
+            newest = self.recorded_high_water.get(source)
+
+            for article in articles:
+                url = article.get("source")
+
+                if not url:
+                    continue
+
+                key = normalize_url(url)
+
+                if key not in self.urls and key not in self.recorded_urls:
+                    self.recorded_urls[key] = now
+                    self.added += 1
+
+                timestamp = str(article.get("timestamp") or "")
+
+                if newest is None or timestamp > newest["timestamp"]:
+                    newest = {"url": key, "timestamp": timestamp}
+
+            if newest and source:
+                self.recorded_high_water[source] = {**newest, "recorded_at": now}
+
+    def prune(self) -> None:
+        cutoff = (datetime.now(timezone.utc) - self.retention).isoformat()
+
+        with self._lock:
+            self.urls = {
+                url: first_seen
+                for url, first_seen in self.urls.items()
+                if first_seen >= cutoff
+            }
+
+    def save(self) -> None:
+        with self._lock:
+            self.urls.update(self.recorded_urls)
+            self.high_water.update(self.recorded_high_water)
+            self.recorded_urls = {}
+            self.recorded_high_water = {}
+
+        self.prune()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            with self.path.open("w") as file:
+                json.dump(
+                    {"urls": self.urls, "high_water": self.high_water},
+                    file,
+                    indent=4,
+                )
+
+        LOGGER.info(
+            f"Saved {len(self.urls)} known URLs ({self.added} new) to {self.path}"
+        )
@@ -52,32 +52,96 @@ MODEL_CONFIG = {
     'kimi-k2': {
         'model': 'moonshotai/kimi-k2-instruct-0905',
         'provider': 'groq', 
+        'rpm': 60,
+        'tpm': 10000,
         # 'key': GROQ_API_KEY
     },
     'gpt-oss-120b': {
         'model': 'openai/gpt-oss-120b',
         'provider': 'groq', 
+        'rpm': 30,
+        'tpm': 8000,
         # 'key': GROQ_API_KEY
     },
     'gpt-oss-20b': {
         'model': 'openai/gpt-oss-20b',
         'provider': 'groq', 
+        'rpm': 30,
+        'tpm': 8000,
         # 'key': GROQ_API_KEY
     },
     'gemini-2.5-flash': {
         'model': 'gemini-2.5-flash',
         'provider': 'google-genai', 
+        'rpm': 10,
+        'tpm': 250000,
         # 'key': GEMINI_API_KEY
     },
     'llama-3.3-70b': {
         'model': 'llama-3.3-70b-versatile',
         'provider': 'groq', 
+        'rpm': 30,
+        'tpm': 12000,
         # 'key': GROQ_API_KEY
     }
 }
 
+# LLM throttling: share of each key's per-minute budget ('rpm'/'tpm' above,
+# overridden by the rate-limit headers of a 429) the pipeline may use, the
+# longest wait (seconds) for the best key before the call falls back to the
+# next model, the cooldown after a 429 that carries no retry hint, and the
+# completion size assumed before a call returns
+LLM_THROTTLE_HEADROOM = 0.9
+LLM_MAX_THROTTLE_WAIT = 60
+LLM_DEFAULT_COOLDOWN = 10
+LLM_COMPLETION_TOKEN_ESTIMATE = 1000
+
+# The provider SDKs run with max_retries=0 so a 429 reaches the throttle.
+# Transient failures (connection errors, timeouts, 5xx) are instead retried
+# on the same key this many times, with a backoff (seconds) that doubles
+LLM_TRANSIENT_RETRIES = 2
+LLM_TRANSIENT_BACKOFF = 1.0
+
+# Persistent cache of accepted LLM outputs (SQLite). A rerun of the same
+# article with the same prompt and model is served from disk for LLM_CACHE_TTL
+# seconds; set LLM_CACHE_ENABLED=false to always call the provider
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() != "false"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm/responses.sqlite3")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 60 * 60)))
+LLM_CACHE_MAX_ENTRIES = 50000
+
+# SGX company extraction shows the LLM only the listed companies a local
+# gazetteer finds in the article (at most SGX_COMPANY_MAX_CANDIDATES) instead
+# of all of them, and the full list when it finds none; set
+# SGX_COMPANY_PREFILTER=false to always send the full list
+SGX_COMPANY_PREFILTER = os.getenv("SGX_COMPANY_PREFILTER", "true").lower() != "false"
+SGX_COMPANY_MAX_CANDIDATES = 30
+
+# Markets whose tickers are linked locally (gazetteer over the company list)
+# when every company mention scores at least LOCAL_TICKER_CONFIDENCE; other
+# articles still go through LLM extraction and fuzzy matching. Check a market
+# with scripts.local_ticker_agreement before adding it. SGX articles rarely
+# clear the threshold (single-word names, bare tickers such as "500" in
+# "S&P 500"), so only IDX is on by default
+LOCAL_TICKER_MARKETS = [
+    market.strip()
+    for market in os.getenv("LOCAL_TICKER_MARKETS", "idx").split(",")
+    if market.strip()
+]
+LOCAL_TICKER_CONFIDENCE = 0.9
+
+# Seconds the metadata files (tags, subsectors, companies, sectors) and the
+# prompt text derived from them are served from memory before being re-read
+METADATA_TTL = int(os.getenv("METADATA_TTL", "3600"))
+
+# How NewsClassifier runs the tags/sentiment/dimension heads: "sequential"
+# (one call per head), "parallel" (the three calls at once) or "combined"
+# (one structured call returning all three)
+CLASSIFICATION_MODE = os.getenv("CLASSIFICATION_MODE", "sequential")
+
 ROTATE_STATUS_CODES = {401, 403, 429, 413}
 ABORT_STATUS_CODES = {400, 422, 500, 502, 503, 504}
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
 
 ROTATE_KEYWORDS = (
     "rate limit", "too many requests", "authentication", "invalid api key", 
@@ -88,6 +152,10 @@ ABORT_KEYWORDS = (
     "context length", "max token", "internal server",
     "bad gateway", "service unavailable",
 )
+TRANSIENT_KEYWORDS = (
+    "timed out", "timeout", "connection error", "internal server",
+    "bad gateway", "service unavailable",
+)
 
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -115,3 +183,86 @@ CRAWLER_USER_AGENT = (
     "Googlebot/2.1; +http://www.google.com/bot.html) "
     "Chrome/120.0.0.0 Safari/537.36"
 )
+
+# Selenium driver pool: number of concurrent Chrome sessions and how many
+# page loads a session serves before it is recycled to release memory
+SELENIUM_POOL_SIZE = int(os.getenv("SELENIUM_POOL_SIZE", "2"))
+SELENIUM_MAX_PAGE_LOADS = int(os.getenv("SELENIUM_MAX_PAGE_LOADS", "50"))
+SELENIUM_LEASE_TIMEOUT = 600
+
+# Keep-alive sessions for requests routed through the proxy (Web Unlocker):
+# pooled connections per endpoint, retries on transient errors with
+# exponential backoff, and (connect, read) timeouts in seconds
+PROXY_POOL_SIZE = int(os.getenv("PROXY_POOL_SIZE", "8"))
+PROXY_MAX_RETRIES = int(os.getenv("PROXY_MAX_RETRIES", "3"))
+PROXY_BACKOFF_FACTOR = 1.5
+PROXY_RETRY_STATUSES = (429, 500, 502, 503, 504)
+PROXY_TIMEOUT = (10, 60)
+
+# Persistent HTML cache shared by the scrapers and the article fetcher.
+# TTLs are in seconds and are applied by the reader
+HTML_CACHE_DIR = os.getenv("HTML_CACHE_DIR", ".cache/html")
+HTML_CACHE_MAX_BYTES = int(os.getenv("HTML_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+HTML_CACHE_SCRAPER_TTL = 30 * 60
+HTML_CACHE_ARTICLE_TTL = 24 * 60 * 60
+
+# Learned per-domain order of the article-body extraction tiers: a rolling
+# window of outcomes per tier, the attempts and success rate below which a
+# tier is moved to the end, and how often a domain re-probes the default order
+TIER_ROUTES_PATH = os.getenv("TIER_ROUTES_PATH", ".cache/fetch/tier_routes.json")
+TIER_ROUTING_WINDOW = 10
+TIER_MIN_ATTEMPTS = 3
+TIER_DEMOTE_RATE = 0.2
+TIER_PROBE_EVERY = 20
+
+# How get_article_body walks the extraction tiers: "ladder" (one after the
+# other, in the learned order) or "race" (cheap tiers at once, browser/proxy
+# tiers added after EXTRACTION_HEDGE_DELAY seconds, first usable body wins)
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "ladder")
+EXTRACTION_HEDGE_DELAY = float(os.getenv("EXTRACTION_HEDGE_DELAY", "8"))
+EXTRACTION_RACE_WORKERS = 8
+
+# Main-content fast path: the article container of known sites is read
+# directly, and only pages where it yields less than FAST_EXTRACTION_MIN_LENGTH
+# characters (or other sites) are handed to Goose. FAST_EXTRACTION_GENERIC=true
+# also reads generic article markup on every other site; check it with
+# scripts.extraction_benchmark first
+FAST_EXTRACTION_ENABLED = os.getenv("FAST_EXTRACTION_ENABLED", "true").lower() != "false"
+FAST_EXTRACTION_GENERIC = os.getenv("FAST_EXTRACTION_GENERIC", "false").lower() == "true"
+FAST_EXTRACTION_MIN_LENGTH = 400
+
+# Persistent store of extracted article bodies keyed by canonical URL, read
+# before any network fetch so retries and later batches skip extraction
+BODY_STORE_ENABLED = os.getenv("BODY_STORE_ENABLED", "true").lower() != "false"
+BODY_STORE_PATH = os.getenv("BODY_STORE_PATH", ".cache/fetch/bodies.sqlite3")
+BODY_STORE_TTL = int(os.getenv("BODY_STORE_TTL", str(3 * 24 * 60 * 60)))
+BODY_STORE_MAX_ENTRIES = 20000
+
+# Known-URL index used to stop pagination early on scheduled runs. URLs are
+# remembered for this many days after they were first handed over
+KNOWN_URLS_RETENTION_DAYS = int(os.getenv("KNOWN_URLS_RETENTION_DAYS", "3"))
+
+# BeautifulSoup tree builder used for listing and detail pages ("lxml" or
+# "html.parser"). Sources opt in to "lxml" one by one with
+# Scraper.parser_backend once scripts/parse_benchmark.py shows they read
+# identically under it
+HTML_PARSER = os.getenv("HTML_PARSER", "html.parser")
+
+# Selenium fast mode: URL patterns blocked through the DevTools protocol and
+# the waits that replace fixed sleeps after a navigation (seconds)
+SELENIUM_BLOCK_RESOURCES = os.getenv("SELENIUM_BLOCK_RESOURCES", "true").lower() != "false"
+SELENIUM_BLOCKED_URLS = [
+    # images, media and fonts
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # ad and analytics hosts
+    "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*googletagservices.com*",
+    "*adservice.google.*", "*amazon-adsystem.com*", "*adnxs.com*", "*criteo.*",
+    "*taboola.com*", "*outbrain.com*", "*scorecardresearch.com*", "*hotjar.com*",
+    "*facebook.net*", "*connect.facebook.com*", "*chartbeat.*", "*quantserve.com*",
+]
+SELENIUM_SELECTOR_TIMEOUT = 30
+SELENIUM_IDLE_TIMEOUT = 5
+SELENIUM_IDLE_WINDOW = 0.5
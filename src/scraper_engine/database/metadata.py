@@ -1,17 +1,23 @@
 from datetime import datetime
 from pathlib import Path
+from threading import Lock
 
 from scraper_engine.database.client import SUPABASE_CLIENT
+from scraper_engine.config.conf import METADATA_TTL
 
 import json
 import re
 import logging
+import time
 
 
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path("data")
 
+# days of the month the local metadata files are re-pulled from Supabase
+REFRESH_DAYS = {1, 15}
+
 
 def open_json(path: str | Path) -> dict | list:
     json_path = Path(path)
@@ -27,19 +33,63 @@ def write_json(path: str | Path, payload: dict | list) -> None:
         json.dump(payload, file, indent=2)
 
 
+class MetadataCache:
+    """
+    In-memory copies of the metadata files, shared by every article of a run.
+
+    Each entry is loaded (and its prompt strings derived) once and served
+    from memory for `ttl` seconds. The Supabase refresh that rewrites a file
+    runs at most once per process on refresh days, however many articles ask
+    for it.
+    """
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.entries: dict[str, tuple[float, any]] = {}
+        self.refreshed: set[str] = set()
+        self._lock = Lock()
+
+    def get(self, name: str, load) -> any:
+        with self._lock:
+            cached = self.entries.get(name)
+
+            if cached is not None and time.monotonic() - cached[0] < self.ttl:
+                return cached[1]
+
+            value = load()
+            self.entries[name] = (time.monotonic(), value)
+
+            return value
+
+    def refresh_once(self, name: str, refresh) -> None:
+        if datetime.today().day not in REFRESH_DAYS:
+            return
+
+        with self._lock:
+            if name in self.refreshed:
+                return
+
+            refresh()
+            self.refreshed.add(name)
+            self.entries.pop(name, None)
+            logger.info(f"Refreshed {name} from Supabase")
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+
+
+METADATA_CACHE = MetadataCache(METADATA_TTL)
+
+
 def get_sectors_data() -> dict[str, any]:
-    path = DATA_DIR / "idx/sectors_data.json"
-    
-    if not path.exists():
-        logger.warning(f"{path} not found. Returning empty sectors.")
-        return {}
-    
-    return open_json(path)
+    return METADATA_CACHE.get("sectors_idx", lambda: read_sectors_data(DATA_DIR / "idx/sectors_data.json"))
 
 
 def get_sectors_data_sgx() -> dict[str, any]:
-    path = DATA_DIR / "sgx/sectors_data_sgx.json"
-    
+    return METADATA_CACHE.get("sectors_sgx", lambda: read_sectors_data(DATA_DIR / "sgx/sectors_data_sgx.json"))
+
+
+def read_sectors_data(path: Path) -> dict[str, any]:
     if not path.exists():
         logger.warning(f"{path} not found. Returning empty sectors.")
         return {}
@@ -148,7 +198,7 @@ def extract_first_sentences(text: str, count: int = 2) -> str:
 def load_subsector_data_idx() -> tuple[str, set[str]]:
     path = DATA_DIR / "idx/subsectors_data.json"
 
-    if datetime.today().day in [1, 15]:
+    def refresh():
         response = (
             SUPABASE_CLIENT
             .table("idx_subsector_metadata")
@@ -160,8 +210,11 @@ def load_subsector_data_idx() -> tuple[str, set[str]]:
 
         write_json(path, subsectors)
 
-    subsectors = open_json(path)
+    METADATA_CACHE.refresh_once("subsectors_idx", refresh)
 
+    return METADATA_CACHE.get("subsectors_idx", lambda: build_subsector_prompt_idx(open_json(path)))
+
+def build_subsector_prompt_idx(subsectors: dict[str, str]) -> tuple[str, set[str]]:
     # Extract only the first two sentences
     subsector_clean = {}
 
@@ -180,9 +233,12 @@ def load_subsector_data_idx() -> tuple[str, set[str]]:
     return result
 
 def load_subsector_data_sgx() -> dict:
-    return open_json(DATA_DIR / "sgx/subsectors_data_sgx.json")
+    return METADATA_CACHE.get("subsectors_sgx", lambda: open_json(DATA_DIR / "sgx/subsectors_data_sgx.json"))
 
 def load_tag_data() -> tuple[list, str]:
+    return METADATA_CACHE.get("tags", build_tag_prompt)
+
+def build_tag_prompt() -> tuple[list, str]:
     tag_data = open_json(DATA_DIR / "unique_tags.json")
     tags = tag_data.get("tags", [])
     
@@ -196,7 +252,7 @@ def load_tag_data() -> tuple[list, str]:
 def load_company_data_idx() -> dict[str, dict[str, str]]:
     path = DATA_DIR / "idx/companies.json"
 
-    if datetime.today().day in [1, 15]:
+    def refresh():
         response = (
             SUPABASE_CLIENT.table("idx_company_profile")
             .select("symbol, company_name, sub_sector_id")
@@ -228,14 +284,14 @@ def load_company_data_idx() -> dict[str, dict[str, str]]:
 
         write_json(path, company)
 
-    return open_json(path)
+    METADATA_CACHE.refresh_once("companies_idx", refresh)
+
+    return METADATA_CACHE.get("companies_idx", lambda: open_json(path))
     
 def load_company_data_sgx() -> dict[str, dict[str, str]]:
     path = DATA_DIR / "sgx/sgx_companies.json"
 
-    refresh_day = datetime.today().day in {1, 15}
-
-    if refresh_day:
+    def refresh():
         response = (
             SUPABASE_CLIENT
             .table("sgx_companies")
@@ -261,6 +317,6 @@ def load_company_data_sgx() -> dict[str, dict[str, str]]:
 
         write_json(path, company)
 
-    return open_json(path)
-
+    METADATA_CACHE.refresh_once("companies_sgx", refresh)
 
+    return METADATA_CACHE.get("companies_sgx", lambda: open_json(path))
@@ -9,14 +9,23 @@ from scraper_engine.config.conf import (
     GROQ_API_KEY1, GROQ_API_KEY2, 
     GROQ_API_KEY3, GROQ_API_KEY4, GROQ_API_KEY5, GROQ_API_KEY_DEV,
     GEMINI_API_KEY, GEMINI_API_KEY2, GEMINI_API_KEY3,
-    LLM_SEMAPHORE_SYNC, MODEL_CONFIG, ROTATE_KEYWORDS, 
+    LLM_SEMAPHORE_SYNC, LLM_SEMAPHORE, MODEL_CONFIG, ROTATE_KEYWORDS, 
     ROTATE_STATUS_CODES, ABORT_KEYWORDS, ABORT_STATUS_CODES, 
-    ROTATE_400_KEYWORDS
+    ROTATE_400_KEYWORDS, LLM_THROTTLE_HEADROOM, LLM_MAX_THROTTLE_WAIT,
+    LLM_DEFAULT_COOLDOWN, LLM_COMPLETION_TOKEN_ESTIMATE,
+    LLM_TRANSIENT_RETRIES, LLM_TRANSIENT_BACKOFF,
+    TRANSIENT_STATUS_CODES, TRANSIENT_KEYWORDS,
 )
 
+from collections import deque, Counter
+from threading import Lock
+
 import groq 
 import openai
+import asyncio
 import logging 
+import re
+import time
 
 
 LOGGER = logging.getLogger(__name__)
@@ -38,24 +47,26 @@ class TokenUsageLogger(BaseCallbackHandler):
         )
 
 
-def invoke_llm(chain: Runnable, input_data: dict):
+def invoke_llm(chain: Runnable, input_data: dict, config: dict | None = None):
     """
     Wrapper function to invoke the LLM chain synchronously. 
-    This function uses a semaphore to limit the number of concurrent LLM calls.
+    Concurrent LLM calls are limited by LLM_SEMAPHORE_SYNC, which
+    KeyRotatingChatModel holds only while a request is in flight, so a call
+    waiting on the throttle does not take a slot.
 
     Args:
         chain: The LLM chain to be invoked.
         input_data: The input data to be processed by the LLM chain.
+        config: Optional runnable config (e.g. callbacks).
     
     Returns:
         The result of the LLM chain invocation, or None if the API call fails after all
     """
-    with LLM_SEMAPHORE_SYNC:
-        try:
-            return chain.invoke(input_data)
-        
-        except (groq.APIError, groq.APITimeoutError, openai.APIError, openai.APITimeoutError) as error:
-            raise 
+    try:
+        return chain.invoke(input_data, config=config)
+    
+    except (groq.APIError, groq.APITimeoutError, openai.APIError, openai.APITimeoutError) as error:
+        raise 
 
 
 def extract_status_code(error: Exception) -> int | None:
@@ -98,12 +109,353 @@ def classify_error(error: Exception) -> str:
     return "raise"
 
 
+def is_transient_error(error: Exception) -> bool:
+    """
+    Connection errors, timeouts and 5xx responses, which the provider SDK
+    would have retried on its own.
+    """
+    if isinstance(error, (groq.APIConnectionError, openai.APIConnectionError)):
+        return True
+
+    if extract_status_code(error) in TRANSIENT_STATUS_CODES:
+        return True
+
+    error_message = str(error).lower()
+    return any(keyword in error_message for keyword in TRANSIENT_KEYWORDS)
+
+
+DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+RETRY_HINT_PATTERNS = (
+    # Gemini: "Please retry in 37.2s", "retryDelay': '37s'", "retry_delay { seconds: 37"
+    re.compile(r"retry in (\d+(?:\.\d+)?)\s*s", re.IGNORECASE),
+    re.compile(r"retry_?delay\W+(?:seconds\W+)?(\d+(?:\.\d+)?)", re.IGNORECASE),
+    # Groq: "Please try again in 7.66s"
+    re.compile(r"try again in ((?:\d+(?:\.\d+)?(?:ms|h|m|s))+)", re.IGNORECASE),
+)
+
+
+def parse_duration(value: str | None) -> float | None:
+    """
+    Seconds from a rate-limit duration such as "7.66s", "2m59.56s", "350ms"
+    or a bare number of seconds.
+    """
+    if value is None:
+        return None
+
+    value = str(value).strip()
+
+    try:
+        return float(value)
+
+    except ValueError:
+        pass
+
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    parts = DURATION_PATTERN.findall(value)
+
+    if not parts:
+        return None
+
+    return sum(float(amount) * units[unit] for amount, unit in parts)
+
+
+def estimate_tokens(messages: list[BaseMessage]) -> int:
+    prompt_chars = sum(len(str(message.content)) for message in messages)
+    return prompt_chars // 4 + LLM_COMPLETION_TOKEN_ESTIMATE
+
+
+def total_tokens(result: ChatResult) -> int | None:
+    for generation in result.generations:
+        usage = getattr(generation.message, "usage_metadata", None) or {}
+
+        if usage.get("total_tokens"):
+            return usage["total_tokens"]
+
+    token_usage = (result.llm_output or {}).get("token_usage") or {}
+    return token_usage.get("total_tokens")
+
+
+class KeyState:
+    def __init__(self, rpm: int | None, tpm: int | None):
+        self.rpm = rpm
+        self.tpm = tpm
+        # [started_at, tokens] per call in the last minute
+        self.events: deque[list] = deque()
+        self.cooldown_until = 0.0
+        self.remaining_requests: int | None = None
+        self.requests_reset_at = 0.0
+        self.remaining_tokens: int | None = None
+        self.tokens_reset_at = 0.0
+        self.last_used = 0.0
+        # diagnostics
+        self.successes = 0
+        self.failures = 0
+        self.rate_limited = 0
+        self.latency = 0.0
+
+
+class LlmThrottle:
+    """
+    Paces LLM calls per (model, API key) so the pipeline only waits when a
+    limit is actually close, instead of sleeping a fixed time after every call.
+
+    Each key keeps a one-minute window of its requests and tokens, checked
+    against the model's rpm/tpm budget. Provider feedback on a 429 takes
+    precedence: the x-ratelimit-* headers of Groq's error response update the
+    remaining budget and its reset time, and the retry-after header (or
+    Gemini's retry delay in the error body) puts the key in a cooldown.
+
+    It also picks the key for each call: the one that can send soonest, and
+    among keys that are all ready the least recently used, so concurrent
+    calls spread over the pool and a key in cooldown is only tried once its
+    cooldown is over.
+    """
+    window = 60.0
+
+    def __init__(self, headroom: float):
+        self.headroom = headroom
+        self.states: dict[tuple[str, int], KeyState] = {}
+        self.waited = Counter()
+        self.throttled = Counter()
+        self._lock = Lock()
+
+    def _state(self, model: str, key_index: int) -> KeyState:
+        state = self.states.get((model, key_index))
+
+        if state is None:
+            config = MODEL_CONFIG.get(model) or {}
+            state = KeyState(config.get("rpm"), config.get("tpm"))
+            self.states[(model, key_index)] = state
+
+        return state
+
+    def _required_wait(self, state: KeyState, estimated_tokens: int, now: float) -> float:
+        while state.events and state.events[0][0] <= now - self.window:
+            state.events.popleft()
+
+        if state.remaining_requests is not None and now >= state.requests_reset_at:
+            state.remaining_requests = None
+
+        if state.remaining_tokens is not None and now >= state.tokens_reset_at:
+            state.remaining_tokens = None
+
+        waits = [state.cooldown_until - now]
+
+        if state.rpm:
+            budget = max(1, int(state.rpm * self.headroom))
+
+            if len(state.events) >= budget:
+                oldest = state.events[len(state.events) - budget]
+                waits.append(oldest[0] + self.window - now)
+
+        if state.tpm:
+            budget = int(state.tpm * self.headroom)
+            used = sum(tokens for _, tokens in state.events)
+
+            # a prompt bigger than the whole budget cannot be helped by waiting
+            if used + estimated_tokens > budget and estimated_tokens <= budget:
+                for started_at, tokens in state.events:
+                    used -= tokens
+
+                    if used + estimated_tokens <= budget:
+                        waits.append(started_at + self.window - now)
+                        break
+
+        if state.remaining_requests is not None and state.remaining_requests <= 0:
+            waits.append(state.requests_reset_at - now)
+
+        if state.remaining_tokens is not None and state.remaining_tokens < estimated_tokens:
+            waits.append(state.tokens_reset_at - now)
+
+        return max(0.0, *waits)
+
+    def acquire(
+        self,
+        model: str,
+        key_count: int,
+        estimated_tokens: int,
+        exclude: set[int] | None = None,
+    ) -> tuple[int, float, list]:
+        """
+        Chooses a key outside `exclude` and books the call on it. Returns
+        (key index, seconds to wait before sending, ticket); the ticket is
+        passed back to record_usage() or release().
+        """
+        exclude = exclude or set()
+
+        with self._lock:
+            now = time.monotonic()
+            candidates = []
+
+            for index in range(key_count):
+                if index in exclude:
+                    continue
+
+                state = self._state(model, index)
+                wait_time = self._required_wait(state, estimated_tokens, now)
+                candidates.append((wait_time, state.last_used, index))
+
+            wait_time, _, key_index = min(candidates)
+            state = self._state(model, key_index)
+
+            ticket = [now + wait_time, estimated_tokens]
+            state.events.append(ticket)
+            state.last_used = now + wait_time
+
+            if state.remaining_requests is not None:
+                state.remaining_requests -= 1
+
+            if state.remaining_tokens is not None:
+                state.remaining_tokens -= estimated_tokens
+
+        return key_index, wait_time, ticket
+
+    def release(self, model: str, key_index: int, ticket: list) -> None:
+        """
+        Gives back a call booked by acquire() that was never sent.
+        """
+        with self._lock:
+            state = self._state(model, key_index)
+
+            try:
+                state.events.remove(ticket)
+
+            except ValueError:
+                return
+
+            if state.remaining_requests is not None:
+                state.remaining_requests += 1
+
+            if state.remaining_tokens is not None:
+                state.remaining_tokens += ticket[1]
+
+    def record_wait(self, model: str, wait_time: float) -> None:
+        with self._lock:
+            self.waited[model] += wait_time
+            self.throttled[model] += 1
+
+    def _apply_headers(self, state: KeyState, headers, now: float) -> None:
+        if not headers:
+            return
+
+        headers = {str(key).lower(): value for key, value in dict(headers).items()}
+
+        if (limit := headers.get("x-ratelimit-limit-tokens")) is not None:
+            state.tpm = int(float(limit))
+
+        if (remaining := headers.get("x-ratelimit-remaining-requests")) is not None:
+            state.remaining_requests = int(float(remaining))
+            state.requests_reset_at = now + (parse_duration(headers.get("x-ratelimit-reset-requests")) or 0)
+
+        if (remaining := headers.get("x-ratelimit-remaining-tokens")) is not None:
+            state.remaining_tokens = int(float(remaining))
+            state.tokens_reset_at = now + (parse_duration(headers.get("x-ratelimit-reset-tokens")) or 0)
+
+        if (retry_after := parse_duration(headers.get("retry-after"))) is not None:
+            state.cooldown_until = max(state.cooldown_until, now + retry_after)
+
+    def record_usage(
+        self,
+        model: str,
+        key_index: int,
+        ticket: list,
+        result: ChatResult,
+        latency: float,
+    ) -> None:
+        tokens = total_tokens(result)
+
+        with self._lock:
+            state = self._state(model, key_index)
+
+            if tokens:
+                ticket[1] = tokens
+
+            state.successes += 1
+            state.latency += latency
+
+    def record_error(self, model: str, key_index: int, error: Exception) -> None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        message = str(error)
+        is_rate_limit = (
+            extract_status_code(error) == 429
+            or "rate limit" in message.lower()
+            or "resource_exhausted" in message.lower()
+        )
+
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(model, key_index)
+            state.failures += 1
+            state.rate_limited += is_rate_limit
+            self._apply_headers(state, headers, now)
+
+            if not is_rate_limit or state.cooldown_until > now:
+                return
+
+            retry_after = None
+
+            for pattern in RETRY_HINT_PATTERNS:
+                if match := pattern.search(message):
+                    retry_after = parse_duration(match.group(1))
+                    break
+
+            state.cooldown_until = now + (retry_after or LLM_DEFAULT_COOLDOWN)
+
+    def key_stats(self) -> dict[str, dict[int, dict[str, float]]]:
+        """
+        Per model and key index: successes, failures, 429s, mean latency and
+        seconds left in cooldown.
+        """
+        stats = {}
+
+        with self._lock:
+            now = time.monotonic()
+
+            for (model, key_index), state in sorted(self.states.items()):
+                stats.setdefault(model, {})[key_index] = {
+                    "successes": state.successes,
+                    "failures": state.failures,
+                    "rate_limited": state.rate_limited,
+                    "mean_latency": state.latency / state.successes if state.successes else 0.0,
+                    "cooldown": max(0.0, state.cooldown_until - now),
+                }
+
+        return stats
+
+    def log_stats(self) -> None:
+        for model in sorted(self.throttled):
+            LOGGER.info(
+                f"LLM throttle [{model}]: waited {self.waited[model]:.1f}s "
+                f"over {self.throttled[model]} calls"
+            )
+
+        for model, keys in self.key_stats().items():
+            for key_index, counts in keys.items():
+                LOGGER.info(
+                    f"LLM key [{model} #{key_index}]: {counts['successes']} ok, "
+                    f"{counts['failures']} failed ({counts['rate_limited']} rate limited), "
+                    f"avg {counts['mean_latency']:.1f}s"
+                )
+
+
+LLM_THROTTLE = LlmThrottle(LLM_THROTTLE_HEADROOM)
+
+
 class KeyRotatingChatModel(BaseChatModel):
     """
     Wraps a pool of LLM clients initialised with different API keys for the
-    same model. On a key-level failure (429, 401, 403) it transparently
-    rotates to the next available key. On request-level or server-level
-    failures it raises immediately without wasting the remaining keys.
+    same model. Each call goes to the key LLM_THROTTLE picks (ready soonest,
+    least recently used). On a key-level failure (429, 401, 403) it
+    transparently rotates to the next best key. When even the best key is
+    more than LLM_MAX_THROTTLE_WAIT seconds away it raises instead of
+    sending, so the stage falls back to its next model. Transient failures
+    (connection errors, timeouts, 5xx) are retried on the same key a few
+    times first; other request-level or server-level failures raise
+    immediately without wasting the remaining keys.
+
+    Only the request itself holds LLM_SEMAPHORE_SYNC (LLM_SEMAPHORE when
+    async); throttle waits and retry backoffs happen outside it.
     """
     llm_pool: list[BaseChatModel]
     model_name_identifier: str
@@ -122,12 +474,38 @@ class KeyRotatingChatModel(BaseChatModel):
         **kwargs: any,
     ) -> ChatResult:
         last_error: Exception | None = None
+        estimated_tokens = estimate_tokens(messages)
+        model = self.model_name_identifier
+
+        tried = set()
+
+        while len(tried) < len(self.llm_pool):
+            # the best key is the one that can go soonest, so waiting on it
+            # always beats rotating to another key
+            index, wait_time, ticket = LLM_THROTTLE.acquire(
+                model, len(self.llm_pool), estimated_tokens, tried
+            )
+
+            if wait_time > LLM_MAX_THROTTLE_WAIT:
+                LLM_THROTTLE.release(model, index, ticket)
+                raise RuntimeError(
+                    f"All remaining API keys for model '{model}' are rate limited "
+                    f"for another {wait_time:.0f}s. Last error: {last_error}"
+                )
+
+            tried.add(index)
+            llm_client = self.llm_pool[index]
+
+            if wait_time > 0:
+                LOGGER.info(f"Throttling '{model}' key index {index} for {wait_time:.1f}s")
+                LLM_THROTTLE.record_wait(model, wait_time)
+                time.sleep(wait_time)
 
-        for index, llm_client in enumerate(self.llm_pool):
             try:
-                return llm_client._generate(messages, stop=stop, **kwargs)
+                return self._send(llm_client, index, ticket, messages, stop, **kwargs)
             
             except Exception as error:
+                LLM_THROTTLE.record_error(model, index, error)
                 action = classify_error(error)
 
                 if action == "rotate":
@@ -152,6 +530,68 @@ class KeyRotatingChatModel(BaseChatModel):
             f"'{self.model_name_identifier}'. Last error: {last_error}"
         )
 
+    def _send(
+        self,
+        llm_client: BaseChatModel,
+        index: int,
+        ticket: list,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: any,
+    ) -> ChatResult:
+        model = self.model_name_identifier
+
+        for attempt in range(LLM_TRANSIENT_RETRIES + 1):
+            try:
+                with LLM_SEMAPHORE_SYNC:
+                    started_at = time.monotonic()
+                    result = llm_client._generate(messages, stop=stop, **kwargs)
+
+                LLM_THROTTLE.record_usage(model, index, ticket, result, time.monotonic() - started_at)
+                return result
+
+            except Exception as error:
+                if attempt == LLM_TRANSIENT_RETRIES or not is_transient_error(error):
+                    raise
+
+                backoff = LLM_TRANSIENT_BACKOFF * 2 ** attempt
+                LOGGER.warning(
+                    f"Transient error for '{model}' key index {index}, retrying in "
+                    f"{backoff:.0f}s ({attempt + 1}/{LLM_TRANSIENT_RETRIES}). Error: {error}"
+                )
+                time.sleep(backoff)
+
+    async def _asend(
+        self,
+        llm_client: BaseChatModel,
+        index: int,
+        ticket: list,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        **kwargs: any,
+    ) -> ChatResult:
+        model = self.model_name_identifier
+
+        for attempt in range(LLM_TRANSIENT_RETRIES + 1):
+            try:
+                async with LLM_SEMAPHORE:
+                    started_at = time.monotonic()
+                    result = await llm_client._agenerate(messages, stop=stop, **kwargs)
+
+                LLM_THROTTLE.record_usage(model, index, ticket, result, time.monotonic() - started_at)
+                return result
+
+            except Exception as error:
+                if attempt == LLM_TRANSIENT_RETRIES or not is_transient_error(error):
+                    raise
+
+                backoff = LLM_TRANSIENT_BACKOFF * 2 ** attempt
+                LOGGER.warning(
+                    f"Transient error for '{model}' key index {index} (async), retrying in "
+                    f"{backoff:.0f}s ({attempt + 1}/{LLM_TRANSIENT_RETRIES}). Error: {error}"
+                )
+                await asyncio.sleep(backoff)
+
     async def _agenerate(
         self,
         messages: list[BaseMessage],
@@ -159,12 +599,38 @@ class KeyRotatingChatModel(BaseChatModel):
         **kwargs: any,
     ) -> ChatResult:
         last_error: Exception | None = None
+        estimated_tokens = estimate_tokens(messages)
+        model = self.model_name_identifier
+
+        tried = set()
+
+        while len(tried) < len(self.llm_pool):
+            # the best key is the one that can go soonest, so waiting on it
+            # always beats rotating to another key
+            index, wait_time, ticket = LLM_THROTTLE.acquire(
+                model, len(self.llm_pool), estimated_tokens, tried
+            )
+
+            if wait_time > LLM_MAX_THROTTLE_WAIT:
+                LLM_THROTTLE.release(model, index, ticket)
+                raise RuntimeError(
+                    f"All remaining API keys for model '{model}' are rate limited "
+                    f"for another {wait_time:.0f}s. Last error: {last_error}"
+                )
+
+            tried.add(index)
+            llm_client = self.llm_pool[index]
+
+            if wait_time > 0:
+                LOGGER.info(f"Throttling '{model}' key index {index} for {wait_time:.1f}s")
+                LLM_THROTTLE.record_wait(model, wait_time)
+                await asyncio.sleep(wait_time)
 
-        for index, llm_client in enumerate(self.llm_pool):
             try:
-                return await llm_client._agenerate(messages, stop=stop, **kwargs)
+                return await self._asend(llm_client, index, ticket, messages, stop, **kwargs)
             
             except Exception as error:
+                LLM_THROTTLE.record_error(model, index, error)
                 action = classify_error(error)
 
                 if action == "rotate":
@@ -190,7 +656,7 @@ class KeyRotatingChatModel(BaseChatModel):
         )
     
 
-def get_llm(model_name: str, temperature: float = 0.5): 
+def build_llm(model_name: str, temperature: float = 0.5): 
     config_model = MODEL_CONFIG.get(model_name)
 
     if config_model is None:
@@ -228,7 +694,10 @@ def get_llm(model_name: str, temperature: float = 0.5):
                 config_model.get('model'),
                 model_provider=provider,
                 temperature=temperature,
-                max_retries=3,
+                # a 429 has to reach KeyRotatingChatModel to cool the key
+                # down and rotate, not be retried inside the provider SDK;
+                # transient errors are retried there (LLM_TRANSIENT_RETRIES)
+                max_retries=0,
                 api_key=api_key,
                 max_tokens=18000
             ) 
@@ -244,3 +713,65 @@ def get_llm(model_name: str, temperature: float = 0.5):
         return None
 
     return KeyRotatingChatModel(llm_pool=llm_pool, model_name_identifier=model_name)
+
+
+class LlmClientRegistry:
+    """
+    Process-wide cache of key-rotating clients keyed by (model, temperature).
+
+    Every stage asks for a client inside its model-fallback loop, several
+    times per article. Reusing the same client keeps its underlying HTTP
+    connection pools (and TLS sessions) warm instead of rebuilding the
+    provider SDK clients on every call. Clients are built lazily on first
+    use; a failed build is not cached, so the next call retries it.
+    """
+    def __init__(self):
+        self.clients: dict[tuple[str, float], KeyRotatingChatModel] = {}
+        self.created = Counter()
+        self.reused = Counter()
+        self._lock = Lock()
+
+    def get(self, model_name: str, temperature: float) -> KeyRotatingChatModel | None:
+        key = (model_name, float(temperature))
+
+        with self._lock:
+            client = self.clients.get(key)
+
+            if client is not None:
+                self.reused[key] += 1
+                return client
+
+            client = build_llm(model_name, temperature)
+
+            if client is not None:
+                self.clients[key] = client
+                self.created[key] += 1
+
+            return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self.clients = {}
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                f"{model_name}@{temperature}": {
+                    "created": self.created[(model_name, temperature)],
+                    "reused": self.reused[(model_name, temperature)],
+                }
+                for model_name, temperature in sorted({*self.created, *self.reused})
+            }
+
+    def log_stats(self) -> None:
+        for client, counts in self.stats().items():
+            LOGGER.info(
+                f"LLM client [{client}]: {counts['created']} created, {counts['reused']} reused"
+            )
+
+
+LLM_CLIENTS = LlmClientRegistry()
+
+
+def get_llm(model_name: str, temperature: float = 0.5) -> KeyRotatingChatModel | None:
+    return LLM_CLIENTS.get(model_name, temperature)
@@ -159,6 +159,16 @@ class DimensionClassification(BaseModel):
         description='Reasoning why you assign each class with that specific number'
     )
 
+
+class CombinedClassification(BaseModel):
+    """
+    Schema for classifying tags, sentiment and dimensions of a financial
+    article in a single response. Each field follows its own task's rules.
+    """
+    tags: TagsClassification = Field(description="Result of TASK 1 (tags)")
+    sentiment: SentimentClassification = Field(description="Result of TASK 2 (sentiment)")
+    dimension: DimensionClassification = Field(description="Result of TASK 3 (dimensions)")
+
 class ClassifierPrompts: 
     """
     Centralized prompt templates for better readability and maintenance.
@@ -430,6 +440,43 @@ class ClassifierPrompts:
              Ensure to return the scores dimension as a following JSON format.
             {format_instructions}
         """
+
+    @classmethod
+    def get_system_combined_prompt(cls, market: str = "idx") -> str:
+        return f"""
+            You will perform three independent classification tasks on the
+            same financial article. Apply each task's instructions only to
+            that task and return all three results together.
+
+            ===== TASK 1: TAGS =====
+            {cls.get_system_tags_prompt()}
+
+            ===== TASK 2: SENTIMENT =====
+            {cls.get_sentiment_system_prompt(market=market)}
+
+            ===== TASK 3: DIMENSIONS =====
+            {cls.get_system_dimension_prompt()}
+        """
+
+    @staticmethod
+    def get_user_combined_prompt() -> str:
+        return """
+            List of Available Tags (TASK 1 only):
+            {tags}
+
+            Article Title:
+            {title}
+
+            Article Summary:
+            {body}
+
+            For TASK 2, reason through the performance dimension, investor
+            signals, signal weight and classification decision before
+            choosing the sentiment.
+
+            Ensure the return in the following JSON format, with one object per task.
+            {format_instructions}
+        """
     
 
 class ScoringPrompts:
@@ -0,0 +1,254 @@
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import Runnable
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock
+
+from scraper_engine.config.conf import (
+    LLM_CACHE_ENABLED, LLM_CACHE_PATH, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES, MODEL_NAMES,
+)
+from .client import get_llm
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LlmResponseCache:
+    """
+    SQLite store of parsed LLM outputs, shared by every pipeline stage.
+
+    Entries are keyed by a fingerprint of the model, temperature, rendered
+    prompt messages and output schema, so any change to a prompt template or
+    parser misses the cache. Stages only store a response after they accepted
+    it, which keeps a retry after an unusable answer from replaying that
+    answer. Expired entries are dropped on read and the store is trimmed to
+    `max_entries` least-recently-used rows.
+    """
+    def __init__(self, path: str | Path, ttl: int, max_entries: int, enabled: bool = True):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = Counter()
+        self.misses = Counter()
+        self.writes = 0
+        self._connection: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+
+        return self._connection
+
+    @staticmethod
+    def fingerprint(
+        model: str,
+        temperature: float,
+        prompt: ChatPromptTemplate,
+        input_data: dict,
+        parser: JsonOutputParser,
+    ) -> str:
+        messages = [
+            (message.type, message.content)
+            for message in prompt.format_messages(**input_data)
+        ]
+        schema = parser.pydantic_object.model_json_schema() if parser.pydantic_object else None
+
+        payload = json.dumps(
+            {
+                "model": model,
+                "temperature": temperature,
+                "messages": messages,
+                "schema": schema,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, keys: list[str], namespace: str = "default") -> dict | list | None:
+        """
+        First fresh value among `keys`, in order. Stages pass one key per
+        fallback model, so an output accepted from any model is reused.
+        """
+        if not self.enabled or not keys:
+            return None
+
+        now = time.time()
+
+        with self._lock:
+            try:
+                connection = self._connect()
+                placeholders = ", ".join("?" * len(keys))
+                rows = dict(
+                    (key, (value, created_at))
+                    for key, value, created_at in connection.execute(
+                        f"SELECT key, value, created_at FROM responses WHERE key IN ({placeholders})",
+                        keys,
+                    )
+                    if now - created_at <= self.ttl
+                )
+
+                hit = next((key for key in keys if key in rows), None)
+
+                if hit is None:
+                    self.misses[namespace] += 1
+                    return None
+
+                connection.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, hit)
+                )
+                connection.commit()
+
+            except sqlite3.Error as error:
+                LOGGER.warning(f"LLM cache read failed: {error}")
+                self.misses[namespace] += 1
+                return None
+
+        self.hits[namespace] += 1
+        LOGGER.info(f"LLM cache hit [{namespace}]")
+
+        return json.loads(rows[hit][0])
+
+    def keys_for_models(
+        self,
+        models: list[str],
+        temperature: float,
+        prompt: ChatPromptTemplate,
+        input_data: dict,
+        parser: JsonOutputParser,
+    ) -> dict[str, str]:
+        if not self.enabled:
+            return {}
+
+        return {
+            model: self.fingerprint(model, temperature, prompt, input_data, parser)
+            for model in models
+        }
+
+    def set(self, key: str | None, value: dict | list, namespace: str = "default", model: str = "") -> None:
+        if not self.enabled or not key or value is None:
+            return
+
+        now = time.time()
+
+        with self._lock:
+            try:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, namespace, model, json.dumps(value, ensure_ascii=False), now, now),
+                )
+                self.writes += 1
+
+                # trimming scans the table, so do it every few hundred writes
+                if self.writes % 200 == 1:
+                    self._evict(connection, now)
+
+                connection.commit()
+
+            except sqlite3.Error as error:
+                LOGGER.warning(f"LLM cache write failed: {error}")
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+        connection.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            namespace: {
+                "hits": self.hits[namespace],
+                "misses": self.misses[namespace],
+            }
+            for namespace in sorted({*self.hits, *self.misses})
+        }
+
+    def log_stats(self) -> None:
+        for namespace, counts in self.stats().items():
+            total = counts["hits"] + counts["misses"]
+            LOGGER.info(
+                f"LLM cache [{namespace}]: {counts['hits']}/{total} hits "
+                f"({counts['hits'] / total:.0%})"
+            )
+
+
+LLM_CACHE = LlmResponseCache(LLM_CACHE_PATH, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_ENABLED)
+
+
+def cached_chain_call(
+    namespace: str,
+    prompt: ChatPromptTemplate,
+    parser: JsonOutputParser,
+    input_data: dict,
+    temperature: float,
+    call: Callable[[Runnable], dict | list | None],
+    models: list[str] = MODEL_NAMES,
+) -> dict | list | None:
+    """
+    Output of `prompt | llm | parser` from the first model in `models` whose
+    answer is accepted, or the cached output of an earlier accepted answer
+    for the same input.
+
+    `call` invokes the chain it is given and returns the output, or None to
+    move on to the next model. Both the client and the cache key are built
+    from `temperature` here, so a stage cannot look up one configuration and
+    call another.
+    """
+    cache_keys = LLM_CACHE.keys_for_models(models, temperature, prompt, input_data, parser)
+
+    if (cached := LLM_CACHE.lookup(list(cache_keys.values()), namespace)) is not None:
+        return cached
+
+    for model in models:
+        try:
+            llm = get_llm(model, temperature=temperature)
+            LOGGER.info(f"LLM used: {model}")
+
+            result = call(prompt | llm | parser)
+
+        except Exception as error:
+            LOGGER.warning(f"LLM failed with error: {error}")
+            continue
+
+        if result is None:
+            continue
+
+        LLM_CACHE.set(cache_keys.get(model), result, namespace, model)
+        return result
+
+    return None
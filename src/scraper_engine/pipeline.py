@@ -5,6 +5,9 @@ from zoneinfo import ZoneInfo
 
 from scraper_engine.base.scraper_collection import ScraperCollection
 from scraper_engine.base.scraper import SeleniumScraper
+from scraper_engine.base.url_index import KnownUrlIndex
+from scraper_engine.base.article_sink import JsonlArticleSink, iter_jsonl
+from scraper_engine.config.conf import KNOWN_URLS_RETENTION_DAYS
 
 # from scraper_engine.sources.idx.scrape_petromindo import PetromindoScraper
 # from scraper_engine.sources.idx.scrape_insight_kontan import InsightKontanScraper
@@ -45,6 +48,24 @@ def setup_logging():
     )
 
 
+def write_last_state(path: Path, **state) -> None:
+    with path.open('w') as file:
+        json.dump(state, file)
+
+
+def start_run(path: Path, last_state: dict, now: datetime, resume: bool) -> str:
+    """
+    Notes the start of a scrape as pending. last_run_at (and with it the
+    next run's filter_from) only moves once the scrape finished, so a run
+    that crashed, and its --resume, still filter from the previous run. A
+    resumed run keeps the start time of the run it continues.
+    """
+    run_at = (resume and last_state.get("pending_run_at")) or now.isoformat()
+    write_last_state(path, last_run_at=last_state.get("last_run_at"), pending_run_at=run_at)
+
+    return run_at
+
+
 app = typer.Typer(
     help='A CLI for managing scraper News',
     no_args_is_help=True
@@ -138,12 +159,16 @@ def main_idx(
     process_only: Annotated[bool, typer.Option(help="Only process, don't scrape")] = False,
     table_name: Annotated[str, typer.Option(help="Table name to push into db")] = 'idx_news',
     source_scraper: Annotated[str, typer.Option(help="Source scraper to define score prompt criteria")] = 'idx',
-    date:  Annotated[Optional[str], typer.Option(help="End date: YYYYMMDD")] = None
+    date:  Annotated[Optional[str], typer.Option(help="End date: YYYYMMDD")] = None,
+    workers: Annotated[int, typer.Option(help="Scraper worker threads (1 runs sources serially)")] = 1,
+    resume: Annotated[bool, typer.Option(help="Keep the sources an interrupted scrape already wrote")] = False,
+    concurrency: Annotated[int, typer.Option(help="Articles processed concurrently (1 processes serially)")] = 1
 ):
     """
     Main function to run the scraper collection (IDX News) and post results.
     """
     last_state_path = Path('data/last_state.json')
+    known_urls_path = Path('data/known_urls.json')
 
     last_state = {}
     try:
@@ -192,8 +217,12 @@ def main_idx(
         financedetik = FinanceDetik()
         kontankeuangan = KontanKeuangan()
 
+        # backfills of an explicit date rescrape everything; scheduled runs
+        # stop paginating once a page only holds already handed-over articles
+        known_urls = None if date else KnownUrlIndex.load(known_urls_path, KNOWN_URLS_RETENTION_DAYS)
+
         try:
-            scrapercollection = ScraperCollection()
+            scrapercollection = ScraperCollection(known_urls)
             # scrapercollection.add_scraper(petromindoscraper)
             # scrapercollection.add_scraper(idnbusinesspostscraper)
             # scrapercollection.add_scraper(insightkontanscraper) 
@@ -221,19 +250,22 @@ def main_idx(
             scrapercollection.add_scraper(financedetik)
             scrapercollection.add_scraper(kontankeuangan)
 
-            with last_state_path.open('w') as file:
-                json.dump({"last_run_at": datetime.now(wib).isoformat()}, file)
+            run_at = start_run(last_state_path, last_state, datetime.now(wib), resume)
+            output_path = Path(f'data/{source_scraper}/{filename}.jsonl')
 
-            scrapercollection.run_all(page_number, date, filter_from)
-            
-            all_articles = scrapercollection.articles
+            with JsonlArticleSink(output_path, resume=resume) as sink:
+                scrapercollection.run_all(page_number, date, filter_from, max_workers=workers, sink=sink)
 
-            scrapercollection.write_json(all_articles, source_scraper, filename)
+            write_last_state(last_state_path, last_run_at=run_at)
 
             if csv:
-                scrapercollection.write_csv(all_articles, source_scraper, filename)
+                scrapercollection.write_csv(list(iter_jsonl(output_path)), source_scraper, filename)
 
         finally:
+            # only sources already on disk are recorded, so this is safe after a crash too
+            if known_urls is not None:
+                known_urls.save()
+
             SeleniumScraper.close_shared_driver()
 
     # scrape-only: the work-list is built and committed nothing to process yet
@@ -263,6 +295,7 @@ def main_idx(
         table_name,
         source_scraper,
         filter_from,
+        concurrency=concurrency,
     )
 
 
@@ -277,12 +310,16 @@ def main_sgx(
     process_only: Annotated[bool, typer.Option(help="Only process, don't scrape")] = False,
     table_name: Annotated[str, typer.Option(help="Table name to push into db")] = 'sgx_news',
     source_scraper: Annotated[str, typer.Option(help="Source scraper to define score prompt criteria")] = 'sgx',
-    date:  Annotated[Optional[str], typer.Option(help="End date: YYYYMMDD")] = None
+    date:  Annotated[Optional[str], typer.Option(help="End date: YYYYMMDD")] = None,
+    workers: Annotated[int, typer.Option(help="Scraper worker threads (1 runs sources serially)")] = 1,
+    resume: Annotated[bool, typer.Option(help="Keep the sources an interrupted scrape already wrote")] = False,
+    concurrency: Annotated[int, typer.Option(help="Articles processed concurrently (1 processes serially)")] = 1
 ):
     """
     Main function to run the scraper collection (SGX News) and post results.
     """
     last_state_path = Path('data/last_state_sgx.json')
+    known_urls_path = Path('data/known_urls_sgx.json')
 
     last_state = {}
     try:
@@ -317,8 +354,12 @@ def main_sgx(
         sgx_market_updates = SGXMarketUpdates()
         smallcapasia_scraper = SmallCapAsia()
 
+        # backfills of an explicit date rescrape everything; scheduled runs
+        # stop paginating once a page only holds already handed-over articles
+        known_urls = None if date else KnownUrlIndex.load(known_urls_path, KNOWN_URLS_RETENTION_DAYS)
+
         try:
-            scrapercollection = ScraperCollection()
+            scrapercollection = ScraperCollection(known_urls)
             scrapercollection.add_scraper(businesstimesscraper)
             scrapercollection.add_scraper(straitstimesscraper)
             scrapercollection.add_scraper(channelnewsasiascraper)
@@ -332,19 +373,22 @@ def main_sgx(
             scrapercollection.add_scraper(sgx_market_updates)
             scrapercollection.add_scraper(smallcapasia_scraper)
 
-            with last_state_path.open('w') as file:
-                json.dump({"last_run_at": datetime.now(sgt).isoformat()}, file)
+            run_at = start_run(last_state_path, last_state, datetime.now(sgt), resume)
+            output_path = Path(f'data/{source_scraper}/{filename}.jsonl')
 
-            scrapercollection.run_all(page_number, date, filter_from)
+            with JsonlArticleSink(output_path, resume=resume) as sink:
+                scrapercollection.run_all(page_number, date, filter_from, max_workers=workers, sink=sink)
 
-            all_articles = scrapercollection.articles
-
-            scrapercollection.write_json(all_articles, source_scraper, filename)
+            write_last_state(last_state_path, last_run_at=run_at)
 
             if csv:
-                scrapercollection.write_csv(all_articles, source_scraper, filename)
+                scrapercollection.write_csv(list(iter_jsonl(output_path)), source_scraper, filename)
 
         finally:
+            # only sources already on disk are recorded, so this is safe after a crash too
+            if known_urls is not None:
+                known_urls.save()
+
             SeleniumScraper.close_shared_driver()
 
     # scrape-only: the work-list is built and committed nothing to process yet
@@ -373,7 +417,8 @@ def main_sgx(
         batch_size, 
         table_name, 
         source_scraper, 
-        filter_from
+        filter_from,
+        concurrency=concurrency,
     )
 
 
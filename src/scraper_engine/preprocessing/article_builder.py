@@ -1,5 +1,4 @@
 from datetime import datetime
-from rapidfuzz import fuzz, process
 
 from .models import News 
 from .article_fetcher import get_article_body
@@ -8,21 +7,16 @@ from .scorer import get_article_score
 from scraper_engine.database.metadata import (
     get_sectors_data, 
     get_sectors_data_sgx, 
-    build_ticker_index, 
-    build_sgx_ticker_index,
     load_company_data_idx,
     load_company_data_sgx,
     load_subsector_data_idx,
     load_subsector_data_sgx,
 )
 from .classifier import NewsClassifier
-from .company_extractor import extract_company_name 
-from .utils.article_helpers import (
-    clean_article,
-    is_raw_ticker,
-    normalize_idx_company_name,
-    normalize_sgx_company_name,
-)
+from .company_extractor import extract_company_name
+from .company_gazetteer import confident_tickers
+from .ticker_matcher import get_ticker_matcher
+from .utils.article_helpers import clean_article
 
 import logging
 
@@ -36,71 +30,11 @@ def matching_company_name(
     score_threshold: int = 85,
     short_query_threshold: int = 6,
 ) -> list[str]:
-    seen = set()
-    matched = []
-    
-    ticker_index = (
-        build_sgx_ticker_index()
-        if source_scraper == 'sgx'
-        else build_ticker_index()
+    return get_ticker_matcher(source_scraper).match(
+        company_extracted,
+        score_threshold=score_threshold,
+        short_query_threshold=short_query_threshold,
     )
-    min_key_length = 5 if source_scraper == 'idx' else 2 
-    normalized_funct = normalize_sgx_company_name if source_scraper == 'sgx' else normalize_idx_company_name
-
-    name_candidates = {
-        key: value
-        for key, value in ticker_index.items()
-        if len(key) >= min_key_length
-    }
-
-    ticker_candidates = {
-        value.lower().replace('.jk', '').strip(): value
-        for value in ticker_index.values()
-    }
-
-    for company in company_extracted:
-        ticker_found = None
-
-        if is_raw_ticker(company):
-            query = company.lower().strip()
-            scorer = fuzz.ratio
-            cutoff = 95
-            candidates = ticker_candidates
-
-        else:
-            normalized = normalized_funct(company)
-            query = normalized
-
-            if len(normalized) < short_query_threshold:
-                scorer = fuzz.ratio
-                cutoff = 90
-
-            else:
-                scorer = fuzz.token_set_ratio
-                cutoff = score_threshold
-
-            candidates = name_candidates
-
-        result = process.extractOne(
-            query,
-            candidates.keys(),
-            scorer=scorer,
-            score_cutoff=cutoff,
-        )
-
-        if result:
-            matched_key, score, _ = result
-            ticker_found = candidates[matched_key]
-            LOGGER.info(f"input: {query!r} -> matched: {matched_key!r} (score={score}) -> {ticker_found}")
-        
-        else:
-            LOGGER.info(f"input: {query!r} -> no match above threshold")
-
-        if ticker_found and ticker_found not in seen:
-            seen.add(ticker_found)
-            matched.append(ticker_found)
-
-    return matched
 
 
 def post_processing(
@@ -127,22 +61,15 @@ def post_processing(
         tags.append(sentiment)
         
     # Get tickers 
-    checked_tickers = []
+    checked_tickers = confident_tickers(body, source_scraper)
 
-    if source_scraper == 'sgx':
-        company_extracted = extract_company_name(body, source_scraper)
+    if checked_tickers is None:
+        checked_tickers = []
+        company_extracted = extract_company_name(body, source_scraper) or []
         LOGGER.info(f'raw company: {company_extracted}')
 
         if company_extracted:
-            matched_tickers = matching_company_name(company_extracted, source_scraper='sgx') 
-            checked_tickers = list(matched_tickers)
-
-    else: 
-        company_extracted = extract_company_name(body, source_scraper) or []
-
-        if company_extracted: 
-            matched_tickers = matching_company_name(company_extracted, source_scraper='idx')
-            checked_tickers = list(matched_tickers)
+            checked_tickers = matching_company_name(company_extracted, source_scraper=source_scraper)
 
     # Sub sector
     sub_sector = []
@@ -196,8 +123,9 @@ def summarize_and_score(
     source_scraper: str,
     title: str,
     prefetched_body: str | None = None,
+    html_ref: str | None = None,
 ) -> tuple[str, str, int]:
-    article = prefetched_body or clean_article(get_article_body(source))
+    article = prefetched_body or clean_article(get_article_body(source, html_ref))
 
     if not article:
         return None
@@ -244,7 +172,8 @@ def generate_article(
             timestamp, 
             source_scraper,
             title=data.get('title'),
-            prefetched_body=data.get('article')
+            prefetched_body=data.get('article'),
+            html_ref=data.get('html_ref'),
         )
 
         if not summary_score_result:
@@ -1,27 +1,59 @@
-from bs4 import BeautifulSoup
-from goose3 import Goose
 from io import StringIO
 from scrapling import Fetcher, DynamicFetcher
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
-from scraper_engine.config.conf import PROXY, USER_AGENT
+from scraper_engine.config.conf import (
+    PROXY, USER_AGENT, HTML_CACHE_ARTICLE_TTL,
+    EXTRACTION_MODE, EXTRACTION_HEDGE_DELAY, EXTRACTION_RACE_WORKERS,
+)
 from scraper_engine.base.scraper import SeleniumScraper, Scraper
+from scraper_engine.base.html_cache import HTML_CACHE
+from scraper_engine.base.proxy_session import PROXY_SESSIONS
+from scraper_engine.base.tier_router import TIER_ROUTER
+from scraper_engine.base.body_store import BODY_STORE
+from scraper_engine.base.content_extractor import EXTRACTOR_POOL
+from scraper_engine.base.html_parser import make_soup
 
 import requests
 import re
-import cloudscraper
 import logging
 import csv
+import time
 
 
 LOGGER = logging.getLogger(__name__)
 
+BLOCKED_PAGE_PHRASES = (
+    "has banned the autonomous system",
+    "error 1005",
+    "cloudflare",
+    "your ip address is in",
+    "developers.cloudflare.com/support/troubleshooting",
+    "please wait while your request is being verified",
+)
+
+# block and challenge pages are short; a longer body that mentions one of
+# the phrases (e.g. a news story about Cloudflare) is a real article
+BLOCKED_PAGE_MAX_LENGTH = 2000
+
+# tiers without a browser or a paid proxy, raced first in "race" mode
+CHEAP_TIERS = ("scrapling", "cloudscraper")
+
+RACE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=EXTRACTION_RACE_WORKERS,
+    thread_name_prefix="extraction-race",
+)
+
+
+def is_blocked_page(text: str) -> bool:
+    lowered = text.lower()
+    return any(phrase in lowered for phrase in BLOCKED_PAGE_PHRASES)
+
 
 def fetch_article_with_proxy(target_url: str) -> str:
-    proxy_configuration = {
-        "http": PROXY,
-        "https": PROXY
-    }
-    
+    if cached_html := HTML_CACHE.get_text(target_url, HTML_CACHE_ARTICLE_TTL, "article_fetcher"):
+        return cached_html
+
     headers = {
         "User-Agent": USER_AGENT
     }
@@ -29,16 +61,16 @@ def fetch_article_with_proxy(target_url: str) -> str:
     try:
         LOGGER.info(f"Routing {target_url} through proxy")
         
-        response = requests.get(
+        response = PROXY_SESSIONS.get(
             target_url, 
-            proxies=proxy_configuration, 
+            PROXY, 
             headers=headers, 
-            verify=False, 
-            timeout=60 
+            source="article_fetcher",
         )
         
         if response.status_code == 200:
             LOGGER.info("[SUCCESS] Web Unlocker with proxy")
+            HTML_CACHE.set(target_url, response.text)
             return response.text
         
         elif response.status_code == 403:
@@ -63,7 +95,7 @@ def get_article_bca_news(url: str) -> str:
         response = requests.get(url, headers=headers)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(response.text)
         
         title_tag = soup.find('h1')
         title = title_tag.get_text(strip=True) if title_tag else None
@@ -109,7 +141,7 @@ def get_article_bloomberg_technoz_news(url: str) -> str:
                 LOGGER.info(f"[FAIL] Server returned status code: {response.status_code} for URL: {url}")
                 break
                 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text)
             article_container = soup.find("div", class_="detail-in")
             
             if article_container:
@@ -148,7 +180,7 @@ def get_article_investorid_news(url: str) -> str:
         LOGGER.info(f"[FAIL INVESTOR.ID] Proxy failed to retrieve HTML for {url}")
         return ""
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = make_soup(html_content)
     
     article_container = soup.select_one("div.body-content")
     
@@ -174,7 +206,7 @@ def get_article_kontan_news(url: str) -> str:
         LOGGER.warning(f"[FAIL INVESTASI KONTAN] Proxy failed to retrieve HTML for {url}")
         return ""
         
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = make_soup(html_content)
 
     article_container = soup.find('div', class_='tmpt-desk-kon')
     
@@ -208,6 +240,7 @@ def get_article_kontan_news(url: str) -> str:
 
 def get_article_edgeprop_news(url: str) -> str | None:
     scraper = Scraper()
+    scraper.cache_ttl = HTML_CACHE_ARTICLE_TTL
     soup = scraper.fetch_news(url)
 
     content_div = soup.select_one("#detail-content")
@@ -246,11 +279,16 @@ def get_article_edgeprop_news(url: str) -> str | None:
 
 def get_article_sgx_market_update(url: str) -> str | None:
     selenium_scraper = SeleniumScraper()
+    selenium_scraper.cache_ttl = HTML_CACHE_ARTICLE_TTL
 
-    soup = selenium_scraper.fetch_news_with_selenium(
-        url,
-        wait_selector="article#page-container .template-article-section",
-    )
+    try:
+        soup = selenium_scraper.fetch_news_with_selenium(
+            url,
+            wait_selector="article#page-container .template-article-section",
+        )
+
+    finally:
+        selenium_scraper.release_driver()
 
     if not soup:
         LOGGER.warning("[SGX] Failed to render market update: %s", url)
@@ -284,7 +322,7 @@ def extract_table_content(url: str) -> str:
     res = requests.get(url, headers=headers)
     res.raise_for_status()
 
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = make_soup(res.text)
      
     content_buffer = []
     
@@ -327,7 +365,7 @@ def extract_table_content(url: str) -> str:
         try:
             response = requests.get(src, timeout=5)
             if response.status_code == 200:
-                iframe_soup = BeautifulSoup(response.text, 'html.parser')
+                iframe_soup = make_soup(response.text)
                 
                 # Datawrapper usually puts the title in the <title> tag
                 title = iframe_soup.title.string if iframe_soup.title else ""
@@ -372,24 +410,27 @@ def extract_via_custom_parser(url: str) -> str | None:
 def extract_via_scrapling(url: str) -> str | None:
     try:
         LOGGER.info("[TIER 1] Attempting extraction via Scrapling")
-        response = Fetcher.get(url, stealthy_headers=True, impersonate="chrome")
+        body = HTML_CACHE.get(url, HTML_CACHE_ARTICLE_TTL, "article_fetcher")
 
-        if response.status != 200:
-            LOGGER.warning("[TIER 1] Non-200 status %d for %s", response.status, url)
-            return None
+        if body is None:
+            response = Fetcher.get(url, stealthy_headers=True, impersonate="chrome")
 
-        body = bytes(response.body)
+            if response.status != 200:
+                LOGGER.warning("[TIER 1] Non-200 status %d for %s", response.status, url)
+                return None
 
-        if b"Please wait while your request is being verified" in body:
-            LOGGER.info("[TIER 1] Challenge page detected, falling back to DynamicFetcher")
-            
-            dynamic_response = DynamicFetcher.fetch(url, headless=True)
-            body = bytes(dynamic_response.body)
+            body = bytes(response.body)
 
-        goose_extractor = Goose({"browser_user_agent": USER_AGENT})
-        article_data = goose_extractor.extract(raw_html=body)
+            if b"Please wait while your request is being verified" in body:
+                LOGGER.info("[TIER 1] Challenge page detected, falling back to DynamicFetcher")
+                
+                dynamic_response = DynamicFetcher.fetch(url, headless=True)
+                body = bytes(dynamic_response.body)
+
+            # block and challenge pages are refused by the cache
+            HTML_CACHE.set(url, body)
 
-        return article_data.cleaned_text or None
+        return EXTRACTOR_POOL.extract(body, url)
 
     except Exception as error:
         LOGGER.error("[TIER 1] Scrapling extraction failed for %s: %s", url, error)
@@ -399,16 +440,18 @@ def extract_via_scrapling(url: str) -> str | None:
 def extract_via_cloudscraper(url: str) -> str | None: 
     try:
         LOGGER.info(f"[TIER 2] Attempting fast extraction (No Proxy)")
-        scraper_session = cloudscraper.create_scraper() 
-        goose_extractor = Goose(
-            {'browser_user_agent': USER_AGENT, 'http_session': scraper_session}
+        response = EXTRACTOR_POOL.http_session().get(
+            url, headers={"User-Agent": USER_AGENT}, timeout=30
         )
 
-        article_data = goose_extractor.extract(url=url)
+        if not response.ok:
+            LOGGER.warning(f"[TIER 2] Non-200 status {response.status_code} for {url}")
+            return None
+
+        extracted_text = EXTRACTOR_POOL.extract(response.content, url)
         
-        if article_data and article_data.cleaned_text:
+        if extracted_text:
             LOGGER.info(f"[SUCCESS] Extracted via Cloudscraper + Goose: {url}")
-            extracted_text = article_data.cleaned_text
             
             if 'www.straitstimes' in url:
                 extracted_text = extracted_text.replace("Sign up now: Get ST's newsletters delivered to your inbox", "")
@@ -424,30 +467,19 @@ def extract_via_selenium(url: str) -> str | None:
     try:
         LOGGER.info(f"[TIER 2] Attempting Selenium extraction (No Proxy)")
         selenium_scraper = SeleniumScraper()
-        soup_result = selenium_scraper.fetch_news_with_selenium(url)
+        selenium_scraper.cache_ttl = HTML_CACHE_ARTICLE_TTL
 
-        if soup_result:
-            raw_html_content = str(soup_result)
+        try:
+            soup_result = selenium_scraper.fetch_news_with_selenium(url)
+
+        finally:
+            selenium_scraper.release_driver()
 
-            goose_extractor = Goose()
-            article_data = goose_extractor.extract(raw_html=raw_html_content)
+        if soup_result:
+            article_extracted = EXTRACTOR_POOL.extract(None, url, soup_result)
             
-            if article_data and article_data.cleaned_text:
-                LOGGER.info(f"[SUCCESS] Extracted via Selenium + Goose: {url}")
-                article_extracted = article_data.cleaned_text
-                
-                blocked_phrases = (
-                    "has banned the autonomous system",
-                    "error 1005",
-                    "cloudflare",
-                    "your ip address is in",
-                    "developers.cloudflare.com/support/troubleshooting",
-                )
-
-                if any(
-                    phrase in article_extracted.lower()
-                    for phrase in blocked_phrases
-                ):
+            if article_extracted:
+                if is_blocked_page(article_extracted):
                     LOGGER.warning(
                         "[BLOCKED] Selenium reached a Cloudflare block page."
                     )
@@ -484,32 +516,147 @@ def extract_via_proxy(url: str) -> str | None:
             LOGGER.warning(f"[FAIL] Proxy network request failed for {url}")
             return None
             
-        goose_extractor = Goose()
-        article_data = goose_extractor.extract(raw_html=raw_html_content)
+        extracted_text = EXTRACTOR_POOL.extract(raw_html_content, url)
 
-        if article_data and article_data.cleaned_text:
+        if extracted_text:
             LOGGER.info(f"[SUCCESS] Extracted via Proxy + Goose: {url}")
-            return article_data.cleaned_text
+            return extracted_text
 
     except Exception as error:
         LOGGER.error(f"[FAIL] Tier 3 Proxy extraction failed: {error}")
         return None
 
 
-def get_article_body(url: str) -> str | None:
+EXTRACTION_TIERS = {
+    "scrapling": extract_via_scrapling,
+    "cloudscraper": extract_via_cloudscraper,
+    "selenium": extract_via_selenium,
+    "proxy": extract_via_proxy,
+}
+
+
+def extract_from_handover(html_ref: str) -> str | None:
+    """
+    Body of a detail page the scraper already loaded during ingestion (see
+    Scraper.attach_page_refs), read from the HTML cache instead of the network.
+    """
+    try:
+        raw_html_content = HTML_CACHE.get(html_ref, HTML_CACHE_ARTICLE_TTL, "handover")
+
+        if not raw_html_content:
+            return None
+
+        extracted_text = EXTRACTOR_POOL.extract(raw_html_content, html_ref)
+
+        if not extracted_text:
+            return None
+
+        if len(extracted_text) < BLOCKED_PAGE_MAX_LENGTH and is_blocked_page(extracted_text):
+            return None
+
+        LOGGER.info(f"[SUCCESS] Extracted from the page loaded during scraping: {html_ref}")
+        return extracted_text
+
+    except Exception as error:
+        LOGGER.error(f"[FAIL] Cached page extraction failed for {html_ref}: {error}")
+        return None
+
+
+def run_tier(url: str, tier: str) -> str | None:
+    started_at = time.perf_counter()
+
+    try:
+        extracted_text = EXTRACTION_TIERS[tier](url)
+
+    except Exception as error:
+        LOGGER.error(f"[FAIL] Tier {tier} raised for {url}: {error}")
+        extracted_text = None
+
+    if (
+        extracted_text
+        and len(extracted_text) < BLOCKED_PAGE_MAX_LENGTH
+        and is_blocked_page(extracted_text)
+    ):
+        LOGGER.warning(f"[BLOCKED] Tier {tier} returned a block page for {url}")
+        extracted_text = None
+
+    TIER_ROUTER.record(url, tier, bool(extracted_text), time.perf_counter() - started_at)
+    return extracted_text
+
+
+def ladder_tiers(url: str) -> tuple[str, str] | None:
+    for tier in TIER_ROUTER.order(url, list(EXTRACTION_TIERS)):
+        if extracted_text := run_tier(url, tier):
+            return extracted_text, tier
+
+    return None
+
+
+def race_tiers(url: str) -> tuple[str, str] | None:
+    """
+    Runs the cheap tiers (and the domain's learned best tier) at once and
+    starts the remaining browser/proxy tiers after EXTRACTION_HEDGE_DELAY,
+    or as soon as the first wave has failed. The first usable body wins.
+
+    Tiers that have not started are cancelled; a tier already running cannot
+    be interrupted, so it finishes in the background within its own timeouts
+    and only its outcome is recorded for routing.
+    """
+    order = TIER_ROUTER.order(url, list(EXTRACTION_TIERS))
+    first_wave = [tier for tier in order if tier in CHEAP_TIERS or tier == order[0]]
+    hedged = [tier for tier in order if tier not in first_wave]
+
+    pending = {RACE_EXECUTOR.submit(run_tier, url, tier): tier for tier in first_wave}
+    hedge_at = time.monotonic() + EXTRACTION_HEDGE_DELAY
+
+    try:
+        while pending or hedged:
+            if hedged and (not pending or time.monotonic() >= hedge_at):
+                LOGGER.info(f"[RACE] Hedging with {', '.join(hedged)} for {url}")
+
+                for tier in hedged:
+                    pending[RACE_EXECUTOR.submit(run_tier, url, tier)] = tier
+
+                hedged = []
+
+            timeout = max(0.0, hedge_at - time.monotonic()) if hedged else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                tier = pending.pop(future)
+
+                if extracted_text := future.result():
+                    LOGGER.info(f"[RACE] {tier} won for {url}")
+                    return extracted_text, tier
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+    return None
+
+
+def get_article_body(url: str, html_ref: str | None = None) -> str | None:
+    if stored := BODY_STORE.get(url):
+        return stored[0]
+
     if extracted_text := extract_via_custom_parser(url):
+        BODY_STORE.set(url, extracted_text, "custom")
         return extracted_text 
 
-    if extracted_text := extract_via_scrapling(url):
-        return extracted_text 
-    
-    if extracted_text := extract_via_cloudscraper(url):
-        return extracted_text 
- 
-    if extracted_text := extract_via_selenium(url):
-        return extracted_text 
+    if html_ref and (extracted_text := extract_from_handover(html_ref)):
+        BODY_STORE.set(url, extracted_text, "handover")
+        return extracted_text
+
+    if EXTRACTION_MODE == "race":
+        result = race_tiers(url)
+
+    else:
+        result = ladder_tiers(url)
 
-    if extracted_text := extract_via_proxy(url):
+    if result:
+        extracted_text, tier = result
+        BODY_STORE.set(url, extracted_text, tier)
         return extracted_text 
 
     LOGGER.info(f"[FATAL] All extraction tiers failed to retrieve body for: {url}")
@@ -2,31 +2,103 @@ from langchain_core.output_parsers import JsonOutputParser
 from typing import Optional, Union
 from langchain.prompts import ChatPromptTemplate
 
-from scraper_engine.llm.client import get_llm
+from scraper_engine.llm.client import invoke_llm
 from scraper_engine.llm.prompts import (
     ClassifierPrompts, 
     TagsClassification, 
     SubsectorClassification, 
     SentimentClassification, 
     DimensionClassification, 
+    CombinedClassification,
 )
-from scraper_engine.config.conf import MODEL_NAMES
+from scraper_engine.llm.response_cache import cached_chain_call
+from scraper_engine.config.conf import CLASSIFICATION_MODE
 from scraper_engine.database.metadata import (
     load_subsector_data_idx as load_subsector_data_idx_from_metadata,
     load_subsector_data_sgx as load_subsector_data_sgx_from_metadata,
     load_tag_data as load_tag_data_from_metadata,
 )
 
+from concurrent.futures import ThreadPoolExecutor
+
 import logging 
-import time 
 
 
 LOGGER = logging.getLogger(__name__)
 
+CLASSIFICATION_HEADS = ("tags", "sentiment", "dimension")
+
 
 class NewsClassifier:
-    def __init__(self):
+    def __init__(self, mode: str | None = None):
         self.prompts = ClassifierPrompts()
+        self.mode = mode or CLASSIFICATION_MODE
+        # extra LangChain callbacks for every call (e.g. token accounting)
+        self.callbacks = []
+
+    @staticmethod
+    def _parse_result(
+        category: str, 
+        result: dict, 
+        tags: list[dict]
+    ) -> Optional[Union[list[str], str, dict[str, Optional[int]]]]:
+        """
+        Maps a raw LLM response to the category's value; None means the
+        response was unusable and the next model should be tried.
+        """
+        # Return based on category type             
+        if category == "combined":
+            # a head the model left out is a failed response, not an empty one
+            if any(not isinstance(result.get(head), dict) for head in CLASSIFICATION_HEADS):
+                return None
+
+            heads = tuple(
+                NewsClassifier._parse_result(head, result[head], tags)
+                for head in CLASSIFICATION_HEADS
+            )
+
+            return None if any(head is None for head in heads) else heads
+
+        elif category == "tags":                      
+            result_output = result.get("tags", [])
+            reason = result.get('reason')
+
+            LOGGER.info('reason tags: %s', reason)
+
+            tags = [tag.get('name') for tag in tags]
+
+            seen = set()
+            check_tags = []
+
+            for tag in result_output:
+                if tag in tags and tag not in seen:
+                    seen.add(tag)
+                    check_tags.append(tag) 
+
+            return check_tags
+
+        elif category == "subsectors":
+            sub_sector = result.get("subsector", "")
+            reasoning = result.get('reasoning')
+
+            if len(sub_sector) >= 10:
+                return None
+
+            LOGGER.info('Reasoning subsector: %s', reasoning)
+
+            return sub_sector
+
+        elif category == "sentiment":
+            LOGGER.info('Reason sentiment: %s', result.get('reasoning'))
+            return result.get("sentiment", "Not Applicable")
+
+        elif category == "dimension":
+            result.pop("reasoning", None)
+
+            if isinstance(result, dict):
+                return result
+
+        return None
 
     def _classify_data(
         self, 
@@ -51,6 +123,10 @@ class NewsClassifier:
             "dimension": {
                 'system_prompt': self.prompts.get_system_dimension_prompt(),
                 'user_prompt': self.prompts.get_user_dimension_prompt()
+            },
+            "combined": {
+                'system_prompt': self.prompts.get_system_combined_prompt(market=source_scraper),
+                'user_prompt': self.prompts.get_user_combined_prompt()
             }
         }
 
@@ -69,7 +145,8 @@ class NewsClassifier:
             "tags": TagsClassification,
             "subsectors": SubsectorClassification,
             "sentiment": SentimentClassification,
-            "dimension": DimensionClassification
+            "dimension": DimensionClassification,
+            "combined": CombinedClassification
         }
 
         # Create Parser
@@ -86,7 +163,7 @@ class NewsClassifier:
         
         format_instructions = classifier_parser.get_format_instructions()
         
-        if category == "tags":
+        if category in ("tags", "combined"):
             input_data = {
                 "title": title, 
                 "body": body, 
@@ -109,67 +186,27 @@ class NewsClassifier:
                 "format_instructions": format_instructions
             }
 
-        for model in MODEL_NAMES:
-            try:
-                llm = get_llm(model, temperature=0.4)
-                LOGGER.info(f'LLM used: {model}')
-
-                classifier_chain = prompt | llm | classifier_parser
-
-                result = classifier_chain.invoke(input_data)
-
-                time.sleep(8)
-
-                if result is None : 
-                    LOGGER.warning(f"API call failed for category: {category}. trying next LLM.")
-                    continue 
-
-                # Return based on category type             
-                if category == "tags":                      
-                    result_output = result.get("tags", [])
-                    reason = result.get('reason')
-
-                    LOGGER.info('reason tags: %s', reason)
-
-                    tags = [tag.get('name') for tag in tags]
-                    
-                    seen = set()
-                    check_tags = []
-
-                    for tag in result_output:
-                        if tag in tags and tag not in seen:
-                            seen.add(tag)
-                            check_tags.append(tag) 
-
-                    return check_tags
-                
-                elif category == "subsectors":
-                    sub_sector = result.get("subsector", "")
-                    reasoning = result.get('reasoning')
-
-                    if len(sub_sector) >= 10:
-                        continue 
-                    
-                    LOGGER.info('Reasoning subsector: %s', reasoning)
-
-                    return sub_sector
-                
-                elif category == "sentiment":
-                    LOGGER.info('Reason sentiment: %s', result.get('reasoning'))
-                    return result.get("sentiment", "Not Applicable")
-                
-                elif category == "dimension":
-                    result.pop("reasoning", None)
-
-                    if isinstance(result, dict):
-                        return result
-
-            except Exception as error:
-                LOGGER.error(f"[ERROR] LLM failed classified with error: {error}", exc_info=True)
-                continue
-            
-        LOGGER.error(f"All LLMs failed for category '{category}'.")
-        return None
+        def call(classifier_chain):
+            result = invoke_llm(classifier_chain, input_data, config={"callbacks": self.callbacks})
+
+            if result is None : 
+                LOGGER.warning(f"API call failed for category: {category}. trying next LLM.")
+                return None 
+
+            if self._parse_result(category, result, tags) is None:
+                return None
+
+            return result
+
+        result = cached_chain_call(
+            f"classify_{category}", prompt, classifier_parser, input_data, 0.4, call
+        )
+
+        if result is None:
+            LOGGER.error(f"All LLMs failed for category '{category}'.")
+            return None
+
+        return self._parse_result(category, result, tags)
 
     def classify_article(
         self, 
@@ -177,10 +214,26 @@ class NewsClassifier:
         body: str, 
         source_scraper: str
     ) -> tuple[list[str], str, dict[str, Optional[int]]]:
-        tags = self._classify_data(body, "tags", source_scraper, title)
-        # subsector = self._classify_data_async(body, "subsectors", title)
-        sentiment = self._classify_data(body, "sentiment", source_scraper, title)
-        dimension = self._classify_data(body, "dimension", source_scraper, title)
+        if self.mode == "combined":
+            combined = self._classify_data(body, "combined", source_scraper, title)
+
+            if combined is not None:
+                return combined
+
+            LOGGER.warning("Combined classification failed, falling back to one call per head.")
+
+        if self.mode in ("parallel", "combined"):
+            with ThreadPoolExecutor(max_workers=len(CLASSIFICATION_HEADS)) as executor:
+                tags, sentiment, dimension = executor.map(
+                    lambda category: self._classify_data(body, category, source_scraper, title),
+                    CLASSIFICATION_HEADS,
+                )
+
+        else:
+            tags = self._classify_data(body, "tags", source_scraper, title)
+            # subsector = self._classify_data_async(body, "subsectors", title)
+            sentiment = self._classify_data(body, "sentiment", source_scraper, title)
+            dimension = self._classify_data(body, "dimension", source_scraper, title)
 
         # Check for ANY failure: either an unexpected Exception OR None signal
         results = [tags, sentiment, dimension]
@@ -1,29 +1,54 @@
 from langchain.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
-from scraper_engine.llm.client import get_llm
+from scraper_engine.llm.client import invoke_llm
 from scraper_engine.llm.prompts import EntityExtractionPrompts, CompanyNameExtraction
-from scraper_engine.config.conf import MODEL_NAMES
+from scraper_engine.llm.response_cache import cached_chain_call
+from scraper_engine.config.conf import SGX_COMPANY_PREFILTER, SGX_COMPANY_MAX_CANDIDATES
 from scraper_engine.database.metadata import load_company_data_sgx
+from .company_gazetteer import get_company_gazetteer
 
 import logging 
 
 
 LOGGER = logging.getLogger(__name__)
 
+_SGX_COMPANY_NAMES: str | None = None
+
 
 def load_sgx_company_data(): 
-    company = load_company_data_sgx()
+    global _SGX_COMPANY_NAMES
+
+    if _SGX_COMPANY_NAMES is None:
+        company = load_company_data_sgx()
+
+        companies_name = []
+
+        for _, value in company.items(): 
+            company_name = value.get('name')
+            companies_name.append(company_name)
+
+        _SGX_COMPANY_NAMES = ', '.join(companies_name)
+
+    return _SGX_COMPANY_NAMES
+
 
-    companies_name = []
+def sgx_company_names_for(body: str) -> str:
+    """
+    Listed companies to show the LLM for name resolution: only the ones the
+    gazetteer finds in the article, or the full list when prefiltering is off
+    or the gazetteer finds none (the article may name a company in a way it
+    does not know).
+    """
+    if not SGX_COMPANY_PREFILTER:
+        return load_sgx_company_data()
 
-    for _, value in company.items(): 
-        company_name = value.get('name')
-        companies_name.append(company_name)
+    candidates = get_company_gazetteer('sgx').candidate_names(body, SGX_COMPANY_MAX_CANDIDATES)
 
-    companies_name_str = ', '.join(companies_name)
+    if not candidates:
+        return load_sgx_company_data()
 
-    return companies_name_str
+    return ', '.join(candidates)
 
 
 def extract_company_name(
@@ -43,9 +68,6 @@ def extract_company_name(
     company_extraction_parser = JsonOutputParser(pydantic_object=CompanyNameExtraction)
     format_instructions = company_extraction_parser.get_format_instructions()
 
-    # combined_text = f"{title} {body}"   
-    company_names_desc = load_sgx_company_data()
-
     prompt = ChatPromptTemplate.from_messages([
         ("system", system_prompt),
         ('user', user_prompt )
@@ -54,7 +76,7 @@ def extract_company_name(
     if source_scraper == 'sgx': 
         input_data = {
             'body': body,
-            'company_names': company_names_desc,
+            'company_names': sgx_company_names_for(body),
             'format_instructions': format_instructions
         } 
 
@@ -64,29 +86,25 @@ def extract_company_name(
             'format_instructions': format_instructions
         }
     
-    for model in MODEL_NAMES:
-        LOGGER.info(f'LLM used: {model}')
+    def call(chain):
+        company_extracted = invoke_llm(chain, input_data)
+        
+        if 'company' not in company_extracted or 'reason' not in company_extracted:
+            LOGGER.warning("Output not complete, trying next LLM...")
+            return None
+
+        LOGGER.info("[SUCCES] Company extracted for url")
         
-        llm = get_llm(model, temperature=0.4)
-
-        try:
-            chain = prompt | llm | company_extraction_parser
-            
-            company_extracted = chain.invoke(input_data)
-            
-            if 'company' not in company_extracted or 'reason' not in company_extracted:
-                LOGGER.warning("Output not complete, trying next LLM...")
-                continue
-
-            LOGGER.info(f"[SUCCES] Company extracted for url")
-            
-            LOGGER.info(f"reason company extraction: {company_extracted.get('reason')}")
-            return company_extracted.get('company')
-            
-        except Exception as error:
-            LOGGER.warning(f"LLM failed with error: {error}")
-            continue 
-
-    LOGGER.error("All LLMs failed to return a valid summary.")
-    return None
+        LOGGER.info(f"reason company extraction: {company_extracted.get('reason')}")
+        return company_extracted
+
+    company_extracted = cached_chain_call(
+        "extract_company", prompt, company_extraction_parser, input_data, 0.4, call
+    )
+
+    if company_extracted is None:
+        LOGGER.error("All LLMs failed to return a valid summary.")
+        return None
+
+    return company_extracted.get('company')
 
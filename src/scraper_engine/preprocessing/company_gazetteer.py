@@ -0,0 +1,312 @@
+from collections import defaultdict
+from threading import Lock
+
+from scraper_engine.config.conf import LOCAL_TICKER_CONFIDENCE, LOCAL_TICKER_MARKETS
+from scraper_engine.database.metadata import load_company_data_idx, load_company_data_sgx
+from .utils.article_helpers import normalize_idx_company_name, normalize_sgx_company_name
+
+import logging
+import re
+
+
+LOGGER = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+SYMBOL_PATTERN = re.compile(r"\b[A-Z0-9]{2,6}\b")
+BRACKETED_SYMBOL_PATTERN = re.compile(r"\((?:[A-Z]{2,5}\s*:\s*)?([A-Z0-9]{2,6})(?:\.JK)?\)")
+IPO_PATTERN = re.compile(r"\bIPO\b|initial public offering|penawaran umum perdana", re.IGNORECASE)
+
+# trailing words dropped to get the short name a company goes by in the news,
+# e.g. "DBS Group Holdings" -> "DBS"
+CORPORATE_SUFFIXES = {
+    "ltd", "limited", "pte", "bhd", "berhad", "inc", "corp", "corporation",
+    "co", "company", "plc", "tbk", "persero", "holdings", "holding", "group",
+    "international", "intl", "the", "and",
+}
+
+# short names too common as plain words to be evidence of a company
+GENERIC_ALIASES = {
+    "advanced", "asia", "asian", "capital", "china", "edition", "first",
+    "global", "golden", "great", "menu", "metro", "new", "pacific", "sing",
+    "soup", "unusual", "united",
+}
+
+# a short name shared by more companies than this says nothing about which one
+MAX_COMPANIES_PER_ALIAS = 3
+
+# names and acronyms SGX companies go by in the news that cannot be derived
+# from the listed name, e.g. "OCBC" for Oversea-Chinese Banking Corp
+SGX_ALIASES = {
+    "ocbc": ["O39"],
+    "uob": ["U11"],
+    "singtel": ["Z74"],
+    "sia": ["C6L"],
+    "st engineering": ["S63"],
+    "st engg": ["S63"],
+    "sembcorp": ["U96"],
+    "capitaland": ["9CI"],
+    "cict": ["C38U"],
+    "clar": ["A17U"],
+    "clct": ["AU8U"],
+    "clas": ["HMN"],
+    "clint": ["CY6U"],
+    "yangzijiang": ["BS6"],
+    "cdl": ["C09"],
+    "thaibev": ["Y92"],
+    "jardine c c": ["C07"],
+    "mlt": ["M44U"],
+    "mpact": ["N2IU"],
+    "fct": ["J69U"],
+    "flct": ["BUOU"],
+}
+
+# legal-form words that may follow a listed name in the text, "PT Timah Tbk",
+# "PT PP (Persero) Tbk", "Keppel Ltd"
+LEGAL_FORM_SUFFIXES = {"tbk", "ltd", "limited", "plc", "bhd", "berhad"}
+LEGAL_FORM_INFIXES = {"persero"}
+
+# how sure a single mention makes us of the company behind it, before the
+# score is split between the companies sharing that name. Only the first two
+# kinds reach LOCAL_TICKER_CONFIDENCE: names such as "Timah", "PP" or "Merck"
+# are also plain words or other companies
+MATCH_CONFIDENCE = {
+    "bracketed_ticker": 1.0,    # "(BBCA)", "(SGX: D05)"
+    "legal_name": 0.95,         # the listed name followed by its legal form
+    "name": 0.85,               # the listed name, legal-form words aside
+    "ticker": 0.85,             # an upper-case ticker anywhere in the text
+    "short_name": 0.8,          # "Keppel Corp" -> "keppel corp", several words
+    "short_word": 0.6,          # a single-word short name
+    "alias": 0.8,               # a known nickname or acronym, "OCBC"
+}
+
+_END = ""
+
+
+def tokenize(text: str) -> list[str]:
+    return WORD_PATTERN.findall(text.lower())
+
+
+class CompanyGazetteer:
+    """
+    Word-level trie over the normalized names and short names of every listed
+    company, plus a symbol table for tickers written in upper case.
+
+    `find` walks the article once and keeps the longest name starting at each
+    word, so the cost depends on the article length and not on the number of
+    companies. It is a candidate generator: recall matters more than
+    precision, the LLM still decides which candidates the article is about.
+    """
+    def __init__(
+        self,
+        companies: dict[str, dict[str, str]],
+        normalize,
+        known_aliases: dict[str, list[str]] | None = None,
+    ):
+        self.companies = companies
+        self.trie: dict = {}
+        self.symbols: dict[str, str] = {}
+        self.known_aliases: set[tuple[str, ...]] = set()
+
+        aliases = defaultdict(set)
+        self.full_names: set[tuple[str, ...]] = set()
+
+        for key, entry in companies.items():
+            name = entry.get("name")
+            symbol = (entry.get("symbol") or key).strip()
+
+            if not name:
+                continue
+
+            tokens = tokenize(normalize(name))
+            aliases[tuple(tokens)].add(key)
+            self.full_names.add(tuple(tokens))
+
+            short_tokens = list(tokens)
+
+            while short_tokens and short_tokens[-1] in CORPORATE_SUFFIXES:
+                short_tokens.pop()
+
+            if short_tokens and short_tokens != tokens and self._is_usable_alias(short_tokens):
+                aliases[tuple(short_tokens)].add(key)
+
+            ticker = symbol.split(".")[0].upper()
+
+            if len(ticker) >= 3 or any(char.isdigit() for char in ticker):
+                self.symbols[ticker] = key
+
+        for tokens, keys in aliases.items():
+            if tokens and len(keys) <= MAX_COMPANIES_PER_ALIAS:
+                self._insert(tokens, keys)
+
+        for alias, keys in (known_aliases or {}).items():
+            tokens = tuple(tokenize(alias))
+            keys = {key for key in keys if key in companies}
+
+            if tokens and keys:
+                self.known_aliases.add(tokens)
+                self._insert(tokens, keys)
+
+        LOGGER.info(f"Company gazetteer built: {len(companies)} companies, {len(aliases)} names")
+
+    @staticmethod
+    def _is_usable_alias(tokens: list[str]) -> bool:
+        if len(tokens) > 1:
+            return True
+
+        return len(tokens[0]) >= 3 and tokens[0] not in GENERIC_ALIASES
+
+    @staticmethod
+    def _has_legal_form(tokens: list[str], position: int) -> bool:
+        while position < len(tokens) and tokens[position] in LEGAL_FORM_INFIXES:
+            position += 1
+
+        return position < len(tokens) and tokens[position] in LEGAL_FORM_SUFFIXES
+
+    def _insert(self, tokens: tuple[str, ...], keys: set[str]) -> None:
+        node = self.trie
+
+        for token in tokens:
+            node = node.setdefault(token, {})
+
+        node.setdefault(_END, set()).update(keys)
+
+    def mentions(self, text: str) -> list[tuple[list[str], str]]:
+        """
+        Every company mention in `text` as (candidate keys, match kind):
+        names first in reading order, then tickers.
+        """
+        found = []
+        tokens = tokenize(text)
+        position = 0
+
+        while position < len(tokens):
+            node = self.trie
+            cursor = position
+            match_end, match_keys = position, None
+
+            while cursor < len(tokens) and tokens[cursor] in node:
+                node = node[tokens[cursor]]
+                cursor += 1
+
+                if _END in node:
+                    match_end, match_keys = cursor, node[_END]
+
+            if match_keys:
+                matched = tuple(tokens[position:match_end])
+
+                if matched in self.full_names:
+                    kind = "legal_name" if self._has_legal_form(tokens, match_end) else "name"
+
+                elif matched in self.known_aliases:
+                    kind = "alias"
+
+                elif len(matched) > 1:
+                    kind = "short_name"
+
+                else:
+                    kind = "short_word"
+
+                found.append((sorted(match_keys), kind))
+                position = match_end
+
+            else:
+                position += 1
+
+        bracketed = set(BRACKETED_SYMBOL_PATTERN.findall(text))
+
+        for symbol in SYMBOL_PATTERN.findall(text):
+            if symbol in self.symbols:
+                kind = "bracketed_ticker" if symbol in bracketed else "ticker"
+                found.append(([self.symbols[symbol]], kind))
+
+        return found
+
+    def find(self, text: str) -> list[str]:
+        """
+        Company keys mentioned in `text` by name, short name, known alias or
+        ticker, in order of first appearance.
+        """
+        found = {}
+
+        for keys, _ in self.mentions(text):
+            found.update(dict.fromkeys(keys))
+
+        return list(found)
+
+    def link(self, text: str) -> dict[str, float]:
+        """
+        Company key -> confidence that the text refers to it, from its
+        strongest mention.
+        """
+        linked = {}
+
+        for keys, kind in self.mentions(text):
+            confidence = MATCH_CONFIDENCE[kind] / len(keys)
+
+            for key in keys:
+                linked[key] = max(linked.get(key, 0.0), confidence)
+
+        return linked
+
+    def candidate_names(self, text: str, limit: int) -> list[str]:
+        # a few companies are listed under more than one symbol with the same name
+        names = dict.fromkeys(self.companies[key]["name"] for key in self.find(text))
+        return list(names)[:limit]
+
+
+_GAZETTEERS: dict[str, CompanyGazetteer] = {}
+_GAZETTEERS_LOCK = Lock()
+
+
+def get_company_gazetteer(source_scraper: str) -> CompanyGazetteer:
+    """
+    Built on first use per market and shared for the rest of the run.
+    """
+    with _GAZETTEERS_LOCK:
+        gazetteer = _GAZETTEERS.get(source_scraper)
+
+        if gazetteer is None:
+            if source_scraper == "sgx":
+                gazetteer = CompanyGazetteer(
+                    load_company_data_sgx(), normalize_sgx_company_name, SGX_ALIASES
+                )
+
+            else:
+                gazetteer = CompanyGazetteer(load_company_data_idx(), normalize_idx_company_name)
+
+            _GAZETTEERS[source_scraper] = gazetteer
+
+        return gazetteer
+
+
+def local_tickers(text: str, source_scraper: str) -> list[str] | None:
+    """
+    Tickers linked locally when every company mention in the text is above
+    LOCAL_TICKER_CONFIDENCE, otherwise None. Articles about an IPO are always
+    None: the LLM prompt drops underwriters and other supporting parties the
+    local pass cannot tell apart.
+    """
+    if IPO_PATTERN.search(text):
+        return None
+
+    gazetteer = get_company_gazetteer(source_scraper)
+    linked = gazetteer.link(text)
+
+    if not linked or min(linked.values()) < LOCAL_TICKER_CONFIDENCE:
+        return None
+
+    tickers = [gazetteer.companies[key].get("symbol") or key for key in linked]
+    LOGGER.info(f"Tickers linked locally: {linked}")
+
+    return list(dict.fromkeys(tickers))
+
+
+def confident_tickers(text: str, source_scraper: str) -> list[str] | None:
+    """
+    local_tickers for the markets in LOCAL_TICKER_MARKETS, otherwise None so
+    the caller falls back to LLM extraction.
+    """
+    if source_scraper not in LOCAL_TICKER_MARKETS:
+        return None
+
+    return local_tickers(text, source_scraper)
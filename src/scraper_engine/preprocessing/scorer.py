@@ -3,9 +3,9 @@ from langchain_core.output_parsers import JsonOutputParser
 
 from datetime import datetime, timedelta
 
-from scraper_engine.llm.client import get_llm
+from scraper_engine.llm.client import invoke_llm
 from scraper_engine.llm.prompts import ScoringNews, ScoringPrompts
-from scraper_engine.config.conf import MODEL_NAMES
+from scraper_engine.llm.response_cache import cached_chain_call
 
 import logging
 
@@ -59,31 +59,28 @@ def get_article_score(
         "format_instructions": scoring_parser.get_format_instructions(),
     }
 
-    for model in MODEL_NAMES:
-        try:
-            llm = get_llm(model, temperature=0.4)
-            LOGGER.info("LLM used: %s", model)
+    def call(scoring_chain):
+        response = invoke_llm(scoring_chain, input_data)
 
-            response = (prompt | llm | scoring_parser).invoke(input_data)
+        if response is None:
+            LOGGER.warning("API call failed after all retries, trying next LLM...")
 
-            if response is None:
-                LOGGER.warning("API call failed after all retries, trying next LLM...")
-                continue
+        return response
 
-            LOGGER.info("Reason scoring: %s", response.get("reason"))
+    response = cached_chain_call("score", prompt, scoring_parser, input_data, 0.4, call)
 
-            final_score = response.get("score", 0) + manual_score_time(article_date)
+    if response is None:
+        LOGGER.error("All LLMs failed; returning no score")
 
-            if 0 <= final_score <= 155:
-                return final_score
+        return None
 
-            LOGGER.warning("Score out of range: %s, capping at valid range", final_score)
+    LOGGER.info("Reason scoring: %s", response.get("reason"))
 
-            return max(0, min(155, final_score))
+    final_score = response.get("score", 0) + manual_score_time(article_date)
 
-        except Exception as error:
-            LOGGER.warning("LLM failed with error: %s", error)
+    if 0 <= final_score <= 155:
+        return final_score
 
-    LOGGER.error("All LLMs failed; returning no score")
+    LOGGER.warning("Score out of range: %s, capping at valid range", final_score)
 
-    return None
+    return max(0, min(155, final_score))
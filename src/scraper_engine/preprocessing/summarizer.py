@@ -1,11 +1,10 @@
-from goose3                         import Goose
 from langchain_core.output_parsers  import JsonOutputParser
 from langchain.prompts              import ChatPromptTemplate
 
-from scraper_engine.llm.client   import get_llm, TokenUsageLogger
+from scraper_engine.llm.client   import invoke_llm, TokenUsageLogger
 from scraper_engine.llm.prompts  import SummarizationPrompts, SummaryNews
-from scraper_engine.config.conf  import USER_AGENT, MODEL_NAMES
-from .article_fetcher            import extract_table_content
+from scraper_engine.llm.response_cache import cached_chain_call
+from .article_fetcher            import extract_table_content, extract_via_cloudscraper
 from .utils.article_helpers      import (
     basic_cleaning_body,
     clean_apostrophe_case,
@@ -14,8 +13,6 @@ from .utils.article_helpers      import (
 )
 
 import re
-import cloudscraper
-import time 
 import logging
 
 
@@ -47,35 +44,30 @@ def summarize_article(
         'format_instructions': format_instructions
     }
     
-    for model in MODEL_NAMES:
-        try:
-            llm = get_llm(model, temperature=0.15)
-            LOGGER.info(f"LLM used: {model}")
-
-            summary_chain = prompt | llm | summary_parser
-            
-            summary_result = summary_chain.invoke(
-                input_data, 
-                config={"callbacks": [TokenUsageLogger()]}
-            )
-
-            if summary_result is None:
-                LOGGER.warning("API call failed after all retries, trying next LLM...")
-                continue
-
-            if not summary_result.get("title") or not summary_result.get("summary"):
-                LOGGER.info("[ERROR] LLM returned incomplete summary_result")
-                continue
-            
-            LOGGER.info(f"[SUCCES] Summarize for url: {url}")
-            return summary_result
-            
-        except Exception as error:
-            LOGGER.warning(f"LLM failed with error: {error}")
-            continue 
-
-    LOGGER.error("All LLMs failed to return a valid summary.")
-    return None
+    def call(summary_chain):
+        summary_result = invoke_llm(
+            summary_chain,
+            input_data, 
+            config={"callbacks": [TokenUsageLogger()]}
+        )
+
+        if summary_result is None:
+            LOGGER.warning("API call failed after all retries, trying next LLM...")
+            return None
+
+        if not summary_result.get("title") or not summary_result.get("summary"):
+            LOGGER.info("[ERROR] LLM returned incomplete summary_result")
+            return None
+        
+        LOGGER.info(f"[SUCCES] Summarize for url: {url}")
+        return summary_result
+
+    summary_result = cached_chain_call("summarize", prompt, summary_parser, input_data, 0.15, call)
+
+    if summary_result is None:
+        LOGGER.error("All LLMs failed to return a valid summary.")
+
+    return summary_result
 
 
 def summarize_news(
@@ -87,15 +79,13 @@ def summarize_news(
     try:
         if len(news_text) <= 100:
             LOGGER.warning(f"Article text too short ({len(news_text)} chars) for {url}, retrying with cloudscraper.")
-            scraper = cloudscraper.create_scraper()
-            goose_extractor = Goose({"browser_user_agent": USER_AGENT, "http_session": scraper})
-            article = goose_extractor.extract(url=url)
+            extracted_text = extract_via_cloudscraper(url)
 
-            if not article.cleaned_text or len(article.cleaned_text) <= 100:
+            if not extracted_text or len(extracted_text) <= 100:
                 LOGGER.error(f"Cloudscraper also returned insufficient content for {url}.")
                 return None
 
-            news_text = article.cleaned_text
+            news_text = extracted_text
 
         news_text = re.sub(r"\s+", " ", news_text)
 
@@ -107,7 +97,6 @@ def summarize_news(
         LOGGER.info(f"Article content preview: {news_text[:550]}")
 
         response = summarize_article(title, news_text, url, source_scraper)
-        time.sleep(5)
 
         if not response or not response.get("summary"):
             LOGGER.error(f"Summarization failed or returned incomplete data for {url}.")
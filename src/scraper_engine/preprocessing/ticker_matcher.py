@@ -0,0 +1,139 @@
+from rapidfuzz import fuzz, process
+from threading import Lock
+
+from scraper_engine.database.metadata import DATA_DIR, build_ticker_index, build_sgx_ticker_index
+from .utils.article_helpers import (
+    is_raw_ticker,
+    normalize_idx_company_name,
+    normalize_sgx_company_name,
+)
+
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+COMPANY_FILES = {
+    "idx": DATA_DIR / "idx/companies.json",
+    "sgx": DATA_DIR / "sgx/sgx_companies.json",
+}
+
+
+class TickerMatcher:
+    """
+    Ticker index of one market, normalized once into flat choice lists.
+
+    `match` groups the extracted names by how they are scored (raw tickers,
+    short names, full names) and scores each group against its choices in
+    a single rapidfuzz cdist call, instead of one extractOne per name.
+    """
+    def __init__(self, source_scraper: str):
+        self.source_scraper = source_scraper
+
+        ticker_index = (
+            build_sgx_ticker_index()
+            if source_scraper == 'sgx'
+            else build_ticker_index()
+        )
+        min_key_length = 5 if source_scraper == 'idx' else 2
+        self.normalize = normalize_sgx_company_name if source_scraper == 'sgx' else normalize_idx_company_name
+
+        name_candidates = {
+            key: value
+            for key, value in ticker_index.items()
+            if len(key) >= min_key_length
+        }
+
+        ticker_candidates = {
+            value.lower().replace('.jk', '').strip(): value
+            for value in ticker_index.values()
+        }
+
+        self.name_keys = list(name_candidates)
+        self.name_tickers = list(name_candidates.values())
+        self.ticker_keys = list(ticker_candidates)
+        self.ticker_tickers = list(ticker_candidates.values())
+
+    def _choices(
+        self,
+        group: str,
+        score_threshold: int,
+    ) -> tuple[list[str], list[str], callable, int]:
+        if group == "ticker":
+            return self.ticker_keys, self.ticker_tickers, fuzz.ratio, 95
+
+        if group == "short_name":
+            return self.name_keys, self.name_tickers, fuzz.ratio, 90
+
+        return self.name_keys, self.name_tickers, fuzz.token_set_ratio, score_threshold
+
+    def match(
+        self,
+        company_extracted: list[str],
+        score_threshold: int = 85,
+        short_query_threshold: int = 6,
+    ) -> list[str]:
+        groups: dict[str, list[tuple[int, str]]] = {}
+
+        for position, company in enumerate(company_extracted):
+            if is_raw_ticker(company):
+                group, query = "ticker", company.lower().strip()
+
+            else:
+                query = self.normalize(company)
+                group = "short_name" if len(query) < short_query_threshold else "name"
+
+            groups.setdefault(group, []).append((position, query))
+
+        found: list[str | None] = [None] * len(company_extracted)
+
+        for group, queries in groups.items():
+            keys, tickers, scorer, cutoff = self._choices(group, score_threshold)
+
+            if not keys:
+                continue
+
+            scores = process.cdist(
+                [query for _, query in queries],
+                keys,
+                scorer=scorer,
+                score_cutoff=cutoff,
+                workers=1,
+            )
+
+            for (position, query), row in zip(queries, scores):
+                # argmax keeps the first of equal scores, like extractOne
+                best = int(row.argmax())
+                score = float(row[best])
+
+                if score and score >= cutoff:
+                    found[position] = tickers[best]
+                    LOGGER.info(f"input: {query!r} -> matched: {keys[best]!r} (score={score}) -> {tickers[best]}")
+
+                else:
+                    LOGGER.info(f"input: {query!r} -> no match above threshold")
+
+        return list(dict.fromkeys(ticker for ticker in found if ticker))
+
+
+_MATCHERS: dict[str, tuple[float, TickerMatcher]] = {}
+_MATCHERS_LOCK = Lock()
+
+
+def get_ticker_matcher(source_scraper: str) -> TickerMatcher:
+    """
+    One matcher per market, rebuilt only when the company file changes on
+    disk (the metadata loaders rewrite it on refresh days).
+    """
+    market = 'sgx' if source_scraper == 'sgx' else 'idx'
+    path = COMPANY_FILES[market]
+    mtime = path.stat().st_mtime if path.exists() else 0.0
+
+    with _MATCHERS_LOCK:
+        cached = _MATCHERS.get(market)
+
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, TickerMatcher(market))
+            _MATCHERS[market] = cached
+
+        return cached[1]
@@ -1,12 +1,23 @@
 from scraper_engine.preprocessing.article_builder import generate_article
 from scraper_engine.database.client import SUPABASE_CLIENT
 from scraper_engine.base.scraper import SeleniumScraper
-
+from scraper_engine.base.html_cache import HTML_CACHE
+from scraper_engine.base.proxy_session import PROXY_SESSIONS
+from scraper_engine.base.tier_router import TIER_ROUTER
+from scraper_engine.base.body_store import BODY_STORE
+from scraper_engine.base.content_extractor import EXTRACTOR_POOL
+from scraper_engine.base.article_sink import iter_jsonl, write_jsonl
+from scraper_engine.llm.client import LLM_THROTTLE, LLM_CLIENTS
+from scraper_engine.llm.response_cache import LLM_CACHE
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from itertools import islice
 
 import pandas as pd
+import asyncio
 import time
-import json
 import os
 import shutil
 import traceback
@@ -39,15 +50,13 @@ def send_data_to_db(successful_articles: list, table_name: str):
 
 
 def filter_articles_by_time(
-    articles: list[dict],
+    articles: Iterable[dict],
     filter_from: datetime,
-) -> list[dict]:
+) -> Iterator[dict]:
     """
-    Keeps only articles whose timestamp is >= filter_from (WIB).
+    Yields only articles whose timestamp is >= filter_from (WIB).
     Articles with unparseable timestamps are kept (fail-open).
     """
-    filtered = []
-
     for article in articles:
         source_url = article.get("source", "")
 
@@ -56,13 +65,13 @@ def filter_articles_by_time(
             "research-education/market-updates/" in source_url
             or "smallcapasia.com/" in source_url
         ):
-            filtered.append(article)
+            yield article
             continue
 
         timestamp = article.get("timestamp")
 
         if not timestamp:
-            filtered.append(article)
+            yield article
             continue
 
         try:
@@ -70,12 +79,10 @@ def filter_articles_by_time(
             dt = dt.replace(tzinfo=WIB) if dt.tzinfo is None else dt.astimezone(WIB)
 
             if dt >= filter_from:
-                filtered.append(article)
+                yield article
 
         except (ValueError, TypeError):
-            filtered.append(article)
-
-    return filtered
+            yield article
 
 
 def get_existing_sources(
@@ -109,36 +116,33 @@ def get_existing_sources(
 
 def filter_article_to_process(
     existing_links: set,
-    all_articles: list[dict[str]],
-    all_articles_yesterday: list[str],
+    all_articles: Iterable[dict[str]],
+    all_articles_yesterday: set[str],
 ) -> list[dict[str]]:
     """
     Filters articles to process by removing duplicates, database entries,
-    and yesterday’s processed articles.
+    and yesterday’s processed articles. Reads the articles in a single pass.
     """
     try:
-        articles_to_process = [
-            article
-            for article in all_articles
-            if article.get("source") not in existing_links
-        ]
-
         seen_sources = set()
-        filter_duplicate_articles = []
+        final_articles_to_process = []
+        total_articles = 0
 
-        for article in articles_to_process:
+        for article in all_articles:
+            total_articles += 1
             source = article.get("source")
 
-            if source not in seen_sources:
-                seen_sources.add(source)
-                filter_duplicate_articles.append(article)
+            if source in seen_sources:
+                continue
+
+            seen_sources.add(source)
 
-        final_articles_to_process = [
-            article
-            for article in filter_duplicate_articles
-            if article.get('source') not in all_articles_yesterday
-        ]
+            if source in existing_links or source in all_articles_yesterday:
+                continue
 
+            final_articles_to_process.append(article)
+
+        LOGGER.info(f"Total articles in time window: {total_articles}")
         LOGGER.info(f'Final articles to process: {len(final_articles_to_process)}')
         return final_articles_to_process
 
@@ -154,43 +158,31 @@ def build_filtered_article(
     source_scraper: str,
     filter_from: datetime | None = None,
 ): 
-    filtered_file = f"./data/{source_scraper}/{jsonfile}_filtered.json"
-    yesterday_file = f"./data/{source_scraper}/{jsonfile}_yesterday.json"
+    pipeline_file = f"./data/{source_scraper}/{jsonfile}.jsonl"
+    filtered_file = f"./data/{source_scraper}/{jsonfile}_filtered.jsonl"
+    yesterday_file = f"./data/{source_scraper}/{jsonfile}_yesterday.jsonl"
 
     LOGGER.info("Performing filtering against database")
 
-    with open(f"./data/{source_scraper}/{jsonfile}.json", "r") as file_pipeline:
-        all_articles = json.load(file_pipeline)
+    all_articles_yesterday = set()
 
-    LOGGER.info(f"Total raw article scraped: {len(all_articles)}")
-    
-    all_articles = filter_articles_by_time(all_articles, filter_from)
-    
-    LOGGER.info(f"Total articles in time window: {len(all_articles)}")
-
-    all_articles_yesterday = []
-
-    if os.path.exists(yesterday_file):
-        try:
-            with open(yesterday_file, "r") as file_pipeline_yesterday:
-                data = json.load(file_pipeline_yesterday)
-
-                if isinstance(data, list):
-                    all_articles_yesterday = [
-                        item.get("source")
-                        if isinstance(item, dict)
-                        else item
-                        for item in data
-                    ]
+    try:
+        all_articles_yesterday = {
+            item.get("source") if isinstance(item, dict) else item
+            for item in iter_jsonl(yesterday_file)
+        }
 
-        except Exception as error:
-            LOGGER.warning(
-                f"Failed to read yesterday file: {error}. Starting fresh"
-            )
+    except Exception as error:
+        LOGGER.warning(
+            f"Failed to read yesterday file: {error}. Starting fresh"
+        )
 
     existing_links = get_existing_sources(table_name, filter_from)
 
-    LOGGER.info(f"Total article scraped {len(all_articles)}")
+    all_articles = iter_jsonl(pipeline_file)
+
+    if filter_from:
+        all_articles = filter_articles_by_time(all_articles, filter_from)
 
     final_articles_to_process = filter_article_to_process(
         existing_links,
@@ -198,13 +190,10 @@ def build_filtered_article(
         all_articles_yesterday,
     )
 
-    shutil.copy(
-        f"./data/{source_scraper}/{jsonfile}.json",
-        yesterday_file,
-    )
+    if os.path.exists(pipeline_file):
+        shutil.copy(pipeline_file, yesterday_file)
 
-    with open(filtered_file, "w") as file:
-        json.dump(final_articles_to_process, file, indent=2)
+    write_jsonl(filtered_file, final_articles_to_process)
 
     LOGGER.info(
         f"Saved filtered article list to {filtered_file}"
@@ -220,25 +209,23 @@ def get_article_to_process(
     filter_from: datetime | None = None,
 ) -> list[dict[str]]:
     """
-    Retrieves articles from JSON and filters out those already in the database.
+    Retrieves a batch from the JSONL work-list and filters out those already in the database.
     """
-    filtered_file = f"./data/{source_scraper}/{jsonfile}_filtered.json"
+    filtered_file = f"./data/{source_scraper}/{jsonfile}_filtered.jsonl"
 
     if not os.path.exists(filtered_file):
         LOGGER.error(f"Filtered article file not found: {filtered_file}")
         return []
 
     try:
-        with open(filtered_file, "r") as file:
-            final_articles_to_process = json.load(file)
+        total_articles = sum(1 for _ in iter_jsonl(filtered_file))
 
-    except (json.JSONDecodeError, OSError) as error:
+    except OSError as error:
         LOGGER.error(f"Failed to read filtered file {filtered_file}: {error}")
         return []
 
-    LOGGER.info(f"Loaded {len(final_articles_to_process)} articles from work-list")
+    LOGGER.info(f"Loaded {total_articles} articles from work-list")
 
-    total_articles = len(final_articles_to_process)
     max_needed_batches = (total_articles + batch_size - 1) // batch_size
 
     if batch > max_needed_batches:
@@ -250,7 +237,7 @@ def get_article_to_process(
 
     start_idx = (batch - 1) * batch_size
     end_idx = min(start_idx + batch_size, total_articles)
-    batch_slice = final_articles_to_process[start_idx:end_idx]
+    batch_slice = list(islice(iter_jsonl(filtered_file), start_idx, end_idx))
 
     LOGGER.info(
         f"Batch {batch}/{max_needed_batches}: "
@@ -277,6 +264,151 @@ def get_article_to_process(
     return remaining
 
 
+def process_articles(
+    data_articles: list[dict],
+    source_scraper: str,
+) -> list[dict]:
+    """
+    Processes the batch one article at a time, then retries the failures once.
+    """
+    successful_articles = []
+    failed_articles_queue = []
+
+    for article_data in data_articles:
+        source_url = article_data.get("source")
+        LOGGER.info(f"Processing: {source_url}")
+
+        try:
+            processed_article_object, status = generate_article(
+                article_data,
+                source_scraper,
+                MININUM_SCORE
+            )
+
+            if status == "low_score":
+                LOGGER.info(f"Skipped due to low score: {source_url}")
+                continue
+
+            if status != "ok" or not processed_article_object:
+                LOGGER.error("Failed. Adding to retry queue.")
+                failed_articles_queue.append(article_data)
+                continue
+
+            processed_article = processed_article_object.to_dict()
+            LOGGER.info(f"succes article above threshold: {source_url}")
+            successful_articles.append(processed_article)
+
+        except Exception as error:
+            LOGGER.error(f"Failed. Adding to retry queue. Reason: {error}")
+            failed_articles_queue.append(article_data)
+
+    for article_data in failed_articles_queue:
+        source_url = article_data.get("source")
+        LOGGER.info(f"Retrying for URL: {source_url}")
+
+        try:
+            processed_article_object, status = generate_article(
+                article_data,
+                source_scraper,
+                MININUM_SCORE
+            )
+
+            if status == "low_score":
+                LOGGER.info(f"Retry skipped due to low score: {source_url}")
+                continue
+
+            if status != "ok" or not processed_article_object:
+                LOGGER.error(f"Failed on retry. Giving up on {source_url}")
+                continue
+
+            LOGGER.info(f"succes article retry above threshold: {source_url}")
+            successful_articles.append(processed_article_object.to_dict())
+
+        except Exception as error:
+            LOGGER.error(
+                f"Failed on retry. Giving up on {source_url}: {error}"
+            )
+
+    return successful_articles
+
+
+async def process_articles_async(
+    data_articles: list[dict],
+    source_scraper: str,
+    concurrency: int,
+) -> list[dict]:
+    """
+    Runs generate_article over the batch on worker threads with at most
+    `concurrency` articles in flight; individual LLM calls are further
+    bounded by LLM_SEMAPHORE_SYNC (see KeyRotatingChatModel). Failed articles get one
+    more concurrent pass, as in the serial path. Results keep the batch order.
+    """
+    article_slots = asyncio.Semaphore(max(1, concurrency))
+
+    # the default executor can be smaller than the requested concurrency
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="article")
+    )
+
+    async def process(article_data: dict) -> tuple:
+        async with article_slots:
+            LOGGER.info(f"Processing: {article_data.get('source')}")
+
+            try:
+                return await asyncio.to_thread(
+                    generate_article,
+                    article_data,
+                    source_scraper,
+                    MININUM_SCORE
+                )
+
+            except Exception as error:
+                LOGGER.error(f"Failed processing {article_data.get('source')}: {error}")
+                return None, "error"
+
+    successful_articles = []
+    failed_articles_queue = []
+
+    results = await asyncio.gather(*(process(article) for article in data_articles))
+
+    for article_data, (processed_article_object, status) in zip(data_articles, results):
+        source_url = article_data.get("source")
+
+        if status == "low_score":
+            LOGGER.info(f"Skipped due to low score: {source_url}")
+            continue
+
+        if status != "ok" or not processed_article_object:
+            LOGGER.error(f"Failed. Adding to retry queue: {source_url}")
+            failed_articles_queue.append(article_data)
+            continue
+
+        LOGGER.info(f"succes article above threshold: {source_url}")
+        successful_articles.append(processed_article_object.to_dict())
+
+    if not failed_articles_queue:
+        return successful_articles
+
+    LOGGER.info(f"Retrying {len(failed_articles_queue)} failed article(s)")
+    results = await asyncio.gather(*(process(article) for article in failed_articles_queue))
+
+    for article_data, (processed_article_object, status) in zip(failed_articles_queue, results):
+        source_url = article_data.get("source")
+
+        if status == "low_score":
+            LOGGER.info(f"Retry skipped due to low score: {source_url}")
+            continue
+
+        if status != "ok" or not processed_article_object:
+            LOGGER.error(f"Failed on retry. Giving up on {source_url}")
+            continue
+
+        LOGGER.info(f"succes article retry above threshold: {source_url}")
+        successful_articles.append(processed_article_object.to_dict())
+
+    return successful_articles
+
+
 def post_source(
     jsonfile: str,
     batch: int,
@@ -285,12 +417,13 @@ def post_source(
     source_scraper: str,
     filter_from: datetime | None = None,
     is_check_csv: bool = False,
+    concurrency: int = 1,
 ):
     """
     Load articles, process selected batch, and post to database.
+    With concurrency > 1 the batch is processed by the asyncio path.
     """
     successful_articles = []
-    failed_articles_queue = []
 
     start_time = time.time()
 
@@ -312,68 +445,25 @@ def post_source(
     )
     
     try: 
-        for article_data in data_articles:
-            source_url = article_data.get("source")
-            LOGGER.info(f"Processing: {source_url}")
-
-            try:
-                processed_article_object, status = generate_article(
-                    article_data,
-                    source_scraper,
-                    MININUM_SCORE
-                )
-
-                if status == "low_score":
-                    LOGGER.info(f"Skipped due to low score: {source_url}")
-                    continue
-                
-                time.sleep(5)
-
-                if status != "ok" or not processed_article_object:
-                    LOGGER.error("Failed. Adding to retry queue.")
-                    failed_articles_queue.append(article_data)
-                    continue
-
-                processed_article = processed_article_object.to_dict()
-                LOGGER.info(f"succes article above threshold: {source_url}")
-                successful_articles.append(processed_article)
-
-            except Exception as error:
-                LOGGER.error(f"Failed. Adding to retry queue. Reason: {error}")
-                failed_articles_queue.append(article_data)
-
-        for article_data in failed_articles_queue:
-            source_url = article_data.get("source")
-            LOGGER.info(f"Retrying for URL: {source_url}")
-
-            try:
-                processed_article_object, status = generate_article(
-                    article_data,
-                    source_scraper,
-                    MININUM_SCORE
-                )
-
-                time.sleep(5)
-
-                if status == "low_score":
-                    LOGGER.info(f"Retry skipped due to low score: {source_url}")
-                    continue
-
-                if status != "ok" or not processed_article_object:
-                    LOGGER.error(f"Failed on retry. Giving up on {source_url}")
-                    continue
-
-                LOGGER.info(f"succes article retry above threshold: {source_url}")
-                successful_articles.append(processed_article_object.to_dict())
+        if concurrency > 1:
+            successful_articles = asyncio.run(
+                process_articles_async(data_articles, source_scraper, concurrency)
+            )
 
-            except Exception as error:
-                LOGGER.error(
-                    f"Failed on retry. Giving up on {source_url}: {error}"
-                )
+        else:
+            successful_articles = process_articles(data_articles, source_scraper)
     
     finally:
         LOGGER.info("All processing done. Closing Shared WebDriver.")
         SeleniumScraper.close_shared_driver()
+        HTML_CACHE.log_stats()
+        PROXY_SESSIONS.log_stats()
+        LLM_THROTTLE.log_stats()
+        LLM_CLIENTS.log_stats()
+        LLM_CACHE.log_stats()
+        TIER_ROUTER.save()
+        BODY_STORE.log_stats()
+        EXTRACTOR_POOL.log_stats()
 
     end_time = time.time()
     final_time = (end_time - start_time) / 60
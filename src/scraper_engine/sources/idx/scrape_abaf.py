@@ -4,7 +4,6 @@ from scraper_engine.base import Scraper
 
 import argparse
 import logging
-import time 
 
 
 LOGGER = logging.getLogger(__name__)
@@ -71,6 +70,9 @@ class AbafScraper(Scraper):
             thumbnail_tag = article_item.select_one("img.progressivePlain-img")
             thumbnail_url = thumbnail_tag["src"] if thumbnail_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             published_at = self.fetch_article_timestamp(source_url)
 
             if not published_at:
@@ -109,6 +111,10 @@ class AbafScraper(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[ABAF] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[ABAF] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[ABAF] Reached articles older than %s, stopping.", date)
                 break
@@ -117,7 +123,6 @@ class AbafScraper(Scraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[ABAF] Total scraped: %d", len(self.articles))
         return self.articles
@@ -4,7 +4,6 @@ from scraper_engine.base.scraper import Scraper
 from scraper_engine.sources.utils.constant import INDONESIAN_MONTHS
 
 import argparse
-import time
 import logging
 
 
@@ -89,8 +88,10 @@ class AntaraNews(Scraper):
             thumbnail_tag = article_item.select_one("div.col-md-5 img.img-fluid")
             thumbnail_url = thumbnail_tag["data-src"] if thumbnail_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             published_at = self.fetch_article_timestamp(source_url)
-            time.sleep(0.5)
 
             if not published_at:
                 LOGGER.info("[Antara News] Failed to parse date for url: %s. Skipping.", source_url)
@@ -128,6 +129,10 @@ class AntaraNews(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[Antara News] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Antara News] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[Antara News] Reached articles older than %s, stopping.", date)
                 break
@@ -136,7 +141,6 @@ class AntaraNews(Scraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[Antara News] Total scraped: %d", len(self.articles))
         return self.articles
@@ -4,7 +4,6 @@ from urllib.parse import urljoin
 from scraper_engine.base.scraper import Scraper
 
 import argparse
-import time
 import logging
 
 
@@ -59,8 +58,10 @@ class AsianTelecom(Scraper):
             thumbnail_tag = article_item.select_one("div.progressivePlain-container img")
             thumbnail_url = thumbnail_tag.get("src") if thumbnail_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             published_at = self.fetch_article_timestamp(source_url)
-            time.sleep(0.5)
           
             if not published_at:
                 LOGGER.info("[Asian Telecom] Failed to parse date for url: %s. Skipping.", source_url)
@@ -98,6 +99,10 @@ class AsianTelecom(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[Asian Telecom] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Asian Telecom] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[Asian Telecom] Reached articles older than %s, stopping.", date)
                 break
@@ -106,7 +111,6 @@ class AsianTelecom(Scraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[Asian Telecom] Total scraped: %d", len(self.articles))
         return self.articles
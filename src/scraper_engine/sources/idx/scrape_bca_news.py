@@ -286,6 +286,9 @@ class BCANews(Scraper):
             if not source_url:
                 continue
             
+            if self.is_known(source_url):
+                continue
+
             parsed_articles.append({
                 "title": title,
                 "source": source_url,
@@ -320,6 +323,10 @@ class BCANews(Scraper):
                 self.articles.extend(articles)
                 LOGGER.info("[BCA Sekuritas] Page %d: %d articles collected.", page_number, len(articles))
 
+                if self.reached_known_urls():
+                    LOGGER.info("[BCA Sekuritas] Page %d only has known articles, stopping.", page_number)
+                    break
+
                 if reached_older_date:
                     LOGGER.info("[BCA Sekuritas] Reached articles older than %s, stopping.", date)
                     break
@@ -4,7 +4,6 @@ from scraper_engine.base.scraper import SeleniumScraper
 from scraper_engine.sources.utils.constant import INDONESIAN_MONTHS
 
 import argparse
-import time
 import logging 
 
 
@@ -58,12 +57,14 @@ class BisnisMarket(SeleniumScraper):
             title = title_tag.get_text(strip=True)
             raw_date = date_tag.get_text(strip=True)
 
+            if self.is_known(source_url):
+                continue
+
             thumbnail_tag = article_item.select_one("div.artImg img")
             thumbnail_url = thumbnail_tag["src"] if thumbnail_tag else None
 
             if "menit yang lalu" in raw_date or "jam yang lalu" in raw_date:
                 published_at = self.fetch_article_timestamp(source_url)
-                time.sleep(0.5)
 
             else:
                 published_at = self.parse_absolute_date(raw_date)
@@ -155,11 +156,14 @@ class BisnisMarket(SeleniumScraper):
             self.articles.extend(new_articles)
             LOGGER.info("[Bisnis Market] Page %d: %d articles collected.", page_number, len(new_articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Bisnis Market] Page %d only has known articles, stopping.", page_number)
+                break
+
             if num_pages is not None and page_number >= num_pages:
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[Bisnis Market] Total scraped: %d", len(self.articles))
         return self.articles
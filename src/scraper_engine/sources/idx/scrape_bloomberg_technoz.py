@@ -3,7 +3,6 @@ from datetime import datetime
 from scraper_engine.base.scraper import SeleniumScraper
 
 import argparse
-import time
 import logging 
 
 
@@ -72,6 +71,9 @@ class BloombergTechnoz(SeleniumScraper):
             if not source_url or source_url in seen_urls:
                 continue
 
+            if self.is_known(source_url):
+                continue
+
             title_tag = article_item.find(["h2", "h5", "h6"], class_="title")
             title = title_tag.get_text(strip=True) if title_tag else None
 
@@ -92,7 +94,6 @@ class BloombergTechnoz(SeleniumScraper):
                         'hari yang lalu' in relative_time
                     ):
                         published_at = self.fetch_article_timestamp(source_url)
-                        time.sleep(0.5)
 
             if not published_at:
                 LOGGER.info("[Bloomberg Technoz] Failed to extract timestamp for url: %s. Skipping.", source_url)
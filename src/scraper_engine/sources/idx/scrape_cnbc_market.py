@@ -1,10 +1,7 @@
-from bs4 import BeautifulSoup
-
 from scraper_engine.base.scraper import Scraper
 from scraper_engine.sources.utils.time_parser import parse_relative_time
 
 import argparse
-import time
 import logging
 
 
@@ -14,7 +11,7 @@ LOGGER = logging.getLogger(__name__)
 class CNBCMarket(Scraper):
     def fetch_article_list(self, url: str) -> tuple[list, bool]:
         raw = self.fetch_news_with_proxy(url)
-        soup = BeautifulSoup(raw, "html.parser")
+        soup = self.make_soup(raw)
 
         if not soup:
             return [], False
@@ -33,6 +30,9 @@ class CNBCMarket(Scraper):
             anchor_tag = article_item.select_one("a")
             source_url = anchor_tag["href"] if anchor_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             title_tag = article_item.select_one("h2")
             title = title_tag.get_text(strip=True) if title_tag else None
 
@@ -80,6 +80,10 @@ class CNBCMarket(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[CNBC Market] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[CNBC Market] Page %d only has known articles, stopping.", page_number)
+                break
+
             if not has_next_page:
                 LOGGER.info("[CNBC Market] No next page, stopping.")
                 break
@@ -88,7 +92,6 @@ class CNBCMarket(Scraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[CNBC Market] Total scraped: %d", len(self.articles))
         return self.articles
@@ -1,10 +1,7 @@
-from bs4 import BeautifulSoup
-
 from scraper_engine.base.scraper import Scraper
 from scraper_engine.sources.utils.time_parser import parse_relative_time
 
 import argparse
-import time
 import logging 
 
 
@@ -14,7 +11,7 @@ LOGGER = logging.getLogger(__name__)
 class CNNEkonomi(Scraper):
     def fetch_article_list(self, url: str) -> tuple[list, bool]:
         raw = self.fetch_news_with_proxy(url)
-        soup = BeautifulSoup(raw, "html.parser")
+        soup = self.make_soup(raw)
 
         if not soup:
             return []
@@ -30,6 +27,9 @@ class CNNEkonomi(Scraper):
             anchor_tag = article_item.select_one("a")
             source_url = anchor_tag["href"] if anchor_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             title_tag = article_item.select_one("h2")
             title = title_tag.get_text(strip=True) if title_tag else None
 
@@ -78,11 +78,14 @@ class CNNEkonomi(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[CNN Ekonomi] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[CNN Ekonomi] Page %d only has known articles, stopping.", page_number)
+                break
+
             if num_pages is not None and page_number >= num_pages:
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[CNN Ekonomi] Total scraped: %d", len(self.articles))
         return self.articles
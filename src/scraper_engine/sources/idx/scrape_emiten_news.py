@@ -3,7 +3,6 @@ from datetime import datetime
 from scraper_engine.base.scraper import Scraper
 
 import argparse
-import time
 import logging 
 
 
@@ -28,6 +27,7 @@ class EmitenNews(Scraper):
     
     def parse_articles(self, article_items: list, target_date: str) -> list: 
         parsed_articles = []
+        listing = []
         reached_older_date = False 
         
         target_datetime = datetime(
@@ -48,11 +48,20 @@ class EmitenNews(Scraper):
             thumbnail_tag = article_item.select_one("div.news-card-2-img img")
             thumbnail_url = thumbnail_tag.get("src") if thumbnail_tag else None
 
-            published_at = self.fetch_article_timestamp(source_url)
-            time.sleep(0.5)
+            if self.is_known(source_url):
+                continue
+
+            listing.append({
+                "title": title,
+                "source": source_url,
+                "thumbnail": thumbnail_url,
+            })
 
+        for article, published_at in self.fetch_details(
+            listing, lambda article: self.fetch_article_timestamp(article["source"])
+        ):
             if not published_at:
-                LOGGER.info("[Emiten News] Failed to parse date for url: %s. Skipping.", source_url)
+                LOGGER.info("[Emiten News] Failed to parse date for url: %s. Skipping.", article["source"])
                 continue
 
             article_datetime = datetime.strptime(published_at[:10], "%Y-%m-%d")
@@ -62,9 +71,7 @@ class EmitenNews(Scraper):
                 break
 
             parsed_articles.append({
-                "title": title,
-                "source": source_url,
-                "thumbnail": thumbnail_url,
+                **article,
                 "timestamp": published_at,
             })
 
@@ -126,6 +133,10 @@ class EmitenNews(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[Emiten News] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Emiten News] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[Emiten News] Reached articles older than %s, stopping.", date)
                 break
@@ -135,7 +146,6 @@ class EmitenNews(Scraper):
 
             page_number += 1
             offset += 9
-            time.sleep(1)
 
         LOGGER.info("[Emiten News] Total scraped: %d", len(self.articles))
         return self.articles
@@ -5,7 +5,6 @@ from scraper_engine.base.scraper import Scraper
 from scraper_engine.sources.utils.constant import INDONESIAN_MONTHS
 
 import argparse
-import time
 import logging 
 
 
@@ -30,6 +29,9 @@ class FinanceDetik(Scraper):
             title = title_link.get_text(strip=True) if title_link else None
             source_url = title_link["href"] if title_link else None
 
+            if self.is_known(source_url):
+                continue
+
             thumbnail_tag = article_item.find("div", class_="media__image")
             thumbnail_img = thumbnail_tag.find("img") if thumbnail_tag else None
             thumbnail_url = thumbnail_img["src"] if thumbnail_img else None
@@ -96,11 +98,14 @@ class FinanceDetik(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[Finance Detik] Page %d: %d articles collected.", page, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Finance Detik] Page %d only has known articles, stopping.", page)
+                break
+
             if num_pages is not None and page >= num_pages: 
                 break
             
             page += 1
-            time.sleep(1)
 
         LOGGER.info("[Finance Detik] Total scraped: %d", len(self.articles))
         return self.articles
@@ -4,7 +4,6 @@ from scraper_engine.base.scraper import SeleniumScraper
 
 import argparse
 import logging
-import time
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,7 +15,7 @@ LOGGER = logging.getLogger(__name__)
 
 class GapkiScraper(SeleniumScraper):
     def fetch_article_list(self, url: str) -> list:
-        soup = self.fetch_news_with_selenium(url, time_sleep=40)
+        soup = self.fetch_news_with_selenium(url, wait_selector="article.post", max_wait=40)
 
         if not soup:
             return []
@@ -80,9 +79,10 @@ class GapkiScraper(SeleniumScraper):
             thumbnail_wrap = article_item.select_one(".nv-post-thumbnail-wrap img")
             thumbnail_url = thumbnail_wrap.get("src") if thumbnail_wrap else None
 
+            if self.is_known(source):
+                continue
+
             published_at = self.fetch_article_timestamp(source)
-        
-            time.sleep(0.5)
 
             if not published_at:
                 LOGGER.info("[GAPKI] Failed to fetch timestamp for %s. Skipping.", source)
@@ -120,6 +120,10 @@ class GapkiScraper(SeleniumScraper):
             self.articles.extend(articles)
             LOGGER.info("[GAPKI] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[GAPKI] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[GAPKI] Reached articles older than %s, stopping.", date)
                 break
@@ -128,7 +132,6 @@ class GapkiScraper(SeleniumScraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[GAPKI] Total scraped: %d", len(self.articles))
         return self.articles
@@ -4,7 +4,6 @@ from scraper_engine.base.scraper import SeleniumScraper
 
 import argparse
 import logging
-import time
 import dateparser
 
 
@@ -73,6 +72,9 @@ class ICNScraper(SeleniumScraper):
                 reached_older_date = True
                 break
 
+            if self.is_known(source):
+                continue
+
             parsed_articles.append({
                 "title": title,
                 "source": source,
@@ -100,6 +102,10 @@ class ICNScraper(SeleniumScraper):
             self.articles.extend(articles)
             LOGGER.info("[ICN] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[ICN] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[ICN] Reached articles older than %s, stopping.", date)
                 break
@@ -108,7 +114,6 @@ class ICNScraper(SeleniumScraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[ICN] Total scraped: %d", len(self.articles))
         return self.articles
@@ -4,7 +4,6 @@ from urllib.parse   import urljoin
 from scraper_engine.base.scraper import Scraper
 
 import argparse
-import time 
 
 
 class IndonesiaBusinessPost(Scraper):
@@ -71,7 +70,6 @@ class IndonesiaBusinessPost(Scraper):
             for page in range(1, num_pages+1):
                 url = f"{category}?page={page}"
                 self.extract_news(url)
-                time.sleep(0.5)
 
         return self.articles
    
@@ -88,6 +88,9 @@ class IDNFinancialScraper(SeleniumScraper):
             if not title or not source_url:
                 continue
 
+            if self.is_known(source_url):
+                continue
+
             parsed_articles.append({
                 'title': title,
                 'source': source_url,
@@ -112,6 +115,10 @@ class IDNFinancialScraper(SeleniumScraper):
             self.articles.extend(articles)
             LOGGER.info('[IDN Financials] Page %d: %d articles collected.', page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[IDN Financials] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info('[IDN Financials] Reached articles older than %s, stopping.', date)
                 break
@@ -4,7 +4,6 @@ from scraper_engine.base.scraper import Scraper
 
 import argparse
 import logging
-import time
 import dateparser
 
 
@@ -76,6 +75,9 @@ class IdnMinerScraper(Scraper):
                 reached_older_date = True
                 break
 
+            if self.is_known(source):
+                continue
+
             parsed_articles.append({
                 "title": title,
                 "source": source,
@@ -103,6 +105,10 @@ class IdnMinerScraper(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[IDNMINER] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[IDNMINER] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[IDNMINER] Reached articles older than %s, stopping.", date)
                 break
@@ -111,7 +117,6 @@ class IdnMinerScraper(Scraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[IDNMINER] Total scraped: %d", len(self.articles))
         return self.articles
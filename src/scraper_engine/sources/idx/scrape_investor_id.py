@@ -1,12 +1,10 @@
 from datetime import datetime
-from bs4 import BeautifulSoup
 
 from scraper_engine.base.scraper import Scraper
 from scraper_engine.sources.utils.constant import INDONESIAN_MONTHS
 from scraper_engine.sources.utils.time_parser import parse_relative_time
 
 import argparse
-import time
 import logging 
 
 
@@ -21,7 +19,7 @@ class InvestorID(Scraper):
             LOGGER.info("[Investor ID] [FAIL] Failed to fetch HTML or timed out for %s", url)
             return []
 
-        soup = BeautifulSoup(raw_html_content, "html.parser")
+        soup = self.make_soup(raw_html_content)
         return soup.find_all("div", class_="row mb-4 position-relative")
 
     def parse_timestamp(self, raw_timestamp: str) -> str:
@@ -108,6 +106,9 @@ class InvestorID(Scraper):
             if not title:
                 continue
 
+            if self.is_known(source_url):
+                continue
+
             seen_urls.add(source_url)
             parsed_articles.append({
                 "title": title,
@@ -141,6 +142,10 @@ class InvestorID(Scraper):
                 self.articles.extend(articles)
                 LOGGER.info("[Investor ID] Page %d: %d articles collected.", page_number, len(articles))
 
+                if self.reached_known_urls():
+                    LOGGER.info("[Investor ID] Page %d only has known articles, stopping.", page_number)
+                    break
+
                 if reached_older_date:
                     LOGGER.info("[Investor ID] Reached articles older than %s, stopping.", date)
                     break
@@ -149,7 +154,6 @@ class InvestorID(Scraper):
                     break
 
                 page_number += 1
-                time.sleep(1)
 
         LOGGER.info("[Investor ID] Total scraped: %d", len(self.articles))
         return self.articles
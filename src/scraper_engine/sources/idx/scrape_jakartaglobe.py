@@ -4,7 +4,6 @@ from scraper_engine.base.scraper import SeleniumScraper
 
 import argparse
 import logging 
-import time 
 
 
 LOGGER = logging.getLogger(__name__)
@@ -74,8 +73,10 @@ class JakartaGlobe(SeleniumScraper):
             thumbnail_tag = article_item.select_one("div.col-4 img.lazy")
             thumbnail_url = thumbnail_tag.get("src") if thumbnail_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             published_at = self.fetch_article_timestamp(source_url)
-            time.sleep(0.5)
 
             if not published_at:
                 LOGGER.info("[Jakarta Globe] Failed to parse date for url: %s. Skipping.", source_url)
@@ -4,7 +4,6 @@ from urllib.parse import urljoin
 from scraper_engine.base.scraper import SeleniumScraper
 
 import argparse
-import time 
 import re
 import logging 
 
@@ -89,8 +88,10 @@ class JakartaPost(SeleniumScraper):
 
             thumbnail_url = thumbnail_tag.get("data-src") or thumbnail_tag.get("src")
             
+            if self.is_known(source_url):
+                continue
+
             published_at = self.fetch_article_timestamp(source_url)
-            time.sleep(0.5)
 
             if not published_at:
                 LOGGER.info("[Jakarta Post] Failed to parse date for url: %s. Skipping.", source_url)
@@ -129,6 +130,10 @@ class JakartaPost(SeleniumScraper):
             self.articles.extend(articles)
             LOGGER.info("[Jakarta Post] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Jakarta Post] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[Jakarta Post] Reached articles older than %s, stopping.", date)
                 break
@@ -137,7 +142,6 @@ class JakartaPost(SeleniumScraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[Jakarta Post] Total scraped: %d", len(self.articles))
         return self.articles
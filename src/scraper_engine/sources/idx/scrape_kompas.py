@@ -4,7 +4,6 @@ from scraper_engine.base.scraper import Scraper
 from scraper_engine.sources.utils.constant import INDO_TO_ENG
 
 import argparse
-import time
 import logging 
 import re 
 
@@ -74,6 +73,9 @@ class KompasMoney(Scraper):
             anchor_tag = article_item.select_one("a.article-link")
             source_url = anchor_tag["href"] if anchor_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             title_tag = article_item.select_one("h2.articleTitle")
             title = title_tag.get_text(strip=True) if title_tag else None
 
@@ -84,7 +86,6 @@ class KompasMoney(Scraper):
 
             if source_url:
                 published_at = self.fetch_article_timestamp(source_url)
-                time.sleep(0.5)
 
             parsed_articles.append({
                 "title": title,
@@ -118,11 +119,14 @@ class KompasMoney(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[Kompas Money] Page %d: %d articles collected.", page, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Kompas Money] Page %d only has known articles, stopping.", page)
+                break
+
             if num_pages is not None and page >= num_pages: 
                 break
             
             page += 1
-            time.sleep(1)
 
         LOGGER.info("[Kompas Money] Total scraped: %d", len(self.articles))
         return self.articles
@@ -1,5 +1,4 @@
 from datetime import datetime
-from bs4 import BeautifulSoup
 
 from scraper_engine.base.scraper import Scraper
 from scraper_engine.sources.utils.constant import INDONESIAN_MONTHS
@@ -7,7 +6,6 @@ from scraper_engine.sources.utils.time_parser import parse_relative_time
 
 import argparse
 import logging
-import time 
 import re 
 
 
@@ -15,13 +13,15 @@ LOGGER = logging.getLogger(__name__)
 
 
 class KontanInvestasi(Scraper):
+    request_rate = 3.0
+
     def fetch_article_list(self, url: str) -> list:
         raw_html_content = self.fetch_news_with_proxy(url)
 
         if not raw_html_content:
             return []
 
-        soup = BeautifulSoup(raw_html_content, "html.parser")
+        soup = self.make_soup(raw_html_content)
         return soup.select("div.list-berita ul li")
 
     def parse_timestamp(self, raw_timestamp: str) -> str:
@@ -67,7 +67,7 @@ class KontanInvestasi(Scraper):
                 LOGGER.warning("[Kontan Investasi] Proxy failed for %s", article_url)
                 return None, None
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self.make_soup(html)
 
             timestamp_tag = soup.select_one("div.fs14.ff-opensans.font-gray")
             raw_time = timestamp_tag.get_text(strip=True) if timestamp_tag else None
@@ -105,6 +105,7 @@ class KontanInvestasi(Scraper):
     
     def parse_articles(self, article_items: list) -> list:
         parsed_articles = []
+        listing = []
 
         for article_item in article_items:
             anchor_tag = article_item.select_one("a")
@@ -116,19 +117,26 @@ class KontanInvestasi(Scraper):
             thumbnail_tag = article_item.select_one("div.pic img")
             thumbnail_url = thumbnail_tag["data-src"] if thumbnail_tag else None
 
-            published_at, article_body = self.fetch_article_content(source_url)
-            time.sleep(0.3)
+            if self.is_known(source_url):
+                continue
+
+            listing.append({
+                "title": title,
+                "source": source_url,
+                "thumbnail": thumbnail_url,
+            })
 
+        for article, (published_at, article_body) in self.fetch_details(
+            listing, lambda article: self.fetch_article_content(article["source"])
+        ):
             if not published_at:
                 LOGGER.warning(
-                    "[Kontan Investasi] Could not parse timestamp '%s' for %s", published_at, source_url
+                    "[Kontan Investasi] Could not parse timestamp '%s' for %s", published_at, article["source"]
                 )
                 continue 
 
             parsed_articles.append({
-                "title": title,
-                "source": source_url,
-                "thumbnail": thumbnail_url,
+                **article,
                 "timestamp": published_at,
                 "article": article_body
             })
@@ -163,11 +171,14 @@ class KontanInvestasi(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[Kontan Investasi] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Kontan Investasi] Page %d only has known articles, stopping.", page_number)
+                break
+
             if num_pages is not None and page_number >= num_pages:
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[Kontan Investasi] Total scraped: %d", len(self.articles))
         return self.articles
@@ -1,14 +1,12 @@
 from datetime import datetime
-from bs4 import BeautifulSoup
 from scrapling.fetchers import Fetcher
-from goose3 import Goose
 
 from scraper_engine.base.scraper import Scraper
+from scraper_engine.base.content_extractor import EXTRACTOR_POOL
 from scraper_engine.sources.utils.constant import INDONESIAN_MONTHS
 from scraper_engine.sources.utils.time_parser import parse_relative_time
 
 import argparse
-import time
 import logging 
 
 
@@ -16,13 +14,15 @@ LOGGER = logging.getLogger(__name__)
 
 
 class KontanKeuangan(Scraper):
+    request_rate = 3.0
+
     def fetch_article_list(self, url: str) -> list:
         raw_html_content = self.fetch_news_with_proxy(url)
 
         if not raw_html_content:
             return []
 
-        soup = BeautifulSoup(raw_html_content, "html.parser")
+        soup = self.make_soup(raw_html_content)
 
         return soup.select("div.list-berita ul li")
 
@@ -62,6 +62,8 @@ class KontanKeuangan(Scraper):
             return None
 
     def fetch_article_content(self, article_url: str) -> tuple[str | None, str | None]:
+        self.throttle(article_url)
+
         try:
             response = Fetcher.get(article_url, stealthy_headers=True, impersonate="chrome")
 
@@ -70,15 +72,13 @@ class KontanKeuangan(Scraper):
                 return None, None
 
             body = bytes(response.body)
-            soup = BeautifulSoup(body, "html.parser")
+            soup = self.make_soup(body)
 
             timestamp_tag = soup.select_one("div.fs14.ff-opensans.font-gray")
             raw_time = timestamp_tag.get_text(strip=True) if timestamp_tag else None
             published_at = self.parse_timestamp(raw_time)
 
-            goose_extractor = Goose()
-            article_data = goose_extractor.extract(raw_html=body)
-            article_body = article_data.cleaned_text or None
+            article_body = EXTRACTOR_POOL.extract(body, article_url, soup)
 
             return published_at, article_body
 
@@ -88,6 +88,7 @@ class KontanKeuangan(Scraper):
     
     def parse_articles(self, article_items: list) -> list:
         parsed_articles = []
+        listing = []
 
         for article_item in article_items:
             anchor_tag = article_item.select_one("a")
@@ -99,19 +100,26 @@ class KontanKeuangan(Scraper):
             thumbnail_tag = article_item.select_one("div.pic img")
             thumbnail_url = thumbnail_tag["data-src"] if thumbnail_tag else None
 
-            published_at, article_body = self.fetch_article_content(source_url)
-            time.sleep(0.3)
+            if self.is_known(source_url):
+                continue
+
+            listing.append({
+                "title": title,
+                "source": source_url,
+                "thumbnail": thumbnail_url,
+            })
 
+        for article, (published_at, article_body) in self.fetch_details(
+            listing, lambda article: self.fetch_article_content(article["source"])
+        ):
             if not published_at:
                 LOGGER.warning(
-                    "[Kontan Keuangan] Could not parse timestamp '%s' for %s", published_at, source_url
+                    "[Kontan Keuangan] Could not parse timestamp '%s' for %s", published_at, article["source"]
                 )
                 continue 
 
             parsed_articles.append({
-                "title": title,
-                "source": source_url,
-                "thumbnail": thumbnail_url,
+                **article,
                 "timestamp": published_at,
                 "article": article_body,
             })
@@ -148,11 +156,14 @@ class KontanKeuangan(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[Kontan Keuangan] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[Kontan Keuangan] Page %d only has known articles, stopping.", page_number)
+                break
+
             if num_pages is not None and page_number >= num_pages:
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[Kontan Keuangan] Total scraped: %d", len(self.articles))
         return self.articles
@@ -4,7 +4,6 @@ from scraper_engine.base.scraper import Scraper
 
 import argparse
 import logging
-import time
 import dateparser
 
 
@@ -68,6 +67,9 @@ class MinerbaScraper(Scraper):
                 reached_older_date = True
                 break
 
+            if self.is_known(source):
+                continue
+
             parsed_articles.append({
                 "title": title,
                 "source": source,
@@ -95,6 +97,10 @@ class MinerbaScraper(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[MINERBA] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[MINERBA] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[MINERBA] Reached articles older than %s, stopping.", date)
                 break
@@ -103,7 +109,6 @@ class MinerbaScraper(Scraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[MINERBA] Total scraped: %d", len(self.articles))
         return self.articles
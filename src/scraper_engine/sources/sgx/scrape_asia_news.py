@@ -1,22 +1,22 @@
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup 
 
 from scraper_engine.base.scraper import SeleniumScraper
 
 import argparse
 import logging
-import time
 
 
 LOGGER = logging.getLogger(__name__)
 
 
 class AsiaNews(SeleniumScraper):
+    uses_shared_driver = False
+
     def fetch_article_list(self, url: str) -> list:
         raw_html_content = self.fetch_news_with_proxy(target_url=url)
 
-        soup = BeautifulSoup(raw_html_content, "html.parser")
+        soup = self.make_soup(raw_html_content)
         
         if not soup:
             LOGGER.warning("[AsiaNews] Empty soup for %s", url)
@@ -84,6 +84,9 @@ class AsiaNews(SeleniumScraper):
                 reached_older_date = True
                 break
 
+            if self.is_known(source_url):
+                continue
+
             parsed_articles.append({
                 "title": title,
                 "source": source_url,
@@ -111,6 +114,10 @@ class AsiaNews(SeleniumScraper):
             self.articles.extend(articles)
             LOGGER.info("[AsiaNews] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[AsiaNews] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[AsiaNews] Reached articles older than %s, stopping.", date)
                 break
@@ -119,7 +126,6 @@ class AsiaNews(SeleniumScraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[AsiaNews] Total scraped: %d", len(self.articles))
         return self.articles
@@ -28,11 +28,13 @@ class BusinessTimesSG(SeleniumScraper):
             return None
 
     def check_valid_article(self, url: str) -> bool:
+        self.throttle(url)
+
         try:
             response = requests.get(url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self.make_soup(response.text)
 
             if soup.find(attrs={"data-testid": "kicker-subscriber-label-separator"}):
                 LOGGER.info("[BT SG] Skipping subscriber article: %s", url)
@@ -107,6 +109,9 @@ class BusinessTimesSG(SeleniumScraper):
 
             seen_urls.add(url)
 
+            if self.is_known(url):
+                continue
+
             if not self.check_valid_article(url):
                 continue
 
@@ -133,7 +138,7 @@ class BusinessTimesSG(SeleniumScraper):
         ]
 
         for base_url in base_urls:
-            soup = self.fetch_news_with_selenium(base_url)
+            soup = self.fetch_news_with_selenium(base_url, use_cache=False)
 
             if soup is None:
                 LOGGER.error("[BT SG] Failed to load initial page, aborting.")
@@ -147,12 +152,16 @@ class BusinessTimesSG(SeleniumScraper):
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 time.sleep(4)
 
-                current_soup = BeautifulSoup(self.driver.page_source, "html.parser")
+                current_soup = self.make_soup(self.driver.page_source)
                 articles, reached_older_date = self.parse_articles(
                     current_soup, target_datetime, seen_urls
                 )
                 self.articles.extend(articles)
 
+                if self.reached_known_urls():
+                    LOGGER.info("[BT SG] Scroll %d only has known articles, stopping.", scroll_count + 1)
+                    break
+
                 if reached_older_date:
                     LOGGER.info("[BT SG] Reached articles older than %s, stopping.", target_date)
                     break
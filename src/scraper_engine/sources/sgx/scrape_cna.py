@@ -42,6 +42,9 @@ class ChannelNewsAsiaSG(Scraper):
                 reached_older_date = True
                 break
 
+            if self.is_known(source):
+                continue
+
             parsed_articles.append({
                 "title": title,
                 "source": source,
@@ -97,6 +100,10 @@ class ChannelNewsAsiaSG(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[CNA SG] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[CNA SG] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[CNA SG] Reached articles older than %s, stopping.", target_date)
                 break
@@ -1,20 +1,20 @@
 from datetime import datetime, timezone 
 from urllib.parse import quote, urlparse
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup 
 
 from scraper_engine.base.scraper import SeleniumScraper
 
 import argparse 
 import json
 import logging 
-import time 
 
 
 LOGGER = logging.getLogger(__name__)
 
 
 class EdgeProp(SeleniumScraper):
+    uses_shared_driver = False
+    request_rate = 3.0
     BASE_URL = "https://www.edgeprop.sg"
 
     def fetch_article_list(self, url: str) -> list:
@@ -53,7 +53,7 @@ class EdgeProp(SeleniumScraper):
         if not html:
             return None, None
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.make_soup(html)
 
         time_tag = soup.select_one("time[datetime]")
         published_at = self.parse_timestamp(time_tag.get("datetime")) if time_tag else None
@@ -99,6 +99,7 @@ class EdgeProp(SeleniumScraper):
 
     def parse_articles(self, article_items: list, target_date: str) -> tuple[list, bool]:
         parsed_articles = []
+        listing = []
         reached_older_date = False
 
         target_datetime = datetime(
@@ -126,11 +127,20 @@ class EdgeProp(SeleniumScraper):
  
             thumbnail_url = article_item.get("thumbnail")
             
-            published_at, article_body = self.fetch_article_content(source_url)
-            time.sleep(0.3)
- 
+            if self.is_known(source_url):
+                continue
+
+            listing.append({
+                "title": title,
+                "source": source_url,
+                "thumbnail": thumbnail_url,
+            })
+
+        for article, (published_at, article_body) in self.fetch_details(
+            listing, lambda article: self.fetch_article_content(article["source"])
+        ):
             if not published_at:
-                LOGGER.info("[EdgeProp SG] Failed to parse timestamp for %s. Skipping.", source_url)
+                LOGGER.info("[EdgeProp SG] Failed to parse timestamp for %s. Skipping.", article["source"])
                 continue
            
             if published_at < target_datetime:
@@ -138,9 +148,7 @@ class EdgeProp(SeleniumScraper):
                 break
  
             parsed_articles.append({
-                "title": title,
-                "source": source_url,
-                "thumbnail": thumbnail_url,
+                **article,
                 "timestamp": published_at.strftime("%Y-%m-%d %H:%M:%S"),
                 "article": article_body,
             })
@@ -164,6 +172,10 @@ class EdgeProp(SeleniumScraper):
  
             self.articles.extend(articles)
             LOGGER.info("[EdgeProp SG] Page %d: %d articles collected.", page_number, len(articles))
+
+            if self.reached_known_urls():
+                LOGGER.info("[EdgeProp SG] Page %d only has known articles, stopping.", page_number)
+                break
  
             if reached_older_date:
                 LOGGER.info("[EdgeProp SG] Reached articles older than %s, stopping.", date)
@@ -173,7 +185,6 @@ class EdgeProp(SeleniumScraper):
                 break
  
             page_number += 1
-            time.sleep(1)
  
         LOGGER.info("[EdgeProp SG] Total scraped: %d", len(self.articles))
         return self.articles
@@ -1,25 +1,25 @@
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup
 
 from scraper_engine.base.scraper import Scraper, SeleniumScraper
 
 import argparse
 import logging
-import time
 
 
 LOGGER = logging.getLogger(__name__)
 
 
 class NextInsight(SeleniumScraper):
+    uses_shared_driver = False
+    request_rate = 3.0
     BASE_URL = "https://nextinsight.net"
     ARCHIVE_URL = "https://nextinsight.net/story-archive-mainmenu-60/949-2026"
 
     def fetch_article_list(self, url: str) -> list:
         raw_html_content = self.fetch_news_with_proxy(target_url=url)
 
-        soup = BeautifulSoup(raw_html_content, "html.parser")
+        soup = self.make_soup(raw_html_content)
 
         article_items = soup.select("tr.cat-list-row0, tr.cat-list-row1")
         
@@ -31,7 +31,7 @@ class NextInsight(SeleniumScraper):
         if not html:
             return None, None
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.make_soup(html)
 
         time_tag = soup.select_one("dd.published time[datetime]")
         published_at = self.parse_timestamp(time_tag.get("datetime")) if time_tag else None
@@ -64,6 +64,7 @@ class NextInsight(SeleniumScraper):
 
     def parse_articles(self, article_items: list, target_date: str) -> tuple[list, bool]:
         parsed_articles = []
+        listing = []
         reached_older_date = False
 
         target_datetime = datetime(
@@ -82,11 +83,20 @@ class NextInsight(SeleniumScraper):
             if not source_url or 'analysts say' in title.lower():
                 continue
 
-            published_at, article_text = self.fetch_article_content(source_url)
-            time.sleep(0.3)
+            if self.is_known(source_url):
+                continue
+
+            listing.append({
+                "title": title,
+                "source": source_url,
+                "thumbnail": None,
+            })
 
+        for article, (published_at, article_text) in self.fetch_details(
+            listing, lambda article: self.fetch_article_content(article["source"])
+        ):
             if not published_at:
-                LOGGER.info("[NextInsight] Failed to parse timestamp for %s. Skipping.", source_url)
+                LOGGER.info("[NextInsight] Failed to parse timestamp for %s. Skipping.", article["source"])
                 continue
 
             if published_at < target_datetime:
@@ -94,9 +104,7 @@ class NextInsight(SeleniumScraper):
                 break
 
             parsed_articles.append({
-                "title": title,
-                "source": source_url,
-                "thumbnail": None,
+                **article,
                 "timestamp": published_at.strftime("%Y-%m-%d %H:%M:%S"),
                 "article": article_text
             })
@@ -121,6 +129,10 @@ class NextInsight(SeleniumScraper):
             self.articles.extend(articles)
             LOGGER.info("[NextInsight] Offset %d: %d articles collected.", offset, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[NextInsight] Offset %d only has known articles, stopping.", offset)
+                break
+
             if reached_older_date:
                 LOGGER.info("[NextInsight] Reached articles older than %s, stopping.", date)
                 break
@@ -131,7 +143,6 @@ class NextInsight(SeleniumScraper):
                 break
 
             offset += 10
-            time.sleep(1)
 
         LOGGER.info("[NextInsight] Total scraped: %d", len(self.articles))
         return self.articles
@@ -5,7 +5,6 @@ from scraper_engine.base.scraper import Scraper
 
 import argparse 
 import logging 
-import time 
 
 
 LOGGER = logging.getLogger(__name__)
@@ -76,8 +75,10 @@ class SBRSG(Scraper):
             thumbnail_tag = article_item.select_one("img.progressivePlain-img")
             thumbnail_url = thumbnail_tag.get("src") if thumbnail_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             published_at = self.fetch_article_timestamp(source_url)
-            time.sleep(0.5)
 
             if not published_at:
                 LOGGER.info("[SBR SG] Failed to parse timestamp for %s. Skipping.", source_url)
@@ -125,6 +126,10 @@ class SBRSG(Scraper):
                 self.articles.extend(articles)
                 LOGGER.info("[SBR SG] Page %d: %d articles collected.", page_number, len(articles))
 
+                if self.reached_known_urls():
+                    LOGGER.info("[SBR SG] Page %d only has known articles, stopping.", page_number)
+                    break
+
                 if reached_older_date:
                     LOGGER.info("[SBR SG] Reached articles older than %s, stopping.", date)
                     break
@@ -133,7 +138,6 @@ class SBRSG(Scraper):
                     break
 
                 page_number += 1
-                time.sleep(1)
 
         LOGGER.info("[SBR SG] Total scraped: %d", len(self.articles))
         return self.articles
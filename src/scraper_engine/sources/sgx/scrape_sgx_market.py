@@ -18,6 +18,7 @@ LOGGER = logging.getLogger(__name__)
 
 
 class SGXMarketUpdates(SeleniumScraper):
+    uses_shared_driver = False
     SGX_TIMEZONE = ZoneInfo("Asia/Singapore")
 
     def build_sgx_market_updates_url(
@@ -120,6 +121,9 @@ class SGXMarketUpdates(SeleniumScraper):
             
             final_news_url = f"{base_url}{news_url}"
 
+            if self.is_known(final_news_url):
+                continue
+
             converted_datetime = datetime.fromtimestamp(
                 date_unix_timestamp, 
                 tz=self.SGX_TIMEZONE
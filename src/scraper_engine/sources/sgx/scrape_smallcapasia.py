@@ -5,13 +5,13 @@ from scraper_engine.base.scraper import Scraper
 
 import argparse
 import logging
-import time
 
 
 LOGGER = logging.getLogger(__name__)
 
 
 class SmallCapAsia(Scraper):
+    request_rate = 3.0
     BASE_URL = "https://www.smallcapasia.com"
     SINGAPORE_MARKET_URL = f"{BASE_URL}/market/singapore/"
     SINGAPORE_TIMEZONE = ZoneInfo("Asia/Singapore")
@@ -65,6 +65,7 @@ class SmallCapAsia(Scraper):
         target_date: str,
     ) -> tuple[list, bool]:
         parsed_articles = []
+        listing = []
         reached_older_date = False
 
         target_datetime = datetime.strptime(
@@ -97,22 +98,30 @@ class SmallCapAsia(Scraper):
                 reached_older_date = True
                 break
 
+            if self.is_known(article_url):
+                continue
+
             image_tag = article_item.select_one(
                 ".elementor-widget-theme-post-featured-image img"
             )
 
             thumbnail_url = image_tag.get("src") if image_tag else None
-            article_body = self.fetch_article_content(article_url)
 
-            parsed_articles.append({
+            listing.append({
                 "title": title,
                 "source": article_url,
                 "thumbnail": thumbnail_url,
                 "timestamp": published_at.strftime("%Y-%m-%d %H:%M:%S"),
-                "article": article_body,
             })
 
-            time.sleep(0.3)
+        # the listing already carries the dates, so only the bodies are fetched
+        for article, article_body in self.fetch_details(
+            listing, lambda article: self.fetch_article_content(article["source"])
+        ):
+            parsed_articles.append({
+                **article,
+                "article": article_body,
+            })
 
         return parsed_articles, reached_older_date
 
@@ -143,6 +152,13 @@ class SmallCapAsia(Scraper):
                 len(articles),
             )
 
+            if self.reached_known_urls():
+                LOGGER.info(
+                    "[SmallCapAsia] Page %d only has known articles, stopping.",
+                    page_number,
+                )
+                break
+
             if reached_older_date:
                 LOGGER.info(
                     "[SmallCapAsia] Reached articles older than %s, stopping.",
@@ -154,7 +170,6 @@ class SmallCapAsia(Scraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[SmallCapAsia] Total scraped: %d", len(self.articles))
 
@@ -1,13 +1,11 @@
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup
 
 from scraper_engine.base.scraper import SeleniumScraper
 from scraper_engine.config.conf import HEADERS
 
 import argparse
 import logging
-import time
 import requests 
 
 
@@ -15,7 +13,11 @@ LOGGER = logging.getLogger(__name__)
 
 
 class TheSmartInvestor(SeleniumScraper):
+    uses_shared_driver = False
+
     def fetch_article_list(self, url: str) -> list:
+        self.throttle(url)
+
         response = requests.get(
             url=url, 
             headers=HEADERS
@@ -69,9 +71,12 @@ class TheSmartInvestor(SeleniumScraper):
                 reached_older_date = True
                 break
 
+            if self.is_known(source_url):
+                continue
+
             thumbnail_url = post.get("featured_image_src") or None
 
-            content_soup = BeautifulSoup(post["content"]["rendered"], "html.parser")
+            content_soup = self.make_soup(post["content"]["rendered"])
             article_body = content_soup.get_text(separator="\n", strip=True)
             
             parsed_articles.append({
@@ -102,6 +107,10 @@ class TheSmartInvestor(SeleniumScraper):
             self.articles.extend(articles)
             LOGGER.info("[The Smart Investor] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[The Smart Investor] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[The Smart Investor] Reached articles older than %s, stopping.", date)
                 break
@@ -111,7 +120,6 @@ class TheSmartInvestor(SeleniumScraper):
 
             page_number += 1
             print(page_number)
-            time.sleep(1)
 
         LOGGER.info("[The Smart Investor] Total scraped: %d", len(self.articles))
         return self.articles
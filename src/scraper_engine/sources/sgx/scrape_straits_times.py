@@ -66,9 +66,14 @@ class StraitsTimes(Scraper):
                 reached_older_date = True
                 break
 
+            source_url = f"{self.ROOT_URL}{relative_url}"
+
+            if self.is_known(source_url):
+                continue
+
             parsed_articles.append({
                 "title": title,
-                "source": f"{self.ROOT_URL}{relative_url}",
+                "source": source_url,
                 "thumbnail": thumbnail,
                 "timestamp": article_datetime.strftime("%Y-%m-%d %H:%M:%S"),
             })
@@ -115,6 +120,10 @@ class StraitsTimes(Scraper):
 
             LOGGER.info("[ST SG] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[ST SG] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[ST SG] Reached articles older than %s, stopping.", target_date)
                 break
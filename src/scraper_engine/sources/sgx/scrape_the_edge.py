@@ -1,14 +1,12 @@
 from datetime import datetime, timezone 
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup 
-from goose3 import Goose 
 
 from scraper_engine.sources.utils.time_parser import parse_relative_time
 from scraper_engine.base.scraper import Scraper
+from scraper_engine.base.content_extractor import EXTRACTOR_POOL
 
 import argparse 
 import logging 
-import time 
 
 
 LOGGER = logging.getLogger(__name__)
@@ -20,7 +18,7 @@ class TheEdgeSingapore(Scraper):
     def fetch_article_list(self, url: str) -> list:
         raw_html_content = self.fetch_news_with_proxy(target_url=url)
 
-        soup = BeautifulSoup(raw_html_content, "html.parser")
+        soup = self.make_soup(raw_html_content)
 
         if not soup:
             LOGGER.warning("[The Edge SG] Empty soup for %s", url)
@@ -41,19 +39,18 @@ class TheEdgeSingapore(Scraper):
         if not html:
             return None, None
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.make_soup(html)
 
         time_tag = soup.select_one("time[datetime]")
         published_at = time_tag.get("datetime") if time_tag else None
 
-        goose_extractor = Goose()
-        article_data = goose_extractor.extract(raw_html=html.encode())
-        article_body = article_data.cleaned_text or None
+        article_body = EXTRACTOR_POOL.extract(html, article_url, soup)
 
         return published_at, article_body
 
     def parse_articles(self, article_items: list, target_date: str) -> tuple[list, bool]:
         parsed_articles = []
+        listing = []
         reached_older_date = False
 
         target_datetime = datetime(
@@ -81,19 +78,27 @@ class TheEdgeSingapore(Scraper):
             thumbnail_url = None
 
             if noscript_tag:
-                noscript_soup = BeautifulSoup(
-                    noscript_tag.decode_contents(), "html.parser"
-                )
+                noscript_soup = self.make_soup(noscript_tag.decode_contents())
                 img_tag = noscript_soup.find("img")
 
                 if img_tag:
                     raw_src = img_tag.get("src")
                     thumbnail_url = f"{self.BASE_URL}{raw_src}" if raw_src and raw_src.startswith("/") else raw_src
 
-            published_at, article_body = self.fetch_article_content(source_url)
+            if self.is_known(source_url):
+                continue
+
+            listing.append({
+                "title": title,
+                "source": source_url,
+                "thumbnail": thumbnail_url,
+            })
 
+        for article, (published_at, article_body) in self.fetch_details(
+            listing, lambda article: self.fetch_article_content(article["source"])
+        ):
             if not published_at:
-                LOGGER.info("[The Edge SG] Failed to parse timestamp for %s. Skipping.", source_url)
+                LOGGER.info("[The Edge SG] Failed to parse timestamp for %s. Skipping.", article["source"])
                 continue
             
             article_date = datetime.strptime(published_at[:10], "%Y-%m-%d").replace(tzinfo=ZoneInfo("Asia/Singapore"))
@@ -103,9 +108,7 @@ class TheEdgeSingapore(Scraper):
                 break
 
             parsed_articles.append({
-                "title": title,
-                "source": source_url,
-                "thumbnail": thumbnail_url,
+                **article,
                 "timestamp": datetime.fromisoformat(published_at).strftime("%Y-%m-%d %H:%M:%S"),
                 "article": article_body
             })
@@ -130,6 +133,10 @@ class TheEdgeSingapore(Scraper):
             self.articles.extend(articles)
             LOGGER.info("[The Edge SG] Page %d: %d articles collected.", page_number, len(articles))
 
+            if self.reached_known_urls():
+                LOGGER.info("[The Edge SG] Page %d only has known articles, stopping.", page_number)
+                break
+
             if reached_older_date:
                 LOGGER.info("[The Edge SG] Reached articles older than %s, stopping.", date)
                 break
@@ -138,7 +145,6 @@ class TheEdgeSingapore(Scraper):
                 break
 
             page_number += 1
-            time.sleep(1)
 
         LOGGER.info("[The Edge SG] Total scraped: %d", len(self.articles))
         return self.articles
@@ -1,19 +1,19 @@
 from datetime import datetime
 from urllib.parse import urljoin
 from zoneinfo import ZoneInfo
-from goose3 import Goose
 
 from scraper_engine.base.scraper import SeleniumScraper
+from scraper_engine.base.content_extractor import EXTRACTOR_POOL
 
 import argparse
 import logging
-import time
 
 
 LOGGER = logging.getLogger(__name__)
 
 
 class TheEdgeReits(SeleniumScraper):
+    request_rate = 3.0
     BASE_URL = "https://www.theedgesingapore.com"
     SECTION_URL = f"{BASE_URL}/edgecollective/REITs-Report"
 
@@ -21,7 +21,6 @@ class TheEdgeReits(SeleniumScraper):
         soup = self.fetch_news_with_selenium(
             url,
             wait_selector="article a[href]",
-            time_sleep=2,
         )
 
         if not soup:
@@ -42,7 +41,6 @@ class TheEdgeReits(SeleniumScraper):
         soup = self.fetch_news_with_selenium(
             article_url,
             wait_selector="time[datetime]",
-            time_sleep=2,
         )
 
         if not soup:
@@ -52,8 +50,7 @@ class TheEdgeReits(SeleniumScraper):
         raw_timestamp = time_tag.get("datetime") if time_tag else None
         published_at = self.parse_timestamp(raw_timestamp)
 
-        article_data = Goose().extract(raw_html=str(soup).encode())
-        article_body = article_data.cleaned_text or None
+        article_body = EXTRACTOR_POOL.extract(None, article_url, soup)
 
         return published_at, article_body
 
@@ -101,8 +98,10 @@ class TheEdgeReits(SeleniumScraper):
             image_tag = article_item.select_one("img[src]")
             thumbnail_url = image_tag.get("src") if image_tag else None
 
+            if self.is_known(source_url):
+                continue
+
             published_at, article_body = self.fetch_article_content(source_url)
-            time.sleep(0.3)
 
             if not published_at:
                 LOGGER.info(
@@ -0,0 +1,165 @@
+from langchain_core.callbacks import BaseCallbackHandler
+from pathlib import Path
+from threading import Lock
+
+from scraper_engine.preprocessing.classifier import NewsClassifier
+from scraper_engine.base.article_sink import iter_jsonl
+from scraper_engine.database.client import SUPABASE_CLIENT
+
+import argparse
+import logging
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+MODES = ["sequential", "parallel", "combined"]
+DIMENSIONS = [
+    "valuation", "future", "technical", "financials",
+    "dividend", "management", "ownership", "sustainability",
+]
+
+
+class TokenCounter(BaseCallbackHandler):
+    def __init__(self):
+        self.calls = 0
+        self.tokens = 0
+        self._lock = Lock()
+
+    def on_llm_end(self, response, **kwargs):
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        tokens = token_usage.get("total_tokens")
+
+        if not tokens and response.generations:
+            message = getattr(response.generations[0][0], "message", None)
+            tokens = (getattr(message, "usage_metadata", None) or {}).get("total_tokens")
+
+        with self._lock:
+            self.calls += 1
+            self.tokens += tokens or 0
+
+
+def load_articles(input_path: Path | None, table_name: str, limit: int) -> list[dict]:
+    """
+    Articles to classify: title + summary body, either from a JSONL file or
+    the most recent rows already stored in the news table.
+    """
+    if input_path:
+        articles = [
+            {"title": article.get("title"), "body": article.get("body") or article.get("article")}
+            for article in iter_jsonl(input_path)
+        ]
+
+    else:
+        articles = (
+            SUPABASE_CLIENT
+            .table(table_name)
+            .select("title, body")
+            .order("created_at", desc=True)
+            .limit(limit)
+            .execute()
+            .data
+        )
+
+    return [article for article in articles if article.get("title") and article.get("body")][:limit]
+
+
+def run_mode(mode: str, articles: list[dict], source_scraper: str) -> dict:
+    classifier = NewsClassifier(mode=mode)
+    counter = TokenCounter()
+    classifier.callbacks = [counter]
+
+    outputs = []
+    latencies = []
+
+    for article in articles:
+        started_at = time.perf_counter()
+        outputs.append(classifier.classify_article(article["title"], article["body"], source_scraper))
+        latencies.append(time.perf_counter() - started_at)
+
+    return {
+        "outputs": outputs,
+        "latency": sum(latencies) / len(latencies),
+        "tokens": counter.tokens / len(articles),
+        "calls": counter.calls / len(articles),
+    }
+
+
+def agreement(outputs: list, baseline: list) -> tuple[float, float, float]:
+    """
+    (mean tag Jaccard, sentiment match rate, dimension field match rate)
+    against the baseline outputs, over articles both runs classified.
+    """
+    tag_scores, sentiment_matches, dimension_matches = [], [], []
+
+    for output, expected in zip(outputs, baseline):
+        if not output or not expected:
+            continue
+
+        tags, sentiment, dimension = output
+        expected_tags, expected_sentiment, expected_dimension = expected
+
+        union = set(tags) | set(expected_tags)
+        tag_scores.append(len(set(tags) & set(expected_tags)) / len(union) if union else 1.0)
+        sentiment_matches.append(sentiment == expected_sentiment)
+        dimension_matches.extend(
+            (dimension or {}).get(field) == (expected_dimension or {}).get(field)
+            for field in DIMENSIONS
+        )
+
+    def mean(values: list) -> float:
+        return sum(values) / len(values) if values else 0.0
+
+    return mean(tag_scores), mean(sentiment_matches), mean(dimension_matches)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    parser = argparse.ArgumentParser(description="Compare NewsClassifier modes on latency, tokens and agreement")
+    parser.add_argument("--input", type=Path, help="JSONL of articles with title and body (default: recent rows of --table-name)")
+    parser.add_argument("--table-name", type=str, default="idx_news", help="Table to sample articles from")
+    parser.add_argument("--source-scraper", type=str, default="idx", help="Market for the sentiment prompt (idx or sgx)")
+    parser.add_argument("--limit", type=int, default=10, help="Number of articles")
+    parser.add_argument("--modes", nargs="*", default=MODES, choices=MODES, help="Modes to compare")
+    parser.add_argument("--noise", action="store_true", help="Run sequential twice to measure run-to-run disagreement")
+
+    args = parser.parse_args()
+
+    articles = load_articles(args.input, args.table_name, args.limit)
+
+    if not articles:
+        print("No articles with a title and body to classify.")
+        return
+
+    # the current behaviour is the reference for agreement
+    modes = ["sequential", *[mode for mode in args.modes if mode != "sequential"]]
+    results = {mode: run_mode(mode, articles, args.source_scraper) for mode in modes}
+    baseline = results["sequential"]["outputs"]
+
+    # LLM outputs vary between identical runs; this row is the floor the
+    # other modes' agreement should be read against
+    if args.noise:
+        results["rerun"] = run_mode("sequential", articles, args.source_scraper)
+
+    header = f"{'mode':<12}{'latency':>10}{'tokens':>10}{'calls':>8}{'tags':>8}{'sentiment':>11}{'dimension':>11}"
+    print(f"{len(articles)} articles")
+    print(header)
+    print("-" * len(header))
+
+    for mode, result in results.items():
+        tags, sentiment, dimension = agreement(result["outputs"], baseline)
+        print(
+            f"{mode:<12}{result['latency']:>9.1f}s{result['tokens']:>10.0f}{result['calls']:>8.1f}"
+            f"{tags:>8.2f}{sentiment:>11.2f}{dimension:>11.2f}"
+        )
+
+    print("latency/tokens/calls are per article; agreement is against the sequential run")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# uv run -m scripts.classification_benchmark --limit 10
+# uv run -m scripts.classification_benchmark --table-name sgx_news --source-scraper sgx --modes combined
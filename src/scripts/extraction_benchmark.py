@@ -0,0 +1,132 @@
+from goose3 import Goose
+from pathlib import Path
+from rapidfuzz import fuzz
+
+from scraper_engine.base.html_cache import HTML_CACHE
+from scraper_engine.base.tier_router import domain_of
+from scraper_engine.base.content_extractor import ExtractorPool, extract_main_content
+
+import argparse
+import json
+import logging
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PIPELINES = [Path("data/idx/pipeline.jsonl"), Path("data/sgx/pipeline_sgx.jsonl")]
+
+
+def recorded_pages(pipelines: list[Path], max_age_days: int, limit: int) -> list[tuple[str, bytes]]:
+    """
+    Article pages of the pipeline files that are still in the HTML cache
+    (written by the article fetcher and by the scrapers during ingestion).
+    """
+    pages = []
+
+    for pipeline in pipelines:
+        if not pipeline.exists():
+            continue
+
+        with pipeline.open("r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                url = json.loads(line).get("source")
+                content = HTML_CACHE.get(url, max_age_days * 24 * 60 * 60, "benchmark")
+
+                if content:
+                    pages.append((url, content))
+
+                if len(pages) >= limit:
+                    return pages
+
+    return pages
+
+
+def time_extractor(extract, pages: list[tuple[str, bytes]], repeat: int) -> tuple[float, list[str]]:
+    outputs = []
+    started_at = time.perf_counter()
+
+    for _ in range(repeat):
+        outputs = [extract(content, url) or "" for url, content in pages]
+
+    return (time.perf_counter() - started_at) / repeat, outputs
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    parser = argparse.ArgumentParser(description="Article-body extraction throughput and text quality on cached pages")
+    parser.add_argument("--pipelines", type=Path, nargs="*", default=DEFAULT_PIPELINES, help="Pipeline files whose article URLs are looked up")
+    parser.add_argument("--max-age", type=int, default=30, help="Oldest cached page to use, in days")
+    parser.add_argument("--limit", type=int, default=200, help="Maximum pages")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per extractor")
+
+    args = parser.parse_args()
+
+    pages = recorded_pages(args.pipelines, args.max_age, args.limit)
+
+    if not pages:
+        print(f"No pipeline articles found in the HTML cache ({HTML_CACHE.directory}); run the processing stage first.")
+        return
+
+    def goose_per_call(content: bytes, url: str) -> str | None:
+        return Goose().extract(raw_html=content).cleaned_text
+
+    pooled = ExtractorPool(fast_path=False)
+    fast = ExtractorPool(fast_path=True, generic=False)
+    fast_generic = ExtractorPool(fast_path=True, generic=True)
+
+    extractors = {
+        "goose per call": goose_per_call,
+        "goose pooled": pooled.extract,
+        "fast path": fast.extract,
+        "fast + generic": fast_generic.extract,
+    }
+
+    results = {
+        name: time_extractor(extract, pages, args.repeat)
+        for name, extract in extractors.items()
+    }
+
+    _, reference = results["goose per call"]
+    baseline = results["goose per call"][0]
+
+    print(f"{len(pages)} cached article pages, {args.repeat} passes")
+    print(f"{'extractor':<16}{'ms/page':>10}{'speedup':>9}{'similarity':>12}{'chars':>9}")
+
+    for name, (seconds, outputs) in results.items():
+        similarity = sum(
+            fuzz.ratio(output, expected) for output, expected in zip(outputs, reference)
+        ) / len(pages)
+        characters = sum(len(output) for output in outputs) / len(pages)
+
+        print(
+            f"{name:<16}{seconds / len(pages) * 1000:>10.2f}{baseline / seconds:>8.1f}x"
+            f"{similarity:>11.1f}%{characters:>9.0f}"
+        )
+
+    # per-domain view of the pages the fast path answered without Goose, with
+    # the known containers only and with generic article markup as well
+    for label, generic in (("fast path", False), ("fast + generic", True)):
+        domains: dict[str, list[float]] = {}
+
+        for (url, content), expected in zip(pages, reference):
+            if fast_text := extract_main_content(content, url, generic=generic):
+                domains.setdefault(domain_of(url), []).append(fuzz.ratio(fast_text, expected))
+
+        fast_pages = sum(len(scores) for scores in domains.values())
+        print(f"\n{label} used on {fast_pages}/{len(pages)} pages")
+
+        for domain, scores in sorted(domains.items(), key=lambda item: -len(item[1])):
+            print(f"{domain:<36}{len(scores):>5} pages{sum(scores) / len(scores):>8.1f}% similar to Goose")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# uv run -m scripts.extraction_benchmark
+# uv run -m scripts.extraction_benchmark --pipelines data/sgx/pipeline_sgx.jsonl --limit 50 --repeat 5
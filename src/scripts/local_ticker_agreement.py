@@ -0,0 +1,139 @@
+from pathlib import Path
+
+from scraper_engine.base.body_store import BODY_STORE
+from scraper_engine.preprocessing.article_builder import matching_company_name
+from scraper_engine.preprocessing.company_extractor import extract_company_name
+from scraper_engine.preprocessing.company_gazetteer import local_tickers
+from scraper_engine.preprocessing.summarizer import summarize_news
+
+import argparse
+import json
+import logging
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PIPELINES = {
+    "idx": [Path("data/idx/pipeline.jsonl")],
+    "sgx": [Path("data/sgx/pipeline_sgx.jsonl")],
+}
+
+
+def stored_articles(pipelines: list[Path], limit: int) -> list[tuple[dict, str]]:
+    """
+    Pipeline records with an article body, either carried by the record or
+    kept in the body store by an earlier processing run.
+    """
+    articles = []
+
+    for pipeline in pipelines:
+        if not pipeline.exists():
+            continue
+
+        with pipeline.open("r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                record = json.loads(line)
+                body = record.get("article")
+
+                if not body and (stored := BODY_STORE.get(record.get("source"))):
+                    body = stored[0]
+
+                if body:
+                    articles.append((record, body))
+
+                if len(articles) >= limit:
+                    return articles
+
+    return articles
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    parser = argparse.ArgumentParser(
+        description="Agreement of locally linked tickers with LLM extraction on stored article bodies"
+    )
+    parser.add_argument("--source-scraper", type=str, default="idx", choices=["idx", "sgx"], help="Market")
+    parser.add_argument("--pipelines", type=Path, nargs="*", help="Pipeline files whose articles are checked")
+    parser.add_argument("--limit", type=int, default=200, help="Maximum articles")
+    parser.add_argument(
+        "--local-only",
+        action="store_true",
+        help="List the tickers linked locally on the article bodies, without LLM calls, for a manual check",
+    )
+
+    args = parser.parse_args()
+
+    pipelines = args.pipelines or DEFAULT_PIPELINES[args.source_scraper]
+    articles = stored_articles(pipelines, args.limit)
+
+    if not articles:
+        print("No stored article bodies found; run the processing stage first.")
+        return
+
+    if args.local_only:
+        linked = 0
+
+        for record, body in articles:
+            local = local_tickers(body, args.source_scraper)
+
+            if local is not None:
+                linked += 1
+                print(f"{record.get('title')}\n  {local}")
+
+        print(f"\n{len(articles)} stored articles ({args.source_scraper}), {linked} linked locally")
+        return
+
+    linked = agreed = 0
+    disagreements = []
+
+    for record, body in articles:
+        url = record.get("source")
+
+        # tickers are linked on the summary, like in post_processing; LLM
+        # outputs already accepted in a run come from the LLM cache
+        summary = summarize_news(
+            url=url,
+            news_text=body,
+            title=record.get("title"),
+            source_scraper=args.source_scraper,
+        )
+
+        if not summary or not summary[1]:
+            continue
+
+        local = local_tickers(summary[1], args.source_scraper)
+
+        if local is None:
+            continue
+
+        company_extracted = extract_company_name(summary[1], args.source_scraper) or []
+        llm = matching_company_name(company_extracted, source_scraper=args.source_scraper)
+
+        linked += 1
+
+        if set(local) == set(llm):
+            agreed += 1
+
+        else:
+            disagreements.append((url, sorted(set(local) - set(llm)), sorted(set(llm) - set(local))))
+
+    print(f"{len(articles)} stored articles ({args.source_scraper}), {linked} linked locally")
+
+    if linked:
+        print(f"agree with LLM extraction: {agreed}/{linked} ({agreed / linked:.0%})")
+
+    for url, local_only, llm_only in disagreements:
+        print(f"\n{url}\n  local only: {local_only}\n  LLM only:   {llm_only}")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# uv run -m scripts.local_ticker_agreement
+# uv run -m scripts.local_ticker_agreement --source-scraper sgx --limit 50
+# uv run -m scripts.local_ticker_agreement --local-only
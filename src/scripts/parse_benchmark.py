@@ -0,0 +1,214 @@
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from scraper_engine.base.scraper import Scraper, SeleniumScraper
+from scraper_engine.base.html_parser import make_soup, resolve_backend
+from scraper_engine.sources.idx import registry as idx_registry
+from scraper_engine.sources.sgx import registry as sgx_registry
+
+import argparse
+import inspect
+import logging
+import time
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+except ImportError:
+    LexborHTMLParser = None
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PAGES_DIR = Path(".cache/parse_benchmark")
+BS4_BACKENDS = ["html.parser", "lxml"]
+
+
+def registered_sources() -> list[type[Scraper]]:
+    sources = []
+
+    for registry in (idx_registry, sgx_registry):
+        for _, member in inspect.getmembers(registry, inspect.isclass):
+            if issubclass(member, Scraper) and member not in (Scraper, SeleniumScraper):
+                sources.append(member)
+
+    return sources
+
+
+def record_pages(pages_dir: Path, date: str, sources: list[str] | None) -> None:
+    """
+    Runs every source for one listing page and saves each document it parses
+    (listing and detail pages) under pages_dir/<Source>/.
+    """
+    original_make_soup = Scraper.make_soup
+
+    for source in registered_sources():
+        if sources and source.__name__ not in sources:
+            continue
+
+        source_dir = pages_dir / source.__name__
+        source_dir.mkdir(parents=True, exist_ok=True)
+        page_count = 0
+
+        def recording_make_soup(scraper, markup):
+            nonlocal page_count
+
+            if markup:
+                page_count += 1
+                content = markup if isinstance(markup, bytes) else markup.encode("utf-8")
+                (source_dir / f"{page_count:03d}.html").write_bytes(content)
+
+            return original_make_soup(scraper, markup)
+
+        scraper = source()
+
+        try:
+            with mock.patch.object(Scraper, "make_soup", recording_make_soup):
+                params = inspect.signature(scraper.extract_news_pages).parameters
+
+                if "date" in params or "target_date" in params:
+                    scraper.extract_news_pages(1, date)
+
+                else:
+                    scraper.extract_news_pages(1)
+
+        except Exception as error:
+            LOGGER.error(f"[{source.__name__}] Recording failed: {error}")
+
+        finally:
+            if isinstance(scraper, SeleniumScraper):
+                scraper.release_driver()
+
+        LOGGER.info(f"[{source.__name__}] Recorded {page_count} pages")
+
+    SeleniumScraper.close_shared_driver()
+
+
+def page_output(soup) -> tuple:
+    """
+    What a source reads off a page: its links with their anchor text, and its
+    text. Equal outputs mean a source can switch backends safely.
+    """
+    return (
+        [(link.get("href"), link.get_text(" ", strip=True)) for link in soup.select("a[href]")],
+        soup.get_text(" ", strip=True),
+    )
+
+
+def time_backend(pages: list[bytes], backend: str, repeat: int) -> tuple[float, list]:
+    """
+    Returns (seconds per pass over all pages, output per page) for one
+    backend. selectolax only reports its link count.
+    """
+    outputs = []
+    started_at = time.perf_counter()
+
+    for _ in range(repeat):
+        outputs = []
+
+        for page in pages:
+            if backend == "selectolax":
+                outputs.append(len(LexborHTMLParser(page).css("a[href]")))
+
+            else:
+                outputs.append(page_output(make_soup(page, backend)))
+
+    return (time.perf_counter() - started_at) / repeat, outputs
+
+
+def run_benchmark(pages_dir: Path, repeat: int) -> None:
+    backends = [
+        backend
+        for backend in BS4_BACKENDS
+        if resolve_backend(backend) == backend
+    ]
+
+    if LexborHTMLParser is not None:
+        backends.append("selectolax")
+
+    source_dirs = sorted(
+        path for path in pages_dir.glob("*") if path.is_dir()
+    )
+
+    if not source_dirs:
+        print(f"No recorded pages in {pages_dir}; run with --record first.")
+        return
+
+    header = f"{'source':<22}{'pages':>6}" + "".join(f"{backend:>16}" for backend in backends)
+    print(header)
+    print("-" * len(header))
+
+    totals = dict.fromkeys(backends, 0.0)
+    identical_sources = []
+
+    for source_dir in source_dirs:
+        pages = [path.read_bytes() for path in sorted(source_dir.glob("*.html"))]
+
+        if not pages:
+            continue
+
+        row = f"{source_dir.name:<22}{len(pages):>6}"
+        outputs = {}
+
+        for backend in backends:
+            seconds, outputs[backend] = time_backend(pages, backend, repeat)
+            totals[backend] += seconds
+            row += f"{seconds * 1000:>13.1f} ms"
+
+        # lxml repairs broken markup differently; only a source whose pages
+        # read the same under both may set parser_backend = "lxml"
+        if "lxml" in outputs and "html.parser" in outputs:
+            if outputs["lxml"] == outputs["html.parser"]:
+                identical_sources.append(source_dir.name)
+                row += "  (identical)"
+
+            else:
+                differing = sum(
+                    lxml_output != default_output
+                    for lxml_output, default_output in zip(outputs["lxml"], outputs["html.parser"])
+                )
+                row += f"  ({differing} pages differ)"
+
+        print(row)
+
+    print("-" * len(header))
+    print(
+        f"{'total':<28}"
+        + "".join(f"{totals[backend] * 1000:>13.1f} ms" for backend in backends)
+    )
+
+    baseline = totals.get("html.parser")
+
+    if baseline:
+        for backend in backends[1:]:
+            print(f"{backend}: {baseline / totals[backend]:.1f}x faster than html.parser")
+
+    if identical_sources:
+        print(f"Same output under lxml (can set parser_backend = \"lxml\"): {', '.join(identical_sources)}")
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on recorded source pages")
+    parser.add_argument("--pages-dir", type=Path, default=DEFAULT_PAGES_DIR, help="Directory of recorded pages")
+    parser.add_argument("--record", action="store_true", help="Record one listing page (and its detail pages) per source first")
+    parser.add_argument("--date", type=str, default=datetime.now().strftime("%Y%m%d"), help="Date passed to the sources when recording")
+    parser.add_argument("--sources", nargs="*", help="Only record these source classes")
+    parser.add_argument("--repeat", type=int, default=5, help="Parse passes per backend")
+
+    args = parser.parse_args()
+
+    if args.record:
+        record_pages(args.pages_dir, args.date, args.sources)
+
+    run_benchmark(args.pages_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
+
+
+# uv run -m scripts.parse_benchmark --record
+# uv run -m scripts.parse_benchmark --repeat 10
@@ -0,0 +1,151 @@
+from rapidfuzz import fuzz, process
+
+from scraper_engine.database.metadata import (
+    build_ticker_index,
+    build_sgx_ticker_index,
+    load_company_data_idx,
+    load_company_data_sgx,
+)
+from scraper_engine.preprocessing.ticker_matcher import get_ticker_matcher
+from scraper_engine.preprocessing.utils.article_helpers import (
+    is_raw_ticker,
+    normalize_idx_company_name,
+    normalize_sgx_company_name,
+)
+
+import argparse
+import contextlib
+import io
+import logging
+import random
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def legacy_match(company_extracted: list[str], source_scraper: str) -> list[str]:
+    """
+    matching_company_name as it was before the compiled matcher: the ticker
+    index is rebuilt and every name is scored with its own extractOne call.
+    """
+    seen = set()
+    matched = []
+
+    ticker_index = (
+        build_sgx_ticker_index()
+        if source_scraper == 'sgx'
+        else build_ticker_index()
+    )
+    min_key_length = 5 if source_scraper == 'idx' else 2
+    normalized_funct = normalize_sgx_company_name if source_scraper == 'sgx' else normalize_idx_company_name
+
+    name_candidates = {
+        key: value
+        for key, value in ticker_index.items()
+        if len(key) >= min_key_length
+    }
+
+    ticker_candidates = {
+        value.lower().replace('.jk', '').strip(): value
+        for value in ticker_index.values()
+    }
+
+    for company in company_extracted:
+        if is_raw_ticker(company):
+            query, scorer, cutoff, candidates = company.lower().strip(), fuzz.ratio, 95, ticker_candidates
+
+        else:
+            query = normalized_funct(company)
+            scorer, cutoff = (fuzz.ratio, 90) if len(query) < 6 else (fuzz.token_set_ratio, 85)
+            candidates = name_candidates
+
+        result = process.extractOne(query, candidates.keys(), scorer=scorer, score_cutoff=cutoff)
+
+        if result and candidates[result[0]] not in seen:
+            seen.add(candidates[result[0]])
+            matched.append(candidates[result[0]])
+
+    return matched
+
+
+def sample_articles(source_scraper: str, articles: int, names_per_article: int, seed: int) -> list[list[str]]:
+    """
+    Extraction outputs shaped like the LLM's: a mix of full legal names,
+    names without the legal form, raw tickers and unlisted companies.
+    """
+    rng = random.Random(seed)
+    companies = list((load_company_data_sgx() if source_scraper == 'sgx' else load_company_data_idx()).values())
+    unlisted = ["Bank Indonesia", "Temasek", "BlackRock", "Danantara", "MSCI"]
+
+    def one_name() -> str:
+        company = rng.choice(companies)
+        variant = rng.random()
+
+        if variant < 0.4:
+            return company["name"]
+
+        if variant < 0.7:
+            return normalize_sgx_company_name(company["name"]) if source_scraper == 'sgx' else normalize_idx_company_name(company["name"]).title()
+
+        if variant < 0.9:
+            return company["symbol"].replace(".JK", "")
+
+        return rng.choice(unlisted)
+
+    return [[one_name() for _ in range(names_per_article)] for _ in range(articles)]
+
+
+def time_per_article(match, articles: list[list[str]], source_scraper: str) -> tuple[float, list[list[str]]]:
+    outputs = []
+
+    # build_ticker_index prints a warning per short name on every rebuild
+    with contextlib.redirect_stdout(io.StringIO()):
+        started_at = time.perf_counter()
+
+        for company_extracted in articles:
+            outputs.append(match(company_extracted, source_scraper))
+
+        elapsed = time.perf_counter() - started_at
+
+    return elapsed / len(articles), outputs
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    parser = argparse.ArgumentParser(description="Per-article cost of ticker matching, legacy vs compiled matcher")
+    parser.add_argument("--source-scraper", type=str, default="idx", choices=["idx", "sgx"], help="Market")
+    parser.add_argument("--articles", type=int, default=200, help="Simulated articles")
+    parser.add_argument("--names", type=int, default=4, help="Extracted names per article")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed")
+
+    args = parser.parse_args()
+
+    articles = sample_articles(args.source_scraper, args.articles, args.names, args.seed)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        started_at = time.perf_counter()
+        get_ticker_matcher(args.source_scraper)
+        build_seconds = time.perf_counter() - started_at
+
+    def compiled_match(company_extracted: list[str], source_scraper: str) -> list[str]:
+        return get_ticker_matcher(source_scraper).match(company_extracted)
+
+    legacy_seconds, legacy_outputs = time_per_article(legacy_match, articles, args.source_scraper)
+    compiled_seconds, compiled_outputs = time_per_article(compiled_match, articles, args.source_scraper)
+
+    differing = sum(legacy != compiled for legacy, compiled in zip(legacy_outputs, compiled_outputs))
+
+    print(f"{args.articles} articles x {args.names} names ({args.source_scraper})")
+    print(f"{'legacy':<10}{legacy_seconds * 1000:>10.2f} ms/article")
+    print(f"{'compiled':<10}{compiled_seconds * 1000:>10.2f} ms/article  (one-off build {build_seconds * 1000:.1f} ms)")
+    print(f"speedup: {legacy_seconds / compiled_seconds:.1f}x, articles with different tickers: {differing}")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# uv run -m scripts.ticker_match_benchmark
+# uv run -m scripts.ticker_match_benchmark --source-scraper sgx --articles 500
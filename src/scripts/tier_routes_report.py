@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from scraper_engine.base.tier_router import TIER_ROUTER
+
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the learned extraction-tier routes per domain")
+    parser.add_argument("--domain", type=str, help="Only show domains containing this text")
+    parser.add_argument("--output", type=Path, help="Also export the table (.csv or .json)")
+
+    args = parser.parse_args()
+
+    rows = [
+        row
+        for row in TIER_ROUTER.summary()
+        if not args.domain or args.domain in row["domain"]
+    ]
+
+    if not rows:
+        print(f"No tier routes recorded in {TIER_ROUTER.path}")
+        return
+
+    header = f"{'domain':<32}{'tier':<14}{'tries':>6}{'success':>9}{'latency':>10}  last success"
+    print(header)
+    print("-" * len(header))
+
+    for row in rows:
+        marker = "*" if row["preferred"] else " "
+        print(
+            f"{row['domain']:<32}{marker}{row['tier']:<13}{row['attempts']:>6}"
+            f"{row['success_rate']:>9.0%}{row['mean_latency']:>9.1f}s  {row['last_success'] or '-'}"
+        )
+
+    print("* tier tried first for the domain")
+
+    if args.output:
+        count = TIER_ROUTER.export(args.output)
+        print(f"Exported {count} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# uv run -m scripts.tier_routes_report
+# uv run -m scripts.tier_routes_report --domain kontan --output tier_routes.csv